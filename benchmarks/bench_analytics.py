@@ -0,0 +1,78 @@
+"""
+Compares grouping revenue with a loop over the orders against `RevenueAnalytics`.
+
+Run from the repository root:
+
+    python benchmarks/bench_analytics.py
+"""
+
+import collections
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sellix.core import analytics  # noqa: E402
+from sellix.core.analytics import GROUPS, AnalyticsRow, RevenueAnalytics  # noqa: E402
+
+import msgspec  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+ORDERS = 200_000
+
+
+def _orders(size: int) -> list:
+    with open(os.path.join(EXAMPLES, "order.json"), "rb") as file:
+        order = msgspec.json.decode(file.read())["data"]["order"]
+
+    rows = []
+    random.seed(0)
+    for index in range(size):
+        rows.append(
+            {
+                **order,
+                "gateway": random.choice(["BITCOIN", "LITECOIN", "PAYPAL", "STRIPE"]),
+                "product_id": f"product-{random.randrange(500)}",
+                "total": random.random() * 100,
+                "created_at": 1_700_000_000 + index * 60,
+            }
+        )
+    return msgspec.json.decode(msgspec.json.encode(rows), type=list[AnalyticsRow], strict=False)
+
+
+def naive(orders: list, group: str) -> dict:
+    attribute = {"gateway": "gateway", "currency": "currency", "product": "product_id"}
+    totals: dict = collections.defaultdict(lambda: [0, 0.0, 0.0])
+    for order in orders:
+        rate = analytics._usd_rate(order)
+        key = order.created_at // 86400 if group == "day" else getattr(order, attribute[group])
+        entry = totals[key]
+        entry[0] += 1
+        entry[1] += (order.total or 0.0) * rate
+        entry[2] += analytics._fees(order) * rate
+    return totals
+
+
+def timed(callable: object) -> float:
+    start = time.perf_counter()
+    callable()  # type: ignore
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    orders = _orders(ORDERS)
+    print(f"{ORDERS} orders")
+
+    revenue = RevenueAnalytics()
+    print(f"{'RevenueAnalytics.extend':<28} {timed(lambda: revenue.extend(orders)):9.1f} ms (once)")
+    revenue.total()  # Imports NumPy, if installed.
+    for group in GROUPS:
+        loop = timed(lambda: naive(orders, group))
+        grouped = timed(lambda: revenue.by(group))
+        print(f"{'by ' + group:<28} loop {loop:9.1f} ms   columns {grouped:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
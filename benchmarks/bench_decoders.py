@@ -0,0 +1,64 @@
+"""
+Compares `msgspec.json.decode(..., type=...)` with the shared decoders of `sellix.core.decoders`.
+
+Run from the repository root:
+
+    python benchmarks/bench_decoders.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sellix.abc.interaction import ShopInteraction, OrderInteraction, ListInteraction  # noqa: E402
+from sellix.abc.modals import Order  # noqa: E402
+from sellix.core.decoders import get_decoder  # noqa: E402
+
+import msgspec  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+def _read(name: str) -> bytes:
+    with open(os.path.join(EXAMPLES, name), "rb") as file:
+        return file.read()
+
+
+def _order_page(order: bytes, size: int) -> bytes:
+    payload = msgspec.json.decode(order)
+    return msgspec.json.encode(
+        {"status": 200, "data": {"orders": [payload["data"]["order"]] * size}}
+    )
+
+
+def bench(label: str, body: bytes, response_type: object, number: int) -> None:
+    decoder = get_decoder(response_type)  # type: ignore
+    per_call = min(
+        timeit.repeat(
+            lambda: msgspec.json.decode(body, type=response_type, strict=False),
+            number=number,
+            repeat=5,
+        )
+    )
+    shared = min(timeit.repeat(lambda: decoder.decode(body), number=number, repeat=5))
+    print(
+        f"{label:<32} decode(type=...) {per_call / number * 1e6:8.2f} us"
+        f"   Decoder {shared / number * 1e6:8.2f} us"
+        f"   saved {(per_call - shared) / number * 1e6:7.2f} us/call"
+    )
+
+
+def main() -> None:
+    shop = _read("self.json")
+    order = _read("order.json")
+
+    bench("self.json -> ShopInteraction", shop, ShopInteraction, 20_000)
+    bench("order.json -> OrderInteraction", order, OrderInteraction, 5_000)
+    bench("1 order page", _order_page(order, 1), ListInteraction[Order], 5_000)
+    bench("50 order page", _order_page(order, 50), ListInteraction[Order], 200)
+
+
+if __name__ == "__main__":
+    main()
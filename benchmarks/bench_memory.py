@@ -0,0 +1,72 @@
+"""
+Measures the memory held by decoded orders, and their encoded size, per order type.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py
+"""
+
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sellix.abc.interaction import ListInteraction  # noqa: E402
+from sellix.abc.modals import CompactOrder, Order, OrderSummary  # noqa: E402
+from sellix.abc.projection import compact, to_compact  # noqa: E402
+from sellix.core.decoders import get_decoder  # noqa: E402
+
+import msgspec  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+ORDERS = 10_000
+
+
+def _order_page(size: int) -> bytes:
+    with open(os.path.join(EXAMPLES, "order.json"), "rb") as file:
+        order = msgspec.json.decode(file.read())["data"]["order"]
+
+    orders = []
+    for index in range(size):
+        # Distinct strings per order, as a real page would have.
+        orders.append({**order, "uniqid": f"{order['uniqid']}-{index}", "id": index})
+    return msgspec.json.encode({"status": 200, "data": {"orders": orders}})
+
+
+def bench(label: str, body: bytes, item_type: type) -> None:
+    decoder = get_decoder(ListInteraction[item_type])  # type: ignore
+
+    gc.collect()
+    tracemalloc.start()
+    orders = decoder.decode(body).data["orders"]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elapsed = min(timeit.repeat(lambda: decoder.decode(body), number=1, repeat=5))
+    collect = min(timeit.repeat(gc.collect, number=1, repeat=5))
+    encoded = len(msgspec.msgpack.encode(orders))
+    print(
+        f"{label:<28} {held / len(orders):8.0f} B/order   {encoded / len(orders):6.0f} B/order"
+        f" msgpack   decode {elapsed * 1e3:7.2f} ms   gc.collect {collect * 1e3:6.2f} ms"
+    )
+    del orders
+
+
+def main() -> None:
+    body = _order_page(ORDERS)
+    print(f"{ORDERS} orders, {len(body) / ORDERS:.0f} B/order as JSON")
+    bench("Order", body, Order)
+    bench("compact(Order, False)", body, compact(Order, array_like=False))
+    bench("OrderSummary", body, OrderSummary)
+
+    orders = get_decoder(ListInteraction[Order]).decode(body).data["orders"]
+    stored = msgspec.msgpack.encode([to_compact(order) for order in orders])
+    assert type(msgspec.msgpack.decode(stored, type=list[CompactOrder])[0]) is CompactOrder
+    print(f"{'CompactOrder on disk':<28} {len(stored) / ORDERS:8.0f} B/order msgpack")
+
+
+if __name__ == "__main__":
+    main()
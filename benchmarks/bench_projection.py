@@ -0,0 +1,52 @@
+"""
+Compares decoding order pages into `Order` with decoding them into projections.
+
+Run from the repository root:
+
+    python benchmarks/bench_projection.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sellix.abc.interaction import ListInteraction  # noqa: E402
+from sellix.abc.modals import Order, OrderSummary  # noqa: E402
+from sellix.abc.projection import project  # noqa: E402
+from sellix.core.decoders import get_decoder  # noqa: E402
+
+import msgspec  # noqa: E402
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+
+def _order_page(size: int) -> bytes:
+    with open(os.path.join(EXAMPLES, "order.json"), "rb") as file:
+        payload = msgspec.json.decode(file.read())
+    return msgspec.json.encode(
+        {"status": 200, "data": {"orders": [payload["data"]["order"]] * size}}
+    )
+
+
+def bench(label: str, body: bytes, item_type: type, number: int, baseline: float) -> float:
+    decoder = get_decoder(ListInteraction[item_type])  # type: ignore
+    elapsed = min(timeit.repeat(lambda: decoder.decode(body), number=number, repeat=5))
+    per_call = elapsed / number * 1e6
+    print(f"{label:<32} {per_call:10.2f} us   x{(baseline or per_call) / per_call:5.2f}")
+    return per_call
+
+
+def main() -> None:
+    body = _order_page(100)
+    totals = project(Order, ["uniqid", "total", "currency", "created_at"])
+
+    print("100 order page")
+    baseline = bench("Order", body, Order, 200, 0.0)
+    bench("OrderSummary", body, OrderSummary, 200, baseline)
+    bench("project(uniqid, total, ...)", body, totals, 200, baseline)
+
+
+if __name__ == "__main__":
+    main()
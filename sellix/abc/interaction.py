@@ -1,27 +1,84 @@
-from .modals import Shop
+from .modals import Shop, Order
 
 import msgspec
 import typing as t
 
-class ShopInteraction(msgspec.Struct): 
-    """Base class for all Sellix API responses."""
-    
-    # Attributes
+T = t.TypeVar("T")
+
+
+class Interaction(msgspec.Struct, t.Generic[T]):
+    """
+    Base class for all Sellix API responses, parametrised by the type of `data`.
+
+    `Interaction[Shop]` decodes a whole response straight into its final structs in a single
+    pass, with no intermediate dictionaries.
+    """
+
     status: int
     """HTTP status code of the response."""
-    
-    data: t.Optional[Shop]
-    
-    error: t.Optional[str]
+
+    data: t.Optional[T] = None
+    """The payload of the response."""
+
+    error: t.Optional[str] = None
     """Error message, if any."""
-    
-    message: t.Optional[str]
+
+    message: t.Optional[str] = None
     """General message, if any."""
-    
-    env: t.Optional[str]
+
+    env: t.Optional[str] = None
     """Environment in which the request was made."""
 
 
+ShopInteraction = Interaction[Shop]
+"""A `GET /v1/self` response, whose `data` is the shop itself."""
+
+
+class OrderData(msgspec.Struct, t.Generic[T]):
+    """
+    The `data` of a `GET /v1/orders/{uniqid}` response.
+
+    Parametrised by the order type, so a projection such as `OrderSummary` can be decoded.
+    """
+
+    order: t.Optional[T] = None
+    """The requested order."""
+
+
+OrderInteraction = Interaction[OrderData[Order]]
+"""A `GET /v1/orders/{uniqid}` response."""
+
+
+class ListInteraction(Interaction[t.Dict[str, t.List[T]]], t.Generic[T]):
+    """
+    A page of a Sellix list endpoint, whose `data` maps the resource name to its items.
+
+    `ListInteraction[Order]` decodes `{"data": {"orders": [...]}}` straight into `Order` objects.
+    """
+
+
+class ErrorInteraction(msgspec.Struct):
+    """The fields of a Sellix API response needed to report an error."""
+
+    status: int
+    """HTTP status code of the response."""
+
+    error: t.Optional[str] = None
+    """Error message, if any."""
+
+    message: t.Optional[str] = None
+    """General message, if any."""
+
+
+class WebhookPayload(msgspec.Struct, t.Generic[T]):
+    """
+    The body of a webhook Sellix delivers, parametrised by the type of `data`.
+
+    `WebhookPayload[Order]` decodes an `order:*` event straight into an `Order`.
+    """
 
+    event: str
+    """The event, e.g. `order:paid`."""
 
-    
+    data: t.Optional[T] = None
+    """The resource the event is about."""
@@ -42,7 +42,26 @@ from ..enums.checkables import (
     SetupCryptocurrencies,
     MarketplaceVerified,
 )
-from .subtype import ProductVariant
+from .projection import compact
+from .subtype import (
+    ProductVariant,
+    FeeBreakdown,
+    Addon,
+    BundleConfig,
+    ApprovedAddress,
+    IPInfo,
+    Webhook,
+    RewardsDatum,
+    PaypalDispute,
+    ProductDownload,
+    StatusHistory,
+    AmlWallet,
+    CryptoTransaction,
+    Product,
+    AvailableStripeApm,
+    PaymentGatewaysFee,
+    VoidTime,
+)
 
 import msgspec
 import typing as t
@@ -361,127 +380,163 @@ class Order(msgspec.Struct):
     A class that represents a Sellix `Order`
 
     ---
-    Reference: [sellix.get_self](https://docs.sellix.io/apireference/information/getself)
+    Reference: [sellix.get_order](https://docs.sellix.io/api-reference/orders/get-order)
     """
-    id: t.Optional[int]
+    id: t.Optional[int] = None
     """ID of the resource."""
-    uniqid: t.Optional[str]
+    uniqid: t.Optional[str] = None
     """Unique ID of the resource, used as reference across the API."""
 
-    recurring_billing_id: str
-    payout_configuration: str
-    type: OrderType
-    subtype: OrderSubtype
-    origin: OrderOrigin
-    total: int
-    total_display: int
-    product_variants: t.List[ProductVariant]
-    exchange_rate: int
-    crypto_exchange_rate: int
-    currency: str
-    shop_id: int
-    shop_image_name: str
-    shop_image_storage: str
-    cloudflare_image_id: str
-    name: str
-    customer_email: str
-    customer_id: str
-    affliate_revenue_customer_id: str
-    paypal_email_delivery: bool
-    product_id: str
-    product_title: str
-    product_type: str
-    subscription_id: int
-    subscription_time: int
-    gateway: str
-    blockchain: str
-    paypal_apm: str
-    stripe_apm: str
-    paypal_email: str
-    paypal_order_id: str
-    paypal_payer_email: str
-    paypal_fee: int
-    paypal_subscription_id: int
-    paypal_subscription_link: int
-    lex_order_id: str
-    lex_payment_method: str
-    paydash_payment_id: str
-    virtual_payments_id: str
-    stripe_client_secret: str
-    stripe_price_id: str
-    skrill_email: str
-    skrill_sid: str
-    skrill_link: str
-    perfectmoney_id: UUID
-    binance_invoice_id: str
-    binance_qrcode: str
-    binance_checkout_url: str
-    crypto_address: str
-    crypto_amount: float
-    crypto_received: float
-    crypto_uri: str
-    crypto_confirmations_needed: int
-    crypto_scheduled_payout: bool
-    crypto_payout: bool
-    fee_billed: bool
-    bill_info: BillInfo
-    cashapp_qrcode: str
-    cashapp_note: UUID
-    cashapp_cashtag: str
-    country: str
-    location: str
-    ip: str
-    is_vpn_or_proxy: bool
-    user_agent: str
-    quantity: int
-    coupon_id: UUID
-    custom_fields: CustomFields
-    developer_invoice: bool
-    developer_title: str
-    developer_webhook: str
-    developer_return_url: str
-    status: str
-    status_details: str
-    void_details: str
-    discount: int
-    fee_percentage: int
-    fee_breakdown: FeeBreakdown
-    discount_breakdown: BillInfo
-    day_value: int
-    day: str
-    month: str
-    year: int
-    product_addons: List[Addon]
-    bundle_config: List[BundleConfig]
-    created_at: int
-    updated_at: int
-    updated_by: int
-    approved_address: ApprovedAddress
-    service_text: str
-    ip_info: IPInfo
-    webhooks: List[Webhook]
-    rewards_data: List[RewardsDatum]
-    paypal_dispute: PaypalDispute
-    product_downloads: List[ProductDownload]
-    payment_link_id: str
-    cashapp_email_configured: bool
-    license: bool
-    status_history: List[StatusHistory]
-    aml_wallets: List[AmlWallet]
-    crypto_transactions: List[CryptoTransaction]
-    product: Product
-    total_conversions: str
-    theme: str
-    dark_mode: int
-    crypto_mode: str
-    gateways_available: List[str]
-    country_regulations: str
-    available_stripe_apm: AvailableStripeApm
-    serials: List[str]
-    shop_payment_gateways_fees: List[PaymentGatewaysFee]
-    shop_paypal_credit_card: bool
-    shop_force_paypal_email_delivery: bool
-    shop_walletconnect_id: str
-    original_developer_return_url: str
-    rates_snapshot: RatesSnapshot
-    void_times: List[VoidTime]
\ No newline at end of file
+    recurring_billing_id: t.Optional[str] = None
+    payout_configuration: t.Optional[str] = None
+    type: t.Optional[OrderType] = None
+    subtype: t.Optional[OrderSubtype] = None
+    origin: t.Optional[OrderOrigin] = None
+    total: t.Optional[float] = None
+    total_display: t.Optional[float] = None
+    product_variants: t.Optional[t.List[ProductVariant]] = None
+    exchange_rate: t.Optional[float] = None
+    crypto_exchange_rate: t.Optional[float] = None
+    currency: t.Optional[str] = None
+    shop_id: t.Optional[int] = None
+    shop_image_name: t.Optional[str] = None
+    shop_image_storage: t.Optional[str] = None
+    cloudflare_image_id: t.Optional[str] = None
+    name: t.Optional[str] = None
+    customer_email: t.Optional[str] = None
+    customer_id: t.Optional[str] = None
+    affliate_revenue_customer_id: t.Optional[str] = None
+    paypal_email_delivery: t.Optional[bool] = None
+    product_id: t.Optional[str] = None
+    product_title: t.Optional[str] = None
+    product_type: t.Optional[str] = None
+    subscription_id: t.Optional[int] = None
+    subscription_time: t.Optional[int] = None
+    gateway: t.Optional[str] = None
+    blockchain: t.Optional[str] = None
+    paypal_apm: t.Optional[str] = None
+    stripe_apm: t.Optional[str] = None
+    paypal_email: t.Optional[str] = None
+    paypal_order_id: t.Optional[str] = None
+    paypal_payer_email: t.Optional[str] = None
+    paypal_fee: t.Optional[float] = None
+    paypal_subscription_id: t.Optional[int] = None
+    paypal_subscription_link: t.Optional[int] = None
+    lex_order_id: t.Optional[str] = None
+    lex_payment_method: t.Optional[str] = None
+    paydash_payment_id: t.Optional[str] = msgspec.field(
+        name="paydash_paymentID", default=None
+    )
+    virtual_payments_id: t.Optional[str] = None
+    stripe_client_secret: t.Optional[str] = None
+    stripe_price_id: t.Optional[str] = None
+    skrill_email: t.Optional[str] = None
+    skrill_sid: t.Optional[str] = None
+    skrill_link: t.Optional[str] = None
+    perfectmoney_id: t.Optional[str] = None
+    binance_invoice_id: t.Optional[str] = None
+    binance_qrcode: t.Optional[str] = None
+    binance_checkout_url: t.Optional[str] = None
+    crypto_address: t.Optional[str] = None
+    crypto_amount: t.Optional[float] = None
+    crypto_received: t.Optional[float] = None
+    crypto_uri: t.Optional[str] = None
+    crypto_confirmations_needed: t.Optional[int] = None
+    crypto_scheduled_payout: t.Optional[bool] = None
+    crypto_payout: t.Optional[bool] = None
+    fee_billed: t.Optional[bool] = None
+    bill_info: t.Optional[t.Dict[str, t.Any]] = None
+    cashapp_qrcode: t.Optional[str] = None
+    cashapp_note: t.Optional[str] = None
+    cashapp_cashtag: t.Optional[str] = None
+    country: t.Optional[str] = None
+    location: t.Optional[str] = None
+    ip: t.Optional[str] = None
+    is_vpn_or_proxy: t.Optional[bool] = None
+    user_agent: t.Optional[str] = None
+    quantity: t.Optional[int] = None
+    coupon_id: t.Optional[str] = None
+    custom_fields: t.Optional[t.Dict[str, t.Any]] = None
+    developer_invoice: t.Optional[bool] = None
+    developer_title: t.Optional[str] = None
+    developer_webhook: t.Optional[str] = None
+    developer_return_url: t.Optional[str] = None
+    status: t.Optional[str] = None
+    status_details: t.Optional[str] = None
+    void_details: t.Optional[str] = None
+    discount: t.Optional[float] = None
+    fee_percentage: t.Optional[float] = None
+    fee_breakdown: t.Optional[FeeBreakdown] = None
+    discount_breakdown: t.Optional[t.Dict[str, t.Any]] = None
+    day_value: t.Optional[int] = None
+    day: t.Optional[str] = None
+    month: t.Optional[str] = None
+    year: t.Optional[int] = None
+    product_addons: t.Optional[t.List[Addon]] = None
+    bundle_config: t.Optional[t.List[BundleConfig]] = None
+    created_at: t.Optional[int] = None
+    updated_at: t.Optional[int] = None
+    updated_by: t.Optional[int] = None
+    approved_address: t.Optional[ApprovedAddress] = None
+    service_text: t.Optional[str] = None
+    ip_info: t.Optional[IPInfo] = None
+    webhooks: t.Optional[t.List[Webhook]] = None
+    rewards_data: t.Optional[t.List[RewardsDatum]] = None
+    paypal_dispute: t.Optional[PaypalDispute] = None
+    product_downloads: t.Optional[t.List[ProductDownload]] = None
+    payment_link_id: t.Optional[str] = None
+    cashapp_email_configured: t.Optional[bool] = None
+    license: t.Optional[bool] = None
+    status_history: t.Optional[t.List[StatusHistory]] = None
+    aml_wallets: t.Optional[t.List[AmlWallet]] = None
+    crypto_transactions: t.Optional[t.List[CryptoTransaction]] = None
+    product: t.Optional[Product] = None
+    total_conversions: t.Optional[object] = None
+    theme: t.Optional[str] = None
+    dark_mode: t.Optional[int] = None
+    crypto_mode: t.Optional[str] = None
+    gateways_available: t.Optional[t.List[str]] = None
+    country_regulations: t.Optional[str] = None
+    available_stripe_apm: t.Optional[AvailableStripeApm] = None
+    serials: t.Optional[t.List[str]] = None
+    shop_payment_gateways_fees: t.Optional[t.List[PaymentGatewaysFee]] = None
+    shop_paypal_credit_card: t.Optional[bool] = None
+    shop_force_paypal_email_delivery: t.Optional[bool] = None
+    shop_walletconnect_id: t.Optional[str] = None
+    original_developer_return_url: t.Optional[str] = None
+    rates_snapshot: t.Optional[t.Dict[str, t.Union[int, str]]] = None
+    void_times: t.Optional[t.List[VoidTime]] = None
+
+class OrderSummary(msgspec.Struct):
+    """
+    The columns of an `Order` needed for listings and reporting.
+
+    Decoding a page into `OrderSummary` skips the nested product, webhooks, transactions and
+    status history of every order. Use `sellix.abc.projection.project` for other subsets.
+    """
+
+    id: t.Optional[int] = None
+    uniqid: t.Optional[str] = None
+    type: t.Optional[OrderType] = None
+    status: t.Optional[str] = None
+    gateway: t.Optional[str] = None
+    currency: t.Optional[str] = None
+    total: t.Optional[float] = None
+    total_display: t.Optional[float] = None
+    exchange_rate: t.Optional[float] = None
+    crypto_exchange_rate: t.Optional[float] = None
+    quantity: t.Optional[int] = None
+    customer_email: t.Optional[str] = None
+    product_id: t.Optional[str] = None
+    product_title: t.Optional[str] = None
+    coupon_id: t.Optional[str] = None
+    country: t.Optional[str] = None
+    created_at: t.Optional[int] = None
+    updated_at: t.Optional[int] = None
+
+
+CompactShop = compact(Shop, name="CompactShop")
+"""A frozen, `gc=False`, array-encoded `Shop`, for holding many shops in memory or on disk."""
+
+CompactOrder = compact(Order, name="CompactOrder")
+"""A frozen, `gc=False`, array-encoded `Order`, for holding many orders in memory or on disk."""
@@ -0,0 +1,152 @@
+import msgspec
+import typing as t
+
+S = t.TypeVar("S", bound=msgspec.Struct)
+
+_PROJECTIONS: t.Dict[t.Tuple[type, t.Tuple[str, ...]], type] = {}
+_COMPACT: t.Dict[t.Tuple[type, bool], type] = {}
+
+
+def _definitions(
+    struct_type: t.Type[msgspec.Struct],
+    names: t.Optional[t.Sequence[str]] = None,
+    retype: t.Callable[[t.Any], t.Any] = lambda annotation: annotation,
+) -> t.Tuple[t.List[t.Any], t.Dict[str, str]]:
+    """Returns the `defstruct` fields and renames copying `names` (default all) of a struct."""
+    available = {field.name: field for field in msgspec.structs.fields(struct_type)}
+    if names is None:
+        names = list(available)
+
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"{struct_type.__name__} has no field(s) {', '.join(unknown)}")
+
+    definitions: t.List[t.Any] = []
+    rename: t.Dict[str, str] = {}
+    for name in names:
+        field = available[name]
+        annotation = retype(field.type)
+        if field.default is not msgspec.NODEFAULT:
+            definitions.append((field.name, annotation, field.default))
+        elif field.default_factory is not msgspec.NODEFAULT:
+            definitions.append(
+                (field.name, annotation, msgspec.field(default_factory=field.default_factory))
+            )
+        else:
+            definitions.append((field.name, annotation))
+        rename[field.name] = field.encode_name
+    return definitions, rename
+
+
+def project(
+    struct_type: t.Type[msgspec.Struct],
+    fields: t.Iterable[str],
+    name: t.Optional[str] = None,
+) -> t.Type[msgspec.Struct]:
+    """
+    Builds a struct holding only some fields of `struct_type`.
+
+    Decoding into the projection skips every other field of the payload without building
+    objects for it, which is much cheaper than decoding the full struct when only a few columns
+    are needed. Projections are cached, so the same fields always give the same type.
+
+    Args:
+        struct_type: The struct to project, e.g. `Order`.
+        fields: Names of the fields to keep, in the order they should be declared.
+        name: Name of the new struct, defaults to `<struct_type>Projection`.
+
+    Returns:
+        Type[msgspec.Struct]: The projection, usable wherever `struct_type` is decoded.
+    """
+    fields = tuple(fields)
+    key = (struct_type, fields)
+    try:
+        return _PROJECTIONS[key]
+    except KeyError:
+        pass
+
+    definitions, rename = _definitions(struct_type, fields)
+    projection = msgspec.defstruct(
+        name or f"{struct_type.__name__}Projection",
+        definitions,
+        module=struct_type.__module__,
+        rename=rename,
+    )
+    return _PROJECTIONS.setdefault(key, projection)
+
+
+def compact(
+    struct_type: t.Type[msgspec.Struct],
+    array_like: bool = True,
+    name: t.Optional[str] = None,
+) -> t.Type[msgspec.Struct]:
+    """
+    Builds a memory-lean, read-only copy of `struct_type`.
+
+    The copy has the same fields but is not tracked by the garbage collector (`gc=False`), is
+    frozen, and leaves fields still at their default out of encoded output. With `array_like`
+    it is also encoded as a positional array rather than an object, which drops every field name
+    from the output; such types suit a local store but cannot decode API responses, pass
+    `array_like=False` for a copy that can (e.g. as a `projection`).
+
+    Nested structs are replaced by their own compact copies. Decoded API data never forms
+    reference cycles, which is what makes `gc=False` safe here.
+
+    Args:
+        struct_type: The struct to copy, e.g. `Order`.
+        array_like: Encode instances as arrays.
+        name: Name of the new struct, defaults to `Compact<struct_type>`.
+
+    Returns:
+        Type[msgspec.Struct]: The compact struct.
+    """
+    key = (struct_type, array_like)
+    try:
+        return _COMPACT[key]
+    except KeyError:
+        pass
+
+    definitions, rename = _definitions(
+        struct_type, retype=lambda annotation: _compact_type(annotation, array_like)
+    )
+    compacted = msgspec.defstruct(
+        name or f"Compact{struct_type.__name__}",
+        definitions,
+        module=struct_type.__module__,
+        rename=rename,
+        frozen=True,
+        omit_defaults=True,
+        array_like=array_like,
+        gc=False,
+    )
+    return _COMPACT.setdefault(key, compacted)
+
+
+def _compact_type(annotation: t.Any, array_like: bool) -> t.Any:
+    """Replaces every struct within a field annotation by its `compact` copy."""
+    if isinstance(annotation, type) and issubclass(annotation, msgspec.Struct):
+        return compact(annotation, array_like)
+
+    origin = t.get_origin(annotation)
+    arguments = t.get_args(annotation)
+    if origin is None or not arguments or origin is t.Literal:
+        return annotation
+
+    arguments = tuple(_compact_type(argument, array_like) for argument in arguments)
+    if origin is t.Union:
+        return t.Union[arguments]
+    return origin[arguments]
+
+
+def to_compact(value: msgspec.Struct, array_like: bool = True) -> msgspec.Struct:
+    """
+    Copies a struct, and the structs nested in it, into their `compact` types.
+
+    Args:
+        value: The struct to copy, e.g. an `Order`.
+        array_like: Whether the compact type is encoded as an array.
+
+    Returns:
+        msgspec.Struct: The copy.
+    """
+    return msgspec.convert(value, compact(type(value), array_like), from_attributes=True)
@@ -1,7 +1,318 @@
 import msgspec
+import typing as t
+
+
+class PriceConversions(msgspec.Struct):
+    """
+    A price converted into every currency Sellix supports.
+
+    Fiat prices are fields named after their `Currency` code (`conversions.EUR`), crypto prices
+    are in `crypto`, keyed by gateway code and decoded from decimal strings into floats.
+    """
+
+    CAD: t.Optional[float] = None
+    HKD: t.Optional[float] = None
+    ISK: t.Optional[float] = None
+    PHP: t.Optional[float] = None
+    DKK: t.Optional[float] = None
+    HUF: t.Optional[float] = None
+    CZK: t.Optional[float] = None
+    GBP: t.Optional[float] = None
+    RON: t.Optional[float] = None
+    SEK: t.Optional[float] = None
+    IDR: t.Optional[float] = None
+    INR: t.Optional[float] = None
+    BRL: t.Optional[float] = None
+    RUB: t.Optional[float] = None
+    HRK: t.Optional[float] = None
+    JPY: t.Optional[float] = None
+    THB: t.Optional[float] = None
+    CHF: t.Optional[float] = None
+    EUR: t.Optional[float] = None
+    MYR: t.Optional[float] = None
+    BGN: t.Optional[float] = None
+    TRY: t.Optional[float] = None
+    CNY: t.Optional[float] = None
+    NOK: t.Optional[float] = None
+    NZD: t.Optional[float] = None
+    ZAR: t.Optional[float] = None
+    USD: t.Optional[float] = None
+    MXN: t.Optional[float] = None
+    SGD: t.Optional[float] = None
+    AUD: t.Optional[float] = None
+    ILS: t.Optional[float] = None
+    KRW: t.Optional[float] = None
+    PLN: t.Optional[float] = None
+    crypto: t.Optional[t.Dict[str, float]] = None
+
 
 class ProductVariant(msgspec.Struct):
-    price: int
-    title: str
-    description: str
-    price_conversions: object
\ No newline at end of file
+    price: t.Optional[float] = None
+    title: t.Optional[str] = None
+    description: t.Optional[str] = None
+    price_conversions: t.Optional[PriceConversions] = None
+
+
+class FeeAmount(msgspec.Struct):
+    """A single amount of a fee, as found in an order's `fee_breakdown`."""
+
+    amount: t.Optional[float] = None
+    currency: t.Optional[str] = None
+    plan: t.Optional[str] = None
+    value: t.Optional[str] = None
+
+
+class FeeDetail(msgspec.Struct):
+    """A fee charged on an order, split into its flat and percentage parts."""
+
+    amount: t.Optional[float] = None
+    currency: t.Optional[str] = None
+    breakdown: t.Optional[t.Dict[str, FeeAmount]] = None
+
+
+class FeeBreakdown(msgspec.Struct):
+    """The fees Sellix charged on an order."""
+
+    service_fee: t.Optional[FeeDetail] = None
+    aml_analysis: t.Optional[FeeDetail] = None
+    platform_fee: t.Optional[FeeDetail] = None
+
+
+class Addon(msgspec.Struct):
+    """An addon bought together with a product."""
+
+    id: t.Optional[int] = None
+    uniqid: t.Optional[str] = None
+    shop_id: t.Optional[int] = None
+    product_types: t.Optional[t.List[str]] = None
+    title: t.Optional[str] = None
+    description: t.Optional[str] = None
+    price: t.Optional[str] = None
+    currency: t.Optional[str] = None
+
+
+class BundleConfig(msgspec.Struct):
+    """A bundle discount applied to an order."""
+
+    id: t.Optional[int] = None
+    uniqid: t.Optional[str] = None
+    shop_id: t.Optional[int] = None
+    title: t.Optional[str] = None
+    products: t.Optional[str] = None
+    discount_type: t.Optional[str] = None
+    discount_amount: t.Optional[float] = None
+    updated_at: t.Optional[int] = None
+
+
+class ApprovedAddress(msgspec.Struct):
+    """A crypto address approved to pay a recurring bill."""
+
+    id: t.Optional[int] = None
+    address: t.Optional[str] = None
+    coin: t.Optional[str] = None
+    blockchain: t.Optional[str] = None
+    tx: t.Optional[str] = None
+    recurring_billing_id: t.Optional[str] = None
+    allowance: t.Optional[float] = None
+    updated_at: t.Optional[int] = None
+    created_at: t.Optional[int] = None
+
+
+class IPInfo(msgspec.Struct):
+    """Fraud-shield information about the customer's IP address."""
+
+    success: t.Optional[bool] = None
+    message: t.Optional[str] = None
+    fraud_score: t.Optional[int] = None
+    country_code: t.Optional[str] = None
+    region: t.Optional[str] = None
+    city: t.Optional[str] = None
+    isp: t.Optional[str] = msgspec.field(name="ISP", default=None)
+    asn: t.Optional[int] = msgspec.field(name="ASN", default=None)
+    operating_system: t.Optional[str] = None
+    browser: t.Optional[str] = None
+    organization: t.Optional[str] = None
+    is_crawler: t.Optional[bool] = None
+    timezone: t.Optional[str] = None
+    mobile: t.Optional[bool] = None
+    host: t.Optional[str] = None
+    proxy: t.Optional[bool] = None
+    vpn: t.Optional[bool] = None
+    tor: t.Optional[bool] = None
+    active_vpn: t.Optional[bool] = None
+    active_tor: t.Optional[bool] = None
+    device_brand: t.Optional[str] = None
+    device_model: t.Optional[str] = None
+    recent_abuse: t.Optional[bool] = None
+    bot_status: t.Optional[bool] = None
+    connection_type: t.Optional[str] = None
+    abuse_velocity: t.Optional[str] = None
+    zip_code: t.Optional[str] = None
+    latitude: t.Optional[float] = None
+    longitude: t.Optional[float] = None
+    request_id: t.Optional[str] = None
+
+
+class Webhook(msgspec.Struct):
+    """A webhook delivery made for an order."""
+
+    uniqid: t.Optional[str] = None
+    url: t.Optional[str] = None
+    event: t.Optional[str] = None
+    retries: t.Optional[int] = None
+    response_code: t.Optional[int] = None
+    created_at: t.Optional[int] = None
+    payload: t.Optional[str] = None
+    response: t.Optional[str] = None
+
+
+class RewardsDatum(msgspec.Struct):
+    """A reward rule triggered by an order."""
+
+    clause: t.Optional[str] = None
+    clause_value: t.Optional[str] = None
+    clause_currency: t.Optional[str] = None
+    action: t.Optional[str] = None
+    action_value: t.Optional[str] = None
+    action_currency: t.Optional[str] = None
+    action_send_product_variant: t.Optional[str] = None
+    created_at: t.Optional[int] = None
+    updated_at: t.Optional[int] = None
+    log: t.Optional[object] = None
+    reward_info: t.Optional[object] = None
+
+
+class PaypalDisputeMessage(msgspec.Struct):
+    """A message posted on a PayPal dispute."""
+
+    posted_by: t.Optional[str] = None
+    content: t.Optional[str] = None
+    created_at: t.Optional[int] = None
+
+
+class PaypalDispute(msgspec.Struct):
+    """A PayPal dispute opened against an order."""
+
+    id: t.Optional[str] = None
+    invoice_id: t.Optional[str] = None
+    shop_id: t.Optional[int] = None
+    reason: t.Optional[str] = None
+    status: t.Optional[str] = None
+    outcome: t.Optional[str] = None
+    messages: t.Optional[t.List[PaypalDisputeMessage]] = None
+    life_cycle_stage: t.Optional[str] = None
+    seller_response_due_date: t.Optional[int] = None
+    created_at: t.Optional[int] = None
+    updated_at: t.Optional[int] = None
+
+
+class ProductDownload(msgspec.Struct):
+    """A download of the product bought with an order."""
+
+    id: t.Optional[int] = None
+    invoice_id: t.Optional[str] = None
+    customer_ip: t.Optional[str] = None
+    customer_isp: t.Optional[str] = None
+    customer_timezone: t.Optional[str] = None
+    customer_country: t.Optional[str] = None
+    created_at: t.Optional[int] = None
+
+
+class StatusHistory(msgspec.Struct):
+    """A status an order went through."""
+
+    id: t.Optional[int] = None
+    invoice_id: t.Optional[str] = None
+    status: t.Optional[str] = None
+    details: t.Optional[str] = None
+    created_at: t.Optional[int] = None
+
+
+class AmlWallet(msgspec.Struct):
+    """The anti-money-laundering analysis of a wallet which paid an order."""
+
+    id: t.Optional[int] = None
+    shop_id: t.Optional[int] = None
+    invoice_id: t.Optional[str] = None
+    origin: t.Optional[str] = None
+    type: t.Optional[str] = None
+    asset: t.Optional[str] = None
+    blockchain: t.Optional[str] = None
+    hash: t.Optional[str] = None
+    output_type: t.Optional[str] = None
+    output_address: t.Optional[str] = None
+    risk_score: t.Optional[str] = None
+    asset_list: t.Optional[t.List[str]] = None
+    error: t.Optional[str] = None
+    evaluation_detail: t.Optional[object] = None
+    contributions: t.Optional[object] = None
+    blockchain_info: t.Optional[object] = None
+    cluster_entities: t.Optional[object] = None
+    risk_score_detail: t.Optional[object] = None
+    created_at: t.Optional[int] = None
+
+
+class CryptoTransaction(msgspec.Struct):
+    """A crypto transaction received for an order."""
+
+    crypto_amount: t.Optional[float] = None
+    hash: t.Optional[str] = None
+    confirmations: t.Optional[int] = None
+    created_at: t.Optional[int] = None
+    updated_at: t.Optional[int] = None
+
+
+class AvailableStripeApm(msgspec.Struct):
+    """A Stripe alternative payment method."""
+
+    id: t.Optional[str] = None
+    name: t.Optional[str] = None
+
+
+class PaymentGatewaysFee(msgspec.Struct):
+    """A fee the shop charges on top of a payment gateway."""
+
+    id: t.Optional[int] = None
+    shop_id: t.Optional[int] = None
+    gateway: t.Optional[str] = None
+    percent_amount: t.Optional[float] = None
+    fixed_amount: t.Optional[str] = None
+    fixed_currency: t.Optional[str] = None
+    active_type: t.Optional[str] = None
+    updated_at: t.Optional[str] = None
+    created_at: t.Optional[str] = None
+    conversions: t.Optional[object] = None
+
+
+class Product(msgspec.Struct):
+    """The product bought with an order."""
+
+    id: t.Optional[int] = None
+    uniqid: t.Optional[str] = None
+    slug: t.Optional[str] = None
+    shop_id: t.Optional[int] = None
+    type: t.Optional[str] = None
+    subtype: t.Optional[str] = None
+    title: t.Optional[str] = None
+    currency: t.Optional[str] = None
+    price: t.Optional[float] = None
+    price_display: t.Optional[float] = None
+    price_discount: t.Optional[float] = None
+    description: t.Optional[str] = None
+    gateways: t.Optional[t.List[str]] = None
+    stock: t.Optional[int] = None
+    unlisted: t.Optional[bool] = None
+    private: t.Optional[bool] = None
+    on_hold: t.Optional[bool] = None
+    sold_count: t.Optional[int] = None
+    average_score: t.Optional[str] = None
+    price_conversions: t.Optional[PriceConversions] = None
+    created_at: t.Optional[int] = None
+    updated_at: t.Optional[int] = None
+
+
+class VoidTime(msgspec.Struct):
+    """How long an order waits for a payment on a set of gateways before being voided."""
+
+    gateways: t.Optional[t.List[str]] = None
+    conf: t.Optional[t.Dict[str, t.Any]] = None
@@ -1,12 +1,71 @@
 import asyncio
-from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 from .enums.genric import MerchantTier, APIEndpoints
-from .abc.interaction import ShopInteraction
-from .abc.modals import Shop
+from .core.ratelimit import RateLimiter, RateLimitInfo, SlidingWindowLimiter
+from .core.errors import SellixError
+from .core.exceptions import DeadlineExceeded, HTTPException, RateLimitException
+from .core.batch import BatchResult, fan_out
+from .core.connector import ConnectorPool
+from .core.scheduler import FairScheduler
+from .core.cache import ResponseCache, ValidatorCache
+from .core.retry import RetryBudget, RetryPolicy
+from .core.breaker import CircuitBreakers, is_failure
+from .core.hedging import HedgePolicy
+from .core.instrumentation import Instrumentation
+from .core.timeouts import (
+    DEFAULT_TIMEOUT,
+    DEFAULT_TIMEOUTS,
+    Deadline,
+    bound,
+    current_deadline,
+    deadline,
+    without_deadline,
+)
+from .core.singleflight import SingleFlight
+from .core.decoders import decode
+from .core.export import BatchSink, OrderRow, export_orders
+from .abc.interaction import (
+    Interaction,
+    OrderData,
+    ShopInteraction,
+    ErrorInteraction,
+    ListInteraction,
+    OrderInteraction,
+)
+from .abc.modals import Shop, Order
 import msgspec
 import aiohttp
+import functools
+import time
+import types
 import typing as t
+import warnings
+
+T = t.TypeVar("T")
+
+_CACHED: t.Mapping[str, str] = types.MappingProxyType({})
+"""The headers of a response served from the `ResponseCache`."""
+
+_HTTP_METHODS: t.Dict[str, str] = {
+    "GET": "GET",
+    "POST": "POST",
+    "PUT": "PUT",
+    "DEL": "DELETE",
+}
+
+
+def _retrieve(request: asyncio.Future) -> None:
+    """Marks the error of a losing hedged request as retrieved, so asyncio does not log it."""
+    if not request.cancelled():
+        request.exception()
+
+
+def _head_size(request_info: aiohttp.RequestInfo) -> int:
+    """Estimates the size of an HTTP/1.1 request head: request line, headers and blank line."""
+    size = len(request_info.method) + len(request_info.url.raw_path_qs) + 12
+    for name, value in request_info.headers.items():
+        size += len(name) + len(value) + 4
+    return size + 2
 
 
 class SellixClientX:
@@ -20,13 +79,32 @@ class SellixClientX:
         custom_rate_limit_time: t.Optional[int] = None,
         restrict_methods: t.Optional[t.Literal["GET", "POST", "PUT", "DEL"]] = None,
         logging: t.Optional[bool] = False,
-        ratelimits_by_tasks: t.Optional[bool] = True,
+        ratelimits_by_tasks: t.Optional[bool] = None,
+        rate_limiter: t.Optional[RateLimiter] = None,
+        connector_pool: t.Optional[ConnectorPool] = None,
+        scheduler: t.Optional[FairScheduler] = None,
+        cache: t.Optional[ResponseCache] = None,
+        validators: t.Optional[ValidatorCache] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        circuit_breakers: t.Optional[CircuitBreakers] = None,
+        hedging: t.Optional[HedgePolicy] = None,
+        timeouts: t.Optional[t.Mapping[APIEndpoints, aiohttp.ClientTimeout]] = None,
+        timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT,
+        instrumentation: t.Optional[Instrumentation] = None,
     ) -> None:
         self.base_url = "https://dev.sellix.io/v1"
 
         if auth_key is None:
             raise ValueError("auth_key cannot be None")
 
+        if ratelimits_by_tasks is not None:
+            warnings.warn(
+                "ratelimits_by_tasks is deprecated and has no effect, use "
+                "enable_auto_rate_limit_handler or rate_limiter instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         self.headers: t.Dict[str, str] = {
             "Authorization": f"Bearer {auth_key}",
         }
@@ -34,69 +112,356 @@ class SellixClientX:
         if merchant_id:
             self.headers["X-Sellix-Merchant"] = f"{merchant_id}"
 
-        self.__session = aiohttp.ClientSession(headers=self.headers)
+        self.merchant_id = merchant_id
+        self.cache_namespace = ResponseCache.namespace(auth_key, merchant_id)
+        self.connector_pool = connector_pool
+        self.scheduler = scheduler
+        self.cache = cache
+        self.validators = validators
+        self.retry_policy = retry_policy or RetryPolicy(budget=RetryBudget())
+        self.circuit_breakers = circuit_breakers
+        self.hedging = hedging
+        self.timeouts: t.Dict[APIEndpoints, aiohttp.ClientTimeout] = dict(
+            DEFAULT_TIMEOUTS if timeouts is None else timeouts
+        )
+        self.timeout = timeout
+        self.instrumentation = instrumentation
+        self._in_flight = SingleFlight()
+        self.__session: t.Optional[aiohttp.ClientSession] = None
         self.merchant_tier = merchant_tier
-        self.rate_limit_task_queue = asyncio.Queue() if ratelimits_by_tasks else None
         self.enable_auto_rate_limit_handler = enable_auto_rate_limit_handler
         self.custom_rate_limit_time = custom_rate_limit_time or 10
         self.restrict_methods = restrict_methods
-        self.ratelimits_by_tasks = ratelimits_by_tasks
-        self.semaphore = asyncio.Semaphore(self.merchant_tier.value)  #type: ignore
         self.blacklist = default_blacklist
-        if self.enable_auto_rate_limit_handler:
-            asyncio.create_task(self._rate_limit_handler())
 
+        if rate_limiter is None and enable_auto_rate_limit_handler and merchant_tier:
+            rate_limiter = SlidingWindowLimiter.from_tier(
+                merchant_tier, period=self.custom_rate_limit_time
+            )
+        self.rate_limiter = rate_limiter
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the session of the client, opening it on first use.
+
+        The session is created lazily so the client can be built outside a running event loop.
+        """
+        if self.__session is None or self.__session.closed:
+            if self.connector_pool is not None:
+                self.__session = self.connector_pool.session()
+            else:
+                self.__session = aiohttp.ClientSession()
+        return self.__session
 
-    async def _rate_limit_handler(self):
-        while True:
-            await asyncio.sleep(self.custom_rate_limit_time)
+    async def _request(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DEL"],
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        headers: t.Optional[t.Dict[str, str]] = None,
+        retry: t.Optional[RetryPolicy] = None,
+    ) -> t.Tuple[int, t.Mapping[str, str], bytes]:
+        """
+        Sends an API request, retrying transient failures.
 
-            current_time = datetime.now()
-            await self._handle_rate_limit(current_time)
+        Args:
+            method (Literal["GET", "POST", "PUT", "DEL"]): The HTTP method to use.
+            api_method (APIEndpoints): The API endpoint to send the request to.
+            path_params (Optional[Dict[str, str]]): Values for the placeholders of the endpoint, e.g. `uniqid`.
+            params (Optional[Dict[str, Any]]): Query string parameters.
+            headers (Optional[Dict[str, str]]): Headers to send on top of the client's ones.
+            retry (Optional[RetryPolicy]): Overrides `retry_policy` for this request.
 
-    async def _handle_rate_limit(self, current_time: datetime):
-        if self.merchant_tier is None:
-            return
+        Returns:
+            Tuple[int, Mapping[str, str], bytes]: The status, headers and body of the response.
 
-        limit = int(self.merchant_tier.value)  # type: ignore
-        rate_limit_window_start = current_time - timedelta(
-            seconds=self.custom_rate_limit_time
-        )
+        Raises:
+            DeadlineExceeded: The request cannot complete before the current `deadline`.
+            CircuitOpenException: The circuit breaker of the endpoint is open.
+            RateLimitException: The API answered with `429 Too Many Requests`.
+            HTTPException: The API answered with any other error status.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return await self._call(method, api_method, path_params, params, headers, retry)
+
+        state = instrumentation.start_request(api_method, method)
+        try:
+            response = await self._call(method, api_method, path_params, params, headers, retry)
+        except BaseException as error:
+            instrumentation.end_request(state, error)
+            raise
+        instrumentation.end_request(state, None)
+        return response
+
+    async def _call(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DEL"],
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        headers: t.Optional[t.Dict[str, str]] = None,
+        retry: t.Optional[RetryPolicy] = None,
+    ) -> t.Tuple[int, t.Mapping[str, str], bytes]:
+        """Looks a request up in the cache, or sends it with retries, see `_request`."""
+        instrumentation = self.instrumentation
+        cache_key = None
+        if method == "GET" and self.cache is not None and self.cache.ttl(api_method):
+            cache_key = self.cache.key(self.cache_namespace, api_method, path_params, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if instrumentation is not None:
+                    instrumentation.on_cache(api_method, "hit")
+                return 200, _CACHED, cached
 
-        tasks_executed_within_window = 0
-        for task_time, _ in self.rate_limit_task_queue._queue:  # type: ignore
-            if task_time >= rate_limit_window_start:
-                tasks_executed_within_window += 1
+        on_retry = None
+        if instrumentation is not None:
+            on_retry = functools.partial(instrumentation.on_retry, api_method, method)
+        # One outcome per lookup: a miss of the response cache answered by a `304` is a
+        # revalidation, and a `GET` sent without validators to offer is a miss of those.
+        result = None
+        if method == "GET" and (cache_key is not None or self.validators is not None):
+            result = "miss"
+        try:
+            status, response_headers, body = await (retry or self.retry_policy).call(
+                method,
+                lambda: self._attempt(method, api_method, path_params, params, headers),
+                on_retry=on_retry,
+            )
+            if result is not None and status == 304:
+                result = "revalidated"
+        finally:
+            if instrumentation is not None and result is not None:
+                instrumentation.on_cache(api_method, result)
+        if cache_key is not None and status < 300:
+            self.cache.set(cache_key, api_method, body)  # type: ignore
+        return status, response_headers, body
+
+    async def _attempt(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DEL"],
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        headers: t.Optional[t.Dict[str, str]] = None,
+    ) -> t.Tuple[int, t.Mapping[str, str], bytes]:
+        """
+        Sends a single attempt of a request, see `_request`.
+
+        The attempt goes through the circuit breaker of the endpoint, then waits for the rate
+        limiter; `GET` requests are hedged if `hedging` says so.
+        """
+        limit = current_deadline()
+        if limit is not None:
+            limit.check()
+
+        breaker = None
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(api_method)
+            breaker.allow()
+
+        started = time.monotonic()
+        try:
+            if self.rate_limiter is not None:
+                try:
+                    waited = await self.rate_limiter.acquire(
+                        timeout=None if limit is None else limit.remaining
+                    )
+                except asyncio.TimeoutError:
+                    raise DeadlineExceeded(limit.remaining) from None  # type: ignore
+                if self.instrumentation is not None:
+                    self.instrumentation.on_rate_limit(api_method, waited)
+
+            started = time.monotonic()
+            delay = None
+            if method == "GET" and self.hedging is not None:
+                delay = self.hedging.delay(api_method)
+            if delay is None:
+                response = await self._send(method, api_method, path_params, params, headers)
+            else:
+                response = await self._hedge(
+                    delay, method, api_method, path_params, params, headers
+                )
+        except DeadlineExceeded:
+            # The client gave up, possibly before the API was even reached: no verdict.
+            if breaker is not None:
+                breaker.cancel()
+            raise
+        except Exception as error:
+            if breaker is not None:
+                breaker.record(is_failure(error), time.monotonic() - started)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.cancel()
+            raise
+
+        if breaker is not None:
+            breaker.record(False, time.monotonic() - started)
+        return response
+
+    async def _hedge(
+        self,
+        delay: float,
+        method: t.Literal["GET", "POST", "PUT", "DEL"],
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        headers: t.Optional[t.Dict[str, str]] = None,
+    ) -> t.Tuple[int, t.Mapping[str, str], bytes]:
+        """
+        Sends a request, and a second one if the first is still unanswered after `delay`.
 
-        if tasks_executed_within_window >= limit:
-            delay = (
-                rate_limit_window_start + timedelta(seconds=self.custom_rate_limit_time)
-            ) - current_time
-            print(
-                f"Rate limit exceeded for {self.merchant_tier.name} tier. Waiting for {delay.total_seconds()} seconds."
+        The hedge only takes a rate-limiter slot free right away, and is skipped otherwise.
+        The first answer wins, unless it is a failure of the API while the other request is
+        still in flight; the other request is then cancelled.
+
+        Only the latency of the first request is recorded, from when it was sent, even if it
+        lost and was cancelled: the hedge's own latency would pull the percentile, and the
+        delay before hedging, down to `min_delay`.
+        """
+        hedging: HedgePolicy = self.hedging  # type: ignore
+        started = time.monotonic()
+
+        def record(request: asyncio.Future) -> None:
+            # Like `_send`, leave out requests which failed without an answer.
+            error = None if request.cancelled() else request.exception()
+            if error is None or isinstance(error, HTTPException):
+                hedging.record(api_method, time.monotonic() - started)
+
+        requests = [
+            asyncio.ensure_future(
+                self._send(method, api_method, path_params, params, headers, record=False)
             )
-            await asyncio.sleep(delay.total_seconds())
+        ]
+        requests[0].add_done_callback(_retrieve)
+        requests[0].add_done_callback(record)
+        try:
+            done, _ = await asyncio.wait(requests, timeout=delay)
+            if not done and (self.rate_limiter is None or self.rate_limiter.try_acquire()):
+                hedging.hedged += 1
+                requests.append(
+                    asyncio.ensure_future(
+                        self._send(
+                            method, api_method, path_params, params, headers, record=False
+                        )
+                    )
+                )
+                requests[1].add_done_callback(_retrieve)
 
-        print(f"Rate limit check completed for {self.merchant_tier.name} tier.")
+            pending = set(requests)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                answers = [request for request in requests if request in done]
+                answers.sort(key=lambda request: request.exception() is not None)
+                error = answers[0].exception()
+                if error is not None and pending and is_failure(error):
+                    continue
+                if answers[0] is not requests[0]:
+                    hedging.wins += 1
+                return answers[0].result()
+        finally:
+            for request in requests:
+                request.cancel()
+
+    async def _send(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DEL"],
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        headers: t.Optional[t.Dict[str, str]] = None,
+        record: bool = True,
+    ) -> t.Tuple[int, t.Mapping[str, str], bytes]:
+        """
+        Sends a request once, its rate-limiter slot being already taken.
 
-        if self.rate_limit_task_queue:
-            await self.rate_limit_task_queue.put(
-                (current_time, await self._execute_tasks())
+        The latency is recorded for hedging unless `record` is `False`, e.g. for hedged
+        requests, whose latency `_hedge` records.
+        """
+        limit = current_deadline()
+        path = api_method.value
+        if path_params:
+            path = path.format(**path_params)
+        url = urljoin(self.base_url, path)
+        headers = {**self.headers, **headers} if headers else self.headers
+
+        if self.scheduler is not None:
+            if limit is None:
+                await self.scheduler.acquire(self.merchant_id)
+            else:
+                try:
+                    await asyncio.wait_for(
+                        self.scheduler.acquire(self.merchant_id), limit.remaining
+                    )
+                except asyncio.TimeoutError:
+                    raise DeadlineExceeded() from None
+        started = time.monotonic()
+        try:
+            async with self._get_session().request(
+                _HTTP_METHODS[method],
+                url,
+                params=params,
+                headers=headers,
+                timeout=bound(self.timeouts.get(api_method, self.timeout), limit),
+            ) as response:
+                body = await response.read()
+                status = response.status
+                response_headers = response.headers
+                request_info = response.request_info
+        except Exception as error:
+            if self.instrumentation is not None:
+                self.instrumentation.on_attempt(
+                    api_method, method, None, time.monotonic() - started, 0, 0, error
+                )
+            if isinstance(error, asyncio.TimeoutError) and limit is not None and limit.expired:
+                raise DeadlineExceeded() from error
+            raise
+        finally:
+            if self.scheduler is not None:
+                self.scheduler.release()
+        latency = time.monotonic() - started
+        if record and self.hedging is not None:
+            self.hedging.record(api_method, latency)
+        if self.instrumentation is not None:
+            self.instrumentation.on_attempt(
+                api_method, method, status, latency, _head_size(request_info), len(body)
             )
 
-    async def _execute_tasks(self):
-        if self.rate_limit_task_queue:
-            while not self.rate_limit_task_queue.empty():
-                # Acquire the semaphore before executing a task
-                async with self.semaphore:
-                    time, task = await self.rate_limit_task_queue.get()
-                    if datetime.now() - time <= timedelta(
-                        seconds=self.custom_rate_limit_time
-                    ):
-                        await task
+        rate_limit = RateLimitInfo.from_headers(response_headers)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(rate_limit, exceeded=status == 429)
+
+        if status >= 400:
+            try:
+                answer = decode(body, ErrorInteraction)
+            except msgspec.DecodeError:
+                answer = ErrorInteraction(status=status)
+
+            if status == 429:
+                raise RateLimitException(
+                    SellixError.from_status(status, answer.error)
+                    or SellixError.TOO_MANY_REQUESTS,
+                    status,
+                    answer.error or answer.message,
+                    rate_limit.reset_after,
+                )
+            raise HTTPException(
+                SellixError.from_status(status, answer.error),
+                status,
+                answer.error or answer.message,
+                rate_limit.reset_after,
+            )
+        return status, response_headers, body
 
     async def _make_request(
-        self, method: t.Literal["GET", "POST", "PUT", "DEL"], api_method: APIEndpoints
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DEL"],
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        retry: t.Optional[RetryPolicy] = None,
     ) -> bytes:
         """
         Generic method to make an API request.
@@ -104,47 +469,461 @@ class SellixClientX:
         Args:
             method (Literal["GET", "POST", "PUT", "DEL"]): The HTTP method to use.
             api_method (APIEndpoints): The API endpoint to send the request to.
+            path_params (Optional[Dict[str, str]]): Values for the placeholders of the endpoint, e.g. `uniqid`.
+            params (Optional[Dict[str, Any]]): Query string parameters.
+            retry (Optional[RetryPolicy]): Overrides `retry_policy` for this request.
 
         Returns:
             bytes: The response body.
+
+        Raises:
+            RateLimitException: The API answered with `429 Too Many Requests`.
+            HTTPException: The API answered with any other error status.
         """
-        if method == "GET":
-            url = urljoin(self.base_url, api_method.value)
-            print(self.base_url)
-            print(url)
-            async with self.__session.get(
-                url=url
-            ) as response:
-                
-                return await response.read()
-        elif method == "POST":
-            async with self.__session.post(
-                urljoin(self.base_url, api_method.value)
-            ) as response:
-                print(await response.json())
-                return await response.read()
-        elif method == "PUT":
-            async with self.__session.put(
-                urljoin(self.base_url, api_method.value)
-            ) as response:
-                print(await response.json())
-                return await response.read()
-        elif method == "DEL":
-            async with self.__session.delete(
-                urljoin(self.base_url, api_method.value)
-            ) as response:
-                print(await response.json())
-                return await response.read()
-            
+        _, _, body = await self._request(
+            method, api_method, path_params, params, retry=retry
+        )
+        return body
+
+    async def _get(
+        self,
+        api_method: APIEndpoints,
+        response_type: t.Type[T],
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        retry: t.Optional[RetryPolicy] = None,
+    ) -> T:
+        """
+        Sends a `GET` request and decodes the response.
+
+        Concurrent identical requests share one HTTP request and one decoded value, so callers
+        must not mutate what they receive. The shared request ignores the deadlines of the
+        callers, each of which waits for it until its own deadline; it is cancelled once every
+        caller has left. With `validators` set, the request is made conditional on the
+        `ETag`/`Last-Modified` of the previous response, and a `304 Not Modified` returns the
+        previously decoded value.
+
+        Args:
+            api_method (APIEndpoints): The API endpoint to send the request to.
+            response_type (Type[T]): The type to decode the response into.
+            path_params (Optional[Dict[str, str]]): Values for the placeholders of the endpoint.
+            params (Optional[Dict[str, Any]]): Query string parameters.
+            retry (Optional[RetryPolicy]): Overrides `retry_policy` for this request.
+
+        Returns:
+            T: The decoded response.
+        """
+        key = ResponseCache.key(self.cache_namespace, api_method, path_params, params)
+        limit = current_deadline()
+        try:
+            return await self._in_flight.do(
+                (key, response_type, retry),
+                lambda: without_deadline(
+                    lambda: self._fetch(key, api_method, response_type, path_params, params, retry)
+                ),
+                None if limit is None else limit.remaining,
+            )
+        except asyncio.TimeoutError as error:
+            if limit is not None and limit.expired:
+                raise DeadlineExceeded() from error
+            raise
+
+    async def _fetch(
+        self,
+        key: str,
+        api_method: APIEndpoints,
+        response_type: t.Type[T],
+        path_params: t.Optional[t.Dict[str, str]] = None,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        retry: t.Optional[RetryPolicy] = None,
+    ) -> T:
+        entry = headers = None
+        if self.validators is not None:
+            entry = self.validators.get(key)
+            if entry is not None:
+                headers = entry.headers()
 
-    async def get_shop(self) -> t.Optional[Shop]:
-        get_shop = await self._make_request("GET", APIEndpoints.GET_SHOP)
-        base = msgspec.json.decode(
-            get_shop, 
-            strict=False,
-            type=ShopInteraction
+        status, response_headers, body = await self._request(
+            "GET", api_method, path_params, params, headers, retry
         )
+        if status == 304 and entry is not None:
+            # Still fresh: cache it again, or every later request would be a conditional one.
+            if self.cache is not None:
+                self.cache.set(key, api_method, entry.body)
+            return entry.decode(response_type)
+
+        if self.instrumentation is None:
+            value = decode(body, response_type)
+        else:
+            started = time.perf_counter()
+            value = decode(body, response_type)
+            self.instrumentation.on_decode(api_method, time.perf_counter() - started, len(body))
+        # A body served by the response cache has no validators, keep those of the last response.
+        if self.validators is not None and response_headers is not _CACHED:
+            self.validators.store(key, response_headers, body, response_type, value)
+        return value
+
+    def invalidate_cache(self, *api_methods: APIEndpoints) -> None:
+        """
+        Drops the cached responses and validators of this client's account and merchant.
+
+        Args:
+            *api_methods (APIEndpoints): Only drop the responses of these endpoints.
+        """
+        for api_method in api_methods or (None,):
+            if self.cache is not None:
+                self.cache.invalidate(self.cache_namespace, api_method)
+            if self.validators is not None:
+                self.validators.invalidate(
+                    ResponseCache.prefix(self.cache_namespace, api_method)
+                )
+
+    def deadline(self, seconds: float) -> t.AsyncContextManager[Deadline]:
+        """
+        Gives every request sent within the block `seconds` to complete, all together.
+
+        The deadline covers retries, rate-limiter waits and pagination, and every request's
+        timeout is cut short so it cannot outlive it. A request which cannot complete in time
+        raises `DeadlineExceeded` instead of waiting. It also applies to other clients used
+        within the block, e.g. `async with client.deadline(2.0): ...`.
+
+        Args:
+            seconds (float): Time the block has, from now.
+
+        Returns:
+            AsyncContextManager[Deadline]: The deadline, as an async context manager.
+        """
+        return deadline(seconds)
+
+    async def get_shop(self, retry: t.Optional[RetryPolicy] = None) -> t.Optional[Shop]:
+        base = await self._get(APIEndpoints.GET_SHOP, ShopInteraction, retry=retry)
         return base.data
     
+    async def get_order(
+        self,
+        uniqid: str,
+        projection: t.Optional[t.Type[T]] = None,
+        retry: t.Optional[RetryPolicy] = None,
+    ) -> t.Optional[t.Union[Order, T]]:
+        """
+        Fetches a single order.
+
+        Args:
+            uniqid (str): The `uniqid` of the order.
+            projection (Optional[Type[T]]): Decode the order into this struct instead of
+                `Order`, e.g. `OrderSummary` or a type built with `project`.
+            retry (Optional[RetryPolicy]): Overrides `retry_policy` for this request.
+
+        Returns:
+            Optional[Union[Order, T]]: The order.
+        """
+        response_type = (
+            OrderInteraction
+            if projection is None
+            else Interaction[OrderData[projection]]  # type: ignore
+        )
+        base = await self._get(
+            APIEndpoints.GET_ORDER, response_type, path_params={"uniqid": uniqid}, retry=retry
+        )
+        return base.data.order if base.data else None
+
+    def get_orders_many(
+        self,
+        uniqids: t.Iterable[str],
+        ordered: bool = False,
+        concurrency: t.Optional[int] = None,
+        projection: t.Optional[t.Type[T]] = None,
+    ) -> t.AsyncIterator[BatchResult[str, t.Optional[t.Union[Order, T]]]]:
+        """
+        Fetches many orders concurrently.
+
+        Requests still go through the rate limiter, so the batch runs as fast as the tier
+        allows. A failing order is reported in its `BatchResult` and does not stop the batch.
+
+        Args:
+            uniqids (Iterable[str]): The `uniqid` of every order, consumed lazily.
+            ordered (bool): Yield results in the order of `uniqids` instead of as they complete.
+            concurrency (Optional[int]): Maximum amount of requests in flight. Defaults to the
+                budget of the rate limiter.
+            projection (Optional[Type[T]]): Decode every order into this struct instead of
+                `Order`.
+
+        Yields:
+            BatchResult[str, Optional[Union[Order, T]]]: The outcome of every order.
+        """
+        if concurrency is None:
+            concurrency = self.rate_limiter.limit if self.rate_limiter else 10
+        return fan_out(
+            uniqids,
+            lambda uniqid: self.get_order(uniqid, projection),
+            concurrency,
+            ordered,
+        )
+
+    async def _fetch_page(
+        self,
+        api_method: APIEndpoints,
+        key: str,
+        item_type: t.Type[T],
+        params: t.Dict[str, t.Any],
+        page: int,
+    ) -> t.List[T]:
+        base = await self._get(
+            api_method,
+            ListInteraction[item_type],  # type: ignore
+            params={**params, "page": page},
+        )
+        return (base.data or {}).get(key) or []
+
+    async def _paginate(
+        self,
+        api_method: APIEndpoints,
+        key: str,
+        item_type: t.Type[T],
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> t.AsyncIterator[T]:
+        """
+        Iterates over every item of a list endpoint, page by page.
+
+        The next page is requested as soon as the current one is received, so it downloads while
+        the caller works through the current page. At most two pages are held at once.
+
+        Args:
+            api_method (APIEndpoints): The `*_LIST` endpoint to page through.
+            key (str): The key of `data` holding the items.
+            item_type (Type[T]): The type to decode every item into.
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            T: The items of every page, in order.
+        """
+        params = dict(params or {})
+        page = 1
+        next_page = asyncio.ensure_future(
+            self._fetch_page(api_method, key, item_type, params, page)
+        )
+        try:
+            while True:
+                items = await next_page
+                if not items:
+                    return
+
+                page += 1
+                next_page = asyncio.ensure_future(
+                    self._fetch_page(api_method, key, item_type, params, page)
+                )
+                for item in items:
+                    yield item
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+
+    def iter_orders(
+        self,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        projection: t.Optional[t.Type[T]] = None,
+    ) -> t.AsyncIterator[t.Union[Order, T]]:
+        """
+        Iterates over every order of the shop.
+
+        Listings and reports rarely need the nested product, transactions and history of an
+        order; decoding pages into `OrderSummary` (or a type built with `project`) skips them.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+            projection (Optional[Type[T]]): Decode every order into this struct instead of
+                `Order`.
+
+        Yields:
+            Union[Order, T]: Every order, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_ORDER_LIST, "orders", projection or Order, params
+        )
+
+    async def export_orders(
+        self,
+        sink: BatchSink,
+        batch_size: int = 10_000,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> int:
+        """
+        Exports every order of the shop to a columnar sink, page by page.
+
+        Orders are decoded into `OrderRow` and written in batches of `batch_size`, so memory
+        use does not grow with the amount of orders.
+
+        Args:
+            sink (BatchSink): Where to write, e.g. `ParquetSink("orders.parquet")`.
+            batch_size (int): Amount of orders per batch (and Parquet row group).
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Returns:
+            int: Amount of orders exported.
+        """
+        return await export_orders(
+            self.iter_orders(params, projection=OrderRow), sink, batch_size
+        )
+
+    def iter_products(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every product of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every product, page by page.
+        """
+        return self._paginate(APIEndpoints.GET_PRODUCT_LIST, "products", dict, params)
+
+    def iter_customers(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every customer of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every customer, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_CONSTUMERS_LIST, "customers", dict, params
+        )
+
+    def iter_subscriptions(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every subscription of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every subscription, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_SUBSCRIPTION_LIST, "subscriptions", dict, params
+        )
+
+    def iter_blacklists(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every blacklisted entry of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every blacklisted entry, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_BLACKLIST_LIST, "blacklists", dict, params
+        )
+
+    def iter_whitelists(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every whitelisted entry of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every whitelisted entry, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_WHITELIST_LIST, "whitelists", dict, params
+        )
+
+    def iter_categories(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every category of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every category, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_CATEGORY_LIST, "categories", dict, params
+        )
+
+    def iter_groups(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every group of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every group, page by page.
+        """
+        return self._paginate(APIEndpoints.GET_GROUP_LIST, "groups", dict, params)
+
+    def iter_coupons(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every coupon of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every coupon, page by page.
+        """
+        return self._paginate(APIEndpoints.GET_COUPON_LIST, "coupons", dict, params)
+
+    def iter_feedback(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every feedback left on the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every feedback, page by page.
+        """
+        return self._paginate(
+            APIEndpoints.GET_FEEDBACK_LIST, "feedback", dict, params
+        )
+
+    def iter_queries(
+        self, params: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        """
+        Iterates over every query of the shop.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Extra query string parameters.
+
+        Yields:
+            Dict[str, Any]: Every query, page by page.
+        """
+        return self._paginate(APIEndpoints.GET_QUERY_LIST, "queries", dict, params)
+
     async def close(self):
-        await self.__session.close()
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def __aenter__(self) -> "SellixClientX":
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
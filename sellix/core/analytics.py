@@ -0,0 +1,248 @@
+from ..abc.modals import Order
+from ..abc.projection import project
+from .export import DictionaryColumn
+
+import array
+import datetime
+import math
+import msgspec
+import typing as t
+
+AnalyticsRow = project(
+    Order,
+    (
+        "uniqid",
+        "total",
+        "currency",
+        "exchange_rate",
+        "rates_snapshot",
+        "fee_breakdown",
+        "gateway",
+        "product_id",
+        "created_at",
+    ),
+    name="AnalyticsRow",
+)
+"""The projection of `Order` holding every field `RevenueAnalytics` reads."""
+
+GROUPS = ("day", "gateway", "currency", "product")
+"""The keys revenue can be grouped by."""
+
+_FEES = ("service_fee", "aml_analysis", "platform_fee")
+
+
+class Revenue(msgspec.Struct):
+    """The revenue of a group of orders, in USD."""
+
+    key: t.Any
+    """The group, e.g. a gateway or a `datetime.date`. `None` gathers orders missing it."""
+
+    orders: int
+    """Amount of orders."""
+
+    gross: float
+    """Sum of the order totals."""
+
+    fees: float
+    """Sum of the fees Sellix charged."""
+
+    @property
+    def net(self) -> float:
+        """Gross revenue minus fees."""
+        return self.gross - self.fees
+
+
+def _usd_rate(order: t.Any) -> float:
+    """Returns what one unit of the order's currency was worth in USD, NaN if unknown."""
+    if order.exchange_rate:
+        return order.exchange_rate
+    if order.currency == "USD":
+        return 1.0
+    rate = (order.rates_snapshot or {}).get(order.currency)
+    return 1 / float(rate) if rate else math.nan
+
+
+def _fees(order: t.Any) -> float:
+    breakdown = order.fee_breakdown
+    if breakdown is None:
+        return 0.0
+    total = 0.0
+    for name in _FEES:
+        fee = getattr(breakdown, name)
+        if fee is not None and fee.amount:
+            total += fee.amount
+    return total
+
+
+def _numpy() -> t.Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class RevenueAnalytics:
+    """
+    Aggregates the revenue of many orders.
+
+    Orders are flattened into columns as they are added: USD amounts in `array`s and the
+    group keys as dictionary codes. Grouping then works on whole columns, with
+    `numpy.bincount` when NumPy is installed, instead of walking the orders again. Adding stays
+    cheap, so one instance can be fed by a sync and re-aggregated every few minutes.
+
+    Amounts are converted to USD with the order's `exchange_rate`, falling back on its
+    `rates_snapshot`. Orders whose rate is unknown are counted but add no revenue.
+
+    Args:
+        orders: Orders to start with, e.g. decoded into `AnalyticsRow`.
+    """
+
+    __slots__ = ("gross", "fees", "days", "_keys")
+
+    def __init__(self, orders: t.Iterable[t.Any] = ()) -> None:
+        self.gross = array.array("d")
+        """The USD total of every order, NaN when unknown."""
+
+        self.fees = array.array("d")
+        """The USD fees of every order, NaN when unknown."""
+
+        self.days = array.array("q")
+        """The UTC day of every order, as days since the epoch, `-1` when unknown."""
+
+        self._keys = {name: DictionaryColumn([], {}) for name in GROUPS[1:]}
+        self.extend(orders)
+
+    def __len__(self) -> int:
+        return len(self.gross)
+
+    def add(self, order: t.Any) -> None:
+        """
+        Adds an order.
+
+        Args:
+            order: An `Order`, or any projection of it holding the fields of `AnalyticsRow`.
+        """
+        rate = _usd_rate(order)
+        self.gross.append((order.total or 0.0) * rate)
+        self.fees.append(_fees(order) * rate)
+        self.days.append(order.created_at // 86400 if order.created_at is not None else -1)
+        self._keys["gateway"].append(order.gateway)
+        self._keys["currency"].append(order.currency)
+        self._keys["product"].append(order.product_id)
+
+    def extend(self, orders: t.Iterable[t.Any]) -> None:
+        """
+        Adds many orders.
+
+        Args:
+            orders: The orders to add.
+        """
+        for order in orders:
+            self.add(order)
+
+    async def consume(self, orders: t.AsyncIterable[t.Any]) -> None:
+        """
+        Adds every order of a stream.
+
+        Args:
+            orders: The orders, e.g. `client.iter_orders(projection=AnalyticsRow)`.
+        """
+        async for order in orders:
+            self.add(order)
+
+    def total(self) -> Revenue:
+        """
+        Sums the revenue of every order.
+
+        Returns:
+            Revenue: The revenue, keyed `None`.
+        """
+        np = _numpy()
+        if np is not None:
+            gross = np.frombuffer(self.gross, dtype=np.float64)
+            fees = np.frombuffer(self.fees, dtype=np.float64)
+            return Revenue(None, len(self), float(np.nansum(gross)), float(np.nansum(fees)))
+        return Revenue(
+            None,
+            len(self),
+            math.fsum(value for value in self.gross if value == value),
+            math.fsum(value for value in self.fees if value == value),
+        )
+
+    def by(self, group: str) -> t.List[Revenue]:
+        """
+        Groups the revenue of every order.
+
+        Args:
+            group: One of `GROUPS`: `"day"`, `"gateway"`, `"currency"` or `"product"`.
+
+        Returns:
+            List[Revenue]: The revenue of every group, in order of first appearance (by date for
+                `"day"`). Orders missing the key are gathered under `None`, listed first.
+        """
+        labels: t.List[t.Any]
+        if group == "day":
+            codes, labels = self._day_codes()
+            shift = 0
+        elif group in self._keys:
+            column = self._keys[group]
+            # Nulls are coded -1, shifting by one makes every code a valid index of the labels.
+            codes, labels = column.codes, [None, *column.dictionary]
+            shift = 1
+        else:
+            raise ValueError(f"group must be one of {', '.join(GROUPS)}, not {group!r}")
+
+        np = _numpy()
+        if np is not None:
+            return self._by_numpy(np, codes, shift, labels)
+
+        size = len(labels)
+        counts, gross, fees = [0] * size, [0.0] * size, [0.0] * size
+        for code, order_gross, order_fees in zip(codes, self.gross, self.fees):
+            code += shift
+            counts[code] += 1
+            if order_gross == order_gross:
+                gross[code] += order_gross
+                fees[code] += order_fees
+        return [
+            Revenue(labels[code], counts[code], gross[code], fees[code])
+            for code in range(size)
+            if counts[code]
+        ]
+
+    def _by_numpy(
+        self, np: t.Any, codes: array.array, shift: int, labels: t.List[t.Any]
+    ) -> t.List[Revenue]:
+        indices = np.frombuffer(codes, dtype=np.dtype(codes.typecode)) + shift
+        gross = np.frombuffer(self.gross, dtype=np.float64)
+        fees = np.frombuffer(self.fees, dtype=np.float64)
+        known = ~np.isnan(gross)
+        size = len(labels)
+        counts = np.bincount(indices, minlength=size)
+        gross_sums = np.bincount(indices[known], weights=gross[known], minlength=size)
+        fee_sums = np.bincount(indices[known], weights=fees[known], minlength=size)
+        return [
+            Revenue(
+                labels[code], int(counts[code]), float(gross_sums[code]), float(fee_sums[code])
+            )
+            for code in np.flatnonzero(counts)
+        ]
+
+    def _day_codes(self) -> t.Tuple[array.array, t.List[t.Optional[datetime.date]]]:
+        """Codes every order by day, in date order, with unknown days first."""
+        epoch = datetime.date(1970, 1, 1)
+        np = _numpy()
+        if np is not None:
+            days, inverse = np.unique(
+                np.frombuffer(self.days, dtype=np.int64), return_inverse=True
+            )
+            codes = array.array("q", inverse.astype(np.int64).tobytes())
+        else:
+            days = sorted(set(self.days))
+            index = {day: code for code, day in enumerate(days)}
+            codes = array.array("q", (index[day] for day in self.days))
+        labels = [
+            None if day < 0 else epoch + datetime.timedelta(days=int(day)) for day in days
+        ]
+        return codes, labels
@@ -0,0 +1,104 @@
+import asyncio
+import msgspec
+import typing as t
+
+K = t.TypeVar("K")
+T = t.TypeVar("T")
+
+
+class BatchResult(msgspec.Struct, t.Generic[K, T]):
+    """The outcome of one item of a batch request."""
+
+    key: K
+    """The key the item was requested with, e.g. an order `uniqid`."""
+
+    value: t.Optional[T] = None
+    """The fetched item, `None` if the request failed."""
+
+    error: t.Optional[BaseException] = None
+    """The exception the request raised, if any."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was fetched successfully."""
+        return self.error is None
+
+
+async def fan_out(
+    keys: t.Iterable[K],
+    fetch: t.Callable[[K], t.Awaitable[T]],
+    concurrency: int,
+    ordered: bool = False,
+) -> t.AsyncIterator[BatchResult[K, T]]:
+    """
+    Runs `fetch` for every key with at most `concurrency` calls in flight.
+
+    Keys are consumed lazily and a failing call is reported in its `BatchResult` instead of
+    cancelling the others. A slot is only freed once its result has been yielded, so a slow
+    consumer (or, when `ordered`, a slow early item) holds back new calls rather than letting
+    results pile up.
+
+    Args:
+        keys: The keys to fetch.
+        fetch: Coroutine function fetching a single key.
+        concurrency: Maximum amount of calls in flight.
+        ordered: Yield results in the order of `keys` instead of as they complete.
+
+    Yields:
+        BatchResult: The outcome of every key.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+
+    window = asyncio.Semaphore(concurrency)
+    completed: asyncio.Queue = asyncio.Queue()
+    running: t.Set[asyncio.Task] = set()
+
+    async def run(index: int, key: K) -> None:
+        try:
+            result = BatchResult(key, await fetch(key))
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            result = BatchResult(key, error=error)
+        completed.put_nowait((index, result))
+
+    async def feed() -> None:
+        index = -1
+        try:
+            for index, key in enumerate(keys):
+                await window.acquire()
+                task = asyncio.ensure_future(run(index, key))
+                running.add(task)
+                task.add_done_callback(running.discard)
+        finally:
+            completed.put_nowait((index + 1, None))
+
+    feeder = asyncio.ensure_future(feed())
+    pending: t.Dict[int, BatchResult[K, T]] = {}
+    total: t.Optional[int] = None
+    yielded = 0
+    try:
+        while total is None or yielded < total:
+            index, result = await completed.get()
+            if result is None:
+                total = index
+                feeder.result()
+                continue
+
+            if not ordered:
+                yielded += 1
+                yield result
+                window.release()
+                continue
+
+            pending[index] = result
+            while yielded in pending:
+                result = pending.pop(yielded)
+                yielded += 1
+                yield result
+                window.release()
+    finally:
+        feeder.cancel()
+        for task in list(running):
+            task.cancel()
@@ -0,0 +1,242 @@
+from ..enums.genric import APIEndpoints, CircuitState
+from .exceptions import CircuitOpenException, HTTPException
+from .retry import TRANSIENT_EXCEPTIONS
+
+import collections
+import time
+import typing as t
+
+
+def is_failure(error: BaseException) -> bool:
+    """
+    Tells whether an error means the API itself is failing.
+
+    Server errors (`5xx`) and `TRANSIENT_EXCEPTIONS` count as failures; client errors such as
+    `404` or `429` are answers from a healthy API and do not.
+
+    Args:
+        error: The exception a request raised.
+
+    Returns:
+        bool: Whether the error counts against the circuit.
+    """
+    if isinstance(error, HTTPException):
+        return error.status >= 500
+    return isinstance(error, TRANSIENT_EXCEPTIONS)
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to an endpoint while it is failing or too slow.
+
+    The outcomes of the last `window` calls are tracked. Once at least `min_calls` are known,
+    the circuit opens when the share of failures reaches `error_rate` or the share of calls
+    slower than `slow_call` reaches `slow_rate`. An open circuit rejects calls for `open_for`
+    seconds, then turns half-open and lets `probes` calls through: the circuit closes again if
+    all of them succeed in time, and reopens as soon as one fails or is slow.
+
+    Args:
+        name: Name of the guarded endpoint, used in `CircuitOpenException`.
+        window: Amount of recent calls the rates are computed over.
+        min_calls: Calls needed in the window before the circuit may open.
+        error_rate: Share of failed calls opening the circuit.
+        slow_call: Seconds after which a call counts as slow.
+        slow_rate: Share of slow calls opening the circuit.
+        open_for: Seconds the circuit stays open before probing.
+        probes: Calls let through, one after the other, while half-open.
+        clock: Monotonic clock used for `open_for`.
+    """
+
+    __slots__ = (
+        "name",
+        "window",
+        "min_calls",
+        "error_rate",
+        "slow_call",
+        "slow_rate",
+        "open_for",
+        "probes",
+        "_clock",
+        "_state",
+        "_opened_at",
+        "_outcomes",
+        "_failures",
+        "_slow",
+        "_probing",
+        "_probed",
+        "opened",
+        "rejected",
+    )
+
+    def __init__(
+        self,
+        name: str = "",
+        window: int = 20,
+        min_calls: int = 10,
+        error_rate: float = 0.5,
+        slow_call: float = 5.0,
+        slow_rate: float = 0.8,
+        open_for: float = 30.0,
+        probes: int = 1,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window <= 0 or probes <= 0:
+            raise ValueError("window and probes must be positive integers")
+
+        self.name = name
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.error_rate = error_rate
+        self.slow_call = slow_call
+        self.slow_rate = slow_rate
+        self.open_for = open_for
+        self.probes = probes
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._outcomes: t.Deque[t.Tuple[bool, bool]] = collections.deque()
+        self._failures = 0
+        self._slow = 0
+        self._probing = False
+        self._probed = 0
+
+        self.opened = 0
+        """Amount of times the circuit opened."""
+
+        self.rejected = 0
+        """Amount of calls rejected while the circuit was not closed."""
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, an open circuit turning half-open once `open_for` is over."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_for
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probing = False
+            self._probed = 0
+        return self._state
+
+    def allow(self) -> None:
+        """
+        Lets a call through, or rejects it.
+
+        Every allowed call must be followed by `record` or `cancel`.
+
+        Raises:
+            CircuitOpenException: The circuit is open, or half-open with a probe in flight.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+
+        self.rejected += 1
+        retry_after = None
+        if state is CircuitState.OPEN:
+            retry_after = max(0.0, self._opened_at + self.open_for - self._clock())
+        raise CircuitOpenException(self.name, retry_after)
+
+    def record(self, failed: bool, latency: float) -> None:
+        """
+        Records the outcome of an allowed call.
+
+        Args:
+            failed: Whether the call failed, see `is_failure`.
+            latency: Seconds the call took.
+        """
+        slow = latency >= self.slow_call
+        if self._state is CircuitState.HALF_OPEN:
+            self._probing = False
+            if failed or slow:
+                self._open()
+            else:
+                self._probed += 1
+                if self._probed >= self.probes:
+                    self._close()
+            return
+        if self._state is CircuitState.OPEN:
+            # A call allowed before the circuit opened.
+            return
+
+        outcomes = self._outcomes
+        if len(outcomes) == self.window:
+            old_failed, old_slow = outcomes.popleft()
+            self._failures -= old_failed
+            self._slow -= old_slow
+        outcomes.append((failed, slow))
+        self._failures += failed
+        self._slow += slow
+
+        calls = len(outcomes)
+        if calls >= self.min_calls and (
+            self._failures >= self.error_rate * calls or self._slow >= self.slow_rate * calls
+        ):
+            self._open()
+
+    def cancel(self) -> None:
+        """Forgets an allowed call which ended without an outcome, e.g. was cancelled."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probing = False
+
+    def reset(self) -> None:
+        """Closes the circuit and forgets every outcome."""
+        self._close()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+        self.opened += 1
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures = self._slow = 0
+        self._probing = False
+        self._probed = 0
+
+
+class CircuitBreakers:
+    """
+    One `CircuitBreaker` per endpoint, created on first use.
+
+    Endpoints degrade independently (a slow order list should not stop shop lookups), so each
+    gets its own circuit. Share one instance between clients to share the circuits.
+
+    Args:
+        **settings: Settings of every breaker, named as in `CircuitBreaker`.
+    """
+
+    __slots__ = ("settings", "_breakers")
+
+    def __init__(self, **settings: t.Any) -> None:
+        CircuitBreaker(**settings)  # Validates the settings straight away.
+        self.settings = settings
+        self._breakers: t.Dict[APIEndpoints, CircuitBreaker] = {}
+
+    def __iter__(self) -> t.Iterator[t.Tuple[APIEndpoints, CircuitBreaker]]:
+        return iter(list(self._breakers.items()))
+
+    def get(self, api_method: APIEndpoints) -> CircuitBreaker:
+        """
+        Returns the breaker of an endpoint.
+
+        Args:
+            api_method: The endpoint.
+
+        Returns:
+            CircuitBreaker: Its breaker.
+        """
+        breaker = self._breakers.get(api_method)
+        if breaker is None:
+            breaker = self._breakers[api_method] = CircuitBreaker(api_method.name, **self.settings)
+        return breaker
+
+    def reset(self) -> None:
+        """Closes every circuit."""
+        for breaker in self._breakers.values():
+            breaker.reset()
@@ -0,0 +1,489 @@
+from ..enums.genric import APIEndpoints
+from .decoders import decode
+
+import collections
+import hashlib
+import os
+import struct
+import tempfile
+import time
+import typing as t
+
+
+class CacheBackend:
+    """
+    Base class for the storages of `ResponseCache`.
+
+    Keys are strings and values raw response bodies. Expired entries must never be returned.
+    """
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        """
+        Looks an entry up.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            Optional[bytes]: The stored body, `None` if missing or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Stores an entry.
+
+        Args:
+            key: The key of the entry.
+            value: The body to store.
+            ttl: Seconds the entry stays valid.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Removes an entry, if present.
+
+        Args:
+            key: The key of the entry.
+        """
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Removes every entry whose key starts with `prefix`.
+
+        Args:
+            prefix: The prefix to match, `""` clears the whole storage.
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    An in-memory LRU storage.
+
+    Args:
+        maxsize: Maximum amount of entries, the least recently used one is evicted first.
+        clock: Monotonic clock used for expiry.
+    """
+
+    __slots__ = ("maxsize", "_entries", "_clock")
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._entries: t.OrderedDict[str, t.Tuple[float, bytes]] = (
+            collections.OrderedDict()
+        )
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+
+class DiskCache(CacheBackend):
+    """
+    An on-disk storage keeping one file per entry, so cached responses survive restarts.
+
+    Every file holds its expiry (wall-clock time), its key and the body. Files are written to a
+    temporary name and renamed into place, so readers never see a partial entry.
+
+    Args:
+        directory: Directory the entries are stored in, created if missing.
+    """
+
+    __slots__ = ("directory",)
+
+    _HEADER = struct.Struct("<dI")
+
+    def __init__(self, directory: t.Union[str, os.PathLike]) -> None:
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, hashlib.sha256(key.encode()).hexdigest() + ".entry"
+        )
+
+    def _read(self, path: str) -> t.Optional[t.Tuple[float, str, bytes]]:
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        # A truncated or corrupt entry, e.g. written by another program, is a miss.
+        start = self._HEADER.size
+        try:
+            expires_at, key_size = self._HEADER.unpack_from(data)
+            if len(data) < start + key_size:
+                raise ValueError("truncated entry")
+            key = data[start : start + key_size].decode()
+        except (struct.error, ValueError):
+            self._remove(path)
+            return None
+        return expires_at, key, data[start + key_size :]
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        path = self._path(key)
+        entry = self._read(path)
+        if entry is None or entry[1] != key:
+            return None
+
+        expires_at, _, value = entry
+        if expires_at <= time.time():
+            self._remove(path)
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        encoded_key = key.encode()
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(self._HEADER.pack(time.time() + ttl, len(encoded_key)))
+                file.write(encoded_key)
+                file.write(value)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            self._remove(temporary)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+
+    def delete_prefix(self, prefix: str) -> None:
+        for path in self._entries():
+            entry = self._read(path)
+            if entry is not None and entry[1].startswith(prefix):
+                self._remove(path)
+
+    def prune(self) -> None:
+        """Removes every expired entry."""
+        now = time.time()
+        for path in self._entries():
+            entry = self._read(path)
+            if entry is not None and entry[0] <= now:
+                self._remove(path)
+
+    def _entries(self) -> t.List[str]:
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".entry")
+        ]
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+DEFAULT_TTLS: t.Dict[APIEndpoints, float] = {
+    APIEndpoints.GET_SHOP: 300.0,
+    APIEndpoints.GET_PRODUCT: 60.0,
+    APIEndpoints.GET_PRODUCT_LIST: 60.0,
+    APIEndpoints.GET_CATEGORY: 300.0,
+    APIEndpoints.GET_CATEGORY_LIST: 300.0,
+    APIEndpoints.GET_GROUP: 300.0,
+    APIEndpoints.GET_GROUP_LIST: 300.0,
+    APIEndpoints.GET_COUPON: 300.0,
+    APIEndpoints.GET_COUPON_LIST: 300.0,
+}
+"""Default time to live, in seconds, of the endpoints cached by `ResponseCache`."""
+
+
+class ResponseCache:
+    """
+    Caches the bodies of `GET` responses per endpoint, path parameters, query and namespace.
+
+    The namespace of a client, see `namespace`, covers its API key and merchant, so clients of
+    different accounts sharing a cache, or a `DiskCache` directory, never see each other's
+    responses.
+
+    Only endpoints with a time to live are cached, by default the shop and the rarely changing
+    catalog endpoints (`DEFAULT_TTLS`); orders, customers and the like always hit the API.
+
+    Args:
+        backend: Where entries are stored, an in-memory LRU if not given.
+        ttls: Time to live of every cached endpoint, in seconds. Replaces `DEFAULT_TTLS`.
+    """
+
+    __slots__ = ("backend", "ttls")
+
+    def __init__(
+        self,
+        backend: t.Optional[CacheBackend] = None,
+        ttls: t.Optional[t.Mapping[APIEndpoints, float]] = None,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls: t.Dict[APIEndpoints, float] = dict(
+            DEFAULT_TTLS if ttls is None else ttls
+        )
+
+    @staticmethod
+    def namespace(auth_key: str, merchant_id: t.Optional[str] = None) -> str:
+        """
+        Builds the namespace of the responses an API key may read for a merchant.
+
+        The key is reduced to a digest, so it is never stored along with the entries.
+
+        Args:
+            auth_key: The API key of the client.
+            merchant_id: The merchant, `None` for a client without `merchant_id`.
+
+        Returns:
+            str: The namespace.
+        """
+        digest = hashlib.sha256(auth_key.encode()).hexdigest()[:32]
+        return f"{digest}/{merchant_id or ''}"
+
+    @staticmethod
+    def key(
+        namespace: str,
+        api_method: APIEndpoints,
+        path_params: t.Optional[t.Mapping[str, t.Any]] = None,
+        params: t.Optional[t.Mapping[str, t.Any]] = None,
+    ) -> str:
+        """
+        Builds the key of a request.
+
+        Keys start with the namespace and the endpoint, so both can be invalidated by prefix.
+
+        Args:
+            namespace: The namespace of the client, built by `namespace`.
+            api_method: The requested endpoint.
+            path_params: Values of the placeholders of the endpoint.
+            params: Query string parameters.
+
+        Returns:
+            str: The key.
+        """
+        key = ResponseCache.prefix(namespace, api_method)
+        if path_params:
+            key += "&".join(f"{name}={path_params[name]}" for name in sorted(path_params))
+        key += "?"
+        if params:
+            key += "&".join(f"{name}={params[name]}" for name in sorted(params))
+        return key
+
+    @staticmethod
+    def prefix(
+        namespace: str,
+        api_method: t.Optional[APIEndpoints] = None,
+    ) -> str:
+        """
+        Builds the prefix shared by the keys of a namespace, or of one of its endpoints.
+
+        Args:
+            namespace: The namespace, built by `namespace`.
+            api_method: Narrow the prefix to this endpoint.
+
+        Returns:
+            str: The prefix.
+        """
+        prefix = f"{namespace}|"
+        if api_method is not None:
+            prefix += f"{api_method.name}|"
+        return prefix
+
+    def ttl(self, api_method: APIEndpoints) -> t.Optional[float]:
+        """
+        Returns the time to live of an endpoint, `None` if it is not cached.
+
+        Args:
+            api_method: The endpoint.
+        """
+        return self.ttls.get(api_method)
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        """
+        Returns a cached body.
+
+        Args:
+            key: The key built by `key`.
+        """
+        return self.backend.get(key)
+
+    def set(self, key: str, api_method: APIEndpoints, value: bytes) -> None:
+        """
+        Caches a body, if its endpoint is cached.
+
+        Args:
+            key: The key built by `key`.
+            api_method: The endpoint the body was returned by.
+            value: The body.
+        """
+        ttl = self.ttls.get(api_method)
+        if ttl is not None and ttl > 0:
+            self.backend.set(key, value, ttl)
+
+    def invalidate(
+        self,
+        namespace: str,
+        api_method: t.Optional[APIEndpoints] = None,
+    ) -> None:
+        """
+        Drops the cached responses of a namespace.
+
+        Args:
+            namespace: The namespace, built by `namespace`.
+            api_method: Only drop the responses of this endpoint.
+        """
+        self.backend.delete_prefix(self.prefix(namespace, api_method))
+
+    def clear(self) -> None:
+        """Drops every cached response."""
+        self.backend.delete_prefix("")
+
+
+class Validated:
+    """A response stored by `ValidatorCache`, along with its decoded forms."""
+
+    __slots__ = ("etag", "last_modified", "body", "values")
+
+    def __init__(
+        self,
+        etag: t.Optional[str],
+        last_modified: t.Optional[str],
+        body: bytes,
+    ) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.values: t.Dict[t.Any, t.Any] = {}
+
+    def headers(self) -> t.Dict[str, str]:
+        """Returns the headers making a request conditional on this response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def decode(self, response_type: t.Any) -> t.Any:
+        """
+        Returns the body decoded as `response_type`, decoding it only once per type.
+
+        Args:
+            response_type: The type to decode the body into.
+        """
+        try:
+            return self.values[response_type]
+        except KeyError:
+            value = decode(self.body, response_type)
+            self.values[response_type] = value
+            return value
+
+
+class ValidatorCache:
+    """
+    Remembers the `ETag` and `Last-Modified` validators of `GET` responses together with their
+    body and decoded value, so the client can revalidate with a conditional request and reuse
+    the decoded value on `304 Not Modified`.
+
+    Unlike `ResponseCache`, entries never expire: every use costs a request, but an unchanged
+    resource costs neither a body download nor a decode.
+
+    Args:
+        maxsize: Maximum amount of responses kept, the least recently used one is evicted first.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._entries: t.OrderedDict[str, Validated] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> t.Optional[Validated]:
+        """
+        Looks a response up.
+
+        Args:
+            key: The key of the request, as built by `ResponseCache.key`.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(
+        self,
+        key: str,
+        headers: t.Mapping[str, str],
+        body: bytes,
+        response_type: t.Any,
+        value: t.Any,
+    ) -> None:
+        """
+        Stores a response, if it carries a validator.
+
+        Args:
+            key: The key of the request, as built by `ResponseCache.key`.
+            headers: The headers of the response.
+            body: The body of the response.
+            response_type: The type the body was decoded into.
+            value: The decoded body.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            self._entries.pop(key, None)
+            return
+
+        entry = Validated(etag, last_modified, body)
+        entry.values[response_type] = value
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Drops the responses whose key starts with `prefix`.
+
+        Args:
+            prefix: The prefix to match, `""` drops everything.
+        """
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
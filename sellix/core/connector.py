@@ -0,0 +1,78 @@
+import aiohttp
+import typing as t
+
+
+class ConnectorPool:
+    """
+    A `TCPConnector` shared between many `SellixClientX` instances.
+
+    Every client keeps its own session (and so its own `X-Sellix-Merchant` header), but their
+    sessions borrow connections from this pool, so N merchants reuse one set of keep-alive TLS
+    connections and one DNS cache instead of N.
+
+    The connector is created on first use, inside the running event loop.
+
+    Args:
+        limit: Maximum amount of open connections, `0` for no limit.
+        limit_per_host: Maximum amount of open connections to the same host, `0` for no limit.
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        ttl_dns_cache: Seconds DNS lookups are cached for, `None` to cache forever.
+        enable_cleanup_closed: Abort TLS connections the server did not shut down cleanly.
+    """
+
+    __slots__ = (
+        "limit",
+        "limit_per_host",
+        "keepalive_timeout",
+        "ttl_dns_cache",
+        "enable_cleanup_closed",
+        "_connector",
+    )
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: t.Optional[int] = 300,
+        enable_cleanup_closed: bool = True,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.enable_cleanup_closed = enable_cleanup_closed
+        self._connector: t.Optional[aiohttp.TCPConnector] = None
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """The shared connector, created on first access."""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+                enable_cleanup_closed=self.enable_cleanup_closed,
+            )
+        return self._connector
+
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Opens a session borrowing connections from the pool.
+
+        Closing the session leaves the pool open. The session has no default headers: aiohttp
+        folds them into the key connections are pooled by, so per-merchant headers must be
+        sent with each request for connections to be shared.
+
+        Returns:
+            aiohttp.ClientSession: The new session.
+        """
+        return aiohttp.ClientSession(connector=self.connector, connector_owner=False)
+
+    async def close(self) -> None:
+        """Closes every connection of the pool."""
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
@@ -0,0 +1,208 @@
+from ..abc.subtype import PriceConversions, ProductVariant
+from ..enums.caller import Currency
+from .errors import CryptoGateway
+
+import array
+import math
+import msgspec
+import statistics
+import typing as t
+
+Code = t.Union[Currency, CryptoGateway, str]
+"""A fiat currency or crypto gateway, as an enum member or its code."""
+
+_FIAT = tuple(enumerate(currency.value for currency in Currency))
+
+
+def _code(code: Code) -> str:
+    return code if isinstance(code, str) else code.value
+
+
+class _PricedProduct(msgspec.Struct):
+    """The fields of a listed product a `ConversionTable` reads."""
+
+    uniqid: t.Optional[str] = None
+    price: t.Optional[float] = None
+    price_conversions: t.Optional[PriceConversions] = None
+    product_variants: t.Optional[t.List[ProductVariant]] = None
+
+
+def _numpy() -> t.Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ConversionTable:
+    """
+    The converted prices of a whole catalog, laid out as one table.
+
+    Every price gets a row and every currency a column: the `Currency` codes first, then the
+    `CryptoGateway` codes, then any other crypto code found. Values are kept row-major in a
+    single `array`, so the prices of the whole catalog in one currency are a strided slice
+    rather than a walk through every `PriceConversions`.
+
+    Prices are assumed to share one currency, the shop's, which is what Sellix converts from.
+
+    Args:
+        entries: `(key, price, conversions)` for every price, the key identifying it later.
+    """
+
+    __slots__ = ("columns", "keys", "prices", "values", "_rows", "_rates")
+
+    def __init__(
+        self,
+        entries: t.Iterable[t.Tuple[t.Hashable, t.Optional[float], t.Optional[PriceConversions]]],
+    ) -> None:
+        entries = list(entries)
+        codes = [currency.value for currency in Currency]
+        codes += [gateway.value for gateway in CryptoGateway]
+        known = set(codes)
+        codes += sorted(
+            {
+                code
+                for _, _, conversions in entries
+                if conversions is not None and conversions.crypto
+                for code in conversions.crypto
+            }
+            - known
+        )
+
+        self.columns: t.Dict[str, int] = {code: index for index, code in enumerate(codes)}
+        """The column of every currency code."""
+
+        self.keys: t.List[t.Hashable] = [key for key, _, _ in entries]
+        """The key of every row."""
+
+        self.prices = array.array(
+            "d", (math.nan if price is None else price for _, price, _ in entries)
+        )
+        """The unconverted price of every row, NaN when unknown."""
+
+        width = len(codes)
+        self.values = array.array("d", [math.nan]) * (width * len(entries))
+        """Every converted price, row-major, NaN when unknown."""
+
+        for row, (_, _, conversions) in enumerate(entries):
+            if conversions is None:
+                continue
+            base = row * width
+            for column, code in _FIAT:
+                value = getattr(conversions, code)
+                if value is not None:
+                    self.values[base + column] = value
+            for code, value in (conversions.crypto or {}).items():
+                self.values[base + self.columns[code]] = value
+
+        self._rows = {key: row for row, key in enumerate(self.keys)}
+        self._rates: t.Dict[str, float] = {}
+
+    @classmethod
+    def from_products(cls, products: t.Iterable[t.Any]) -> "ConversionTable":
+        """
+        Builds the table of a catalog.
+
+        Args:
+            products: Products with `uniqid`, `price`, `price_conversions` and optionally
+                `product_variants`, as structs or as the mappings `iter_products` yields.
+
+        Returns:
+            ConversionTable: A row keyed by the product's `uniqid` for every product, and one
+                keyed by `(uniqid, title)` for every variant.
+        """
+        entries: t.List[t.Tuple[t.Hashable, t.Optional[float], t.Any]] = []
+        for product in products:
+            if isinstance(product, t.Mapping):
+                product = msgspec.convert(product, _PricedProduct, strict=False)
+            entries.append((product.uniqid, product.price, product.price_conversions))
+            for variant in getattr(product, "product_variants", None) or ():
+                entries.append(
+                    ((product.uniqid, variant.title), variant.price, variant.price_conversions)
+                )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def index(self, code: Code) -> int:
+        """
+        Looks the column of a currency up.
+
+        Args:
+            code: The currency, e.g. `Currency.EURO`, `CryptoGateway.Tether_USD` or `"BTC"`.
+
+        Returns:
+            int: The column.
+
+        Raises:
+            KeyError: No price of the table was converted into the currency.
+        """
+        return self.columns[_code(code)]
+
+    def column(self, code: Code) -> array.array:
+        """
+        Returns the converted prices of every row in one currency.
+
+        Args:
+            code: The currency.
+
+        Returns:
+            array.array: The price of every row, in the order of `keys`, NaN when unknown.
+        """
+        return self.values[self.index(code) :: len(self.columns)]
+
+    def get(self, key: t.Hashable, code: Code) -> t.Optional[float]:
+        """
+        Looks a single converted price up.
+
+        Args:
+            key: The key of the row.
+            code: The currency.
+
+        Returns:
+            Optional[float]: The price, `None` if unknown.
+        """
+        value = self.values[self._rows[key] * len(self.columns) + self.index(code)]
+        return None if math.isnan(value) else value
+
+    def rate(self, code: Code) -> float:
+        """
+        Derives the exchange rate into a currency from the converted prices.
+
+        Args:
+            code: The currency.
+
+        Returns:
+            float: What one unit of the catalog's currency is worth in `code`, the median over
+                every row, NaN if no row was converted into it.
+        """
+        code = _code(code)
+        rate = self._rates.get(code)
+        if rate is None:
+            ratios = [
+                value / price
+                for value, price in zip(self.column(code), self.prices)
+                if price and not (math.isnan(value) or math.isnan(price))
+            ]
+            rate = self._rates[code] = statistics.median(ratios) if ratios else math.nan
+        return rate
+
+    def convert(self, prices: t.Iterable[float], code: Code) -> t.Any:
+        """
+        Converts many prices of the catalog's currency at once.
+
+        Args:
+            prices: The prices, e.g. a cart or a whole price list.
+            code: The currency to convert into.
+
+        Returns:
+            The converted prices, as a `numpy.ndarray` if NumPy is installed and an
+                `array.array` otherwise.
+        """
+        rate = self.rate(code)
+        np = _numpy()
+        if np is not None:
+            return np.asarray(prices, dtype=np.float64) * rate
+        return array.array("d", (price * rate for price in prices))
@@ -0,0 +1,59 @@
+from ..abc.interaction import (
+    ShopInteraction,
+    OrderInteraction,
+    ListInteraction,
+    ErrorInteraction,
+)
+from ..abc.modals import Order
+
+import msgspec
+import typing as t
+
+T = t.TypeVar("T")
+
+_DECODERS: t.Dict[t.Any, msgspec.json.Decoder] = {}
+
+
+def get_decoder(response_type: t.Type[T]) -> "msgspec.json.Decoder[T]":
+    """
+    Returns the shared decoder of a type, building it on first use.
+
+    Every response type gets exactly one `Decoder`, built the first time it is needed, instead
+    of passing `type=` to `msgspec.json.decode` on every call.
+
+    Args:
+        response_type: The type to decode into.
+
+    Returns:
+        msgspec.json.Decoder: A non-strict decoder for `response_type`.
+    """
+    try:
+        return _DECODERS[response_type]
+    except KeyError:
+        decoder = _DECODERS[response_type] = msgspec.json.Decoder(
+            response_type, strict=False
+        )
+        return decoder
+
+
+def decode(body: bytes, response_type: t.Type[T]) -> T:
+    """
+    Decodes a response body with the shared decoder of `response_type`.
+
+    Args:
+        body: The JSON body.
+        response_type: The type to decode into.
+
+    Returns:
+        T: The decoded body.
+    """
+    return get_decoder(response_type).decode(body)
+
+
+for _response_type in (
+    ShopInteraction,
+    OrderInteraction,
+    ListInteraction[Order],
+    ErrorInteraction,
+):
+    get_decoder(_response_type)
@@ -0,0 +1,87 @@
+import collections
+import time
+import typing as t
+
+
+class DedupIndex:
+    """
+    A bounded, time-windowed set of recently seen keys.
+
+    Keys are kept in insertion order, so expired ones are always at the front and evicting them
+    is O(1) per key. A key is remembered for `window` seconds, and at most `maxsize` keys are
+    kept, the oldest being forgotten first; memory is bounded by whichever limit is hit first.
+
+    Args:
+        window: Seconds a key is remembered.
+        maxsize: Maximum amount of keys remembered.
+        clock: Monotonic clock used for expiry.
+    """
+
+    __slots__ = ("window", "maxsize", "_clock", "_seen", "dropped")
+
+    def __init__(
+        self,
+        window: float = 3600.0,
+        maxsize: int = 100_000,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.window = window
+        self.maxsize = maxsize
+        self._clock = clock
+        self._seen: "collections.OrderedDict[t.Hashable, float]" = collections.OrderedDict()
+
+        self.dropped = 0
+        """Amount of duplicates `add` has reported."""
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        self._expire(self._clock())
+        return key in self._seen
+
+    def add(self, key: t.Hashable) -> bool:
+        """
+        Remembers a key.
+
+        Args:
+            key: The key, e.g. `(event, uniqid, updated_at)`.
+
+        Returns:
+            bool: `True` if the key is new, `False` if it was seen within the window.
+        """
+        now = self._clock()
+        self._expire(now)
+        if key in self._seen:
+            self.dropped += 1
+            return False
+
+        self._seen[key] = now
+        if len(self._seen) > self.maxsize:
+            self._seen.popitem(last=False)
+        return True
+
+    def discard(self, key: t.Hashable) -> None:
+        """
+        Forgets a key, so it is accepted again.
+
+        Args:
+            key: The key.
+        """
+        self._seen.pop(key, None)
+
+    def clear(self) -> None:
+        """Forgets every key."""
+        self._seen.clear()
+
+    def _expire(self, now: float) -> None:
+        deadline = now - self.window
+        seen = self._seen
+        while seen:
+            key, added = next(iter(seen.items()))
+            if added > deadline:
+                return
+            del seen[key]
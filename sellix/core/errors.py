@@ -1,6 +1,7 @@
 from enum import (
     Enum,
 )
+import typing as t
 
 
 class SellixError(Enum):
@@ -94,6 +95,33 @@ class SellixError(Enum):
     - `RATE_LIMIT_EXCEEDED`: Rate-limiting errors (429) happen when you are sending too many requests to the developers API.
     """
 
+    @property
+    def status(self) -> int:
+        """The HTTP status code of the error."""
+        return self.value[1]
+
+    @classmethod
+    def from_status(
+        cls,
+        status: int,
+        message: t.Optional[str] = None,
+    ) -> t.Optional["SellixError"]:
+        """
+        Looks up the error matching a response.
+
+        Args:
+            status: The status code of the response.
+            message: The error message of the response, used to tell apart errors sharing a code.
+
+        Returns:
+            Optional[SellixError]: The matching error, or `None` if the code is not documented.
+        """
+        matches = [error for error in cls if error.status == status]
+        for error in matches:
+            if message and message == error.value[0]:
+                return error
+        return matches[0] if matches else None
+
 
 class CryptoGateway(Enum):
     """
@@ -0,0 +1,99 @@
+from .errors import SellixError
+
+import typing as t
+
+
+class SellixException(Exception):
+    """Base class for every exception raised by the SDK."""
+
+
+class HTTPException(SellixException):
+    """
+    Raised when the Sellix API answers with an error status.
+
+    Args:
+        error: The `SellixError` matching the response, `None` for undocumented status codes.
+        status: The status code of the response.
+        message: The error message returned by the API, if any.
+        retry_after: Seconds the API asked to wait before retrying, if given.
+    """
+
+    def __init__(
+        self,
+        error: t.Optional[SellixError],
+        status: int,
+        message: t.Optional[str] = None,
+        retry_after: t.Optional[float] = None,
+    ) -> None:
+        self.error = error
+        """The `SellixError` matching the response, `None` for undocumented status codes."""
+
+        self.status = status
+        """The status code of the response."""
+
+        self.message = message or (error.value[0] if error else f"HTTP {status}")
+        """The error message returned by the API, or the generic one of `error`."""
+
+        self.retry_after = retry_after
+        """Seconds the API asked to wait before retrying, if given."""
+
+        super().__init__(f"{status}: {self.message}")
+
+
+class RateLimitException(HTTPException):
+    """
+    Raised when a request is rejected with `429 Too Many Requests`.
+
+    Args:
+        error: The `SellixError` matching the response.
+        status: The status code of the response.
+        message: The error message returned by the API, if any.
+        retry_after: Seconds the API asked to wait before retrying, if given.
+    """
+
+    def __init__(
+        self,
+        error: t.Optional[SellixError],
+        status: int,
+        message: t.Optional[str] = None,
+        retry_after: t.Optional[float] = None,
+    ) -> None:
+        super().__init__(error, status, message, retry_after)
+
+
+class CircuitOpenException(SellixException):
+    """
+    Raised instead of sending a request while the circuit breaker of its endpoint is open.
+
+    Args:
+        name: The name of the endpoint, e.g. `GET_ORDER`.
+        retry_after: Seconds until the breaker lets a probe request through, if known.
+    """
+
+    def __init__(self, name: str, retry_after: t.Optional[float] = None) -> None:
+        self.name = name
+        """The name of the endpoint."""
+
+        self.retry_after = retry_after
+        """Seconds until the breaker lets a probe request through, if known."""
+
+        super().__init__(f"the circuit of {name} is open")
+
+
+class DeadlineExceeded(SellixException):
+    """
+    Raised when a request cannot complete before the deadline it was sent under.
+
+    Args:
+        remaining: Seconds that were left of the deadline, `0` if it had passed.
+    """
+
+    def __init__(self, remaining: float = 0.0) -> None:
+        self.remaining = remaining
+        """Seconds that were left of the deadline, `0` if it had passed."""
+
+        super().__init__(
+            "the deadline has passed"
+            if remaining <= 0
+            else f"not enough time left before the deadline ({remaining:.3f}s)"
+        )
@@ -0,0 +1,356 @@
+from ..abc.modals import Order
+from ..abc.projection import project
+
+import array
+import csv
+import typing as t
+
+if t.TYPE_CHECKING:
+    import pyarrow
+
+STRING_COLUMNS = ("uniqid",)
+"""Columns exported as plain strings."""
+
+FIXED_COLUMNS = {"total": "d", "created_at": "q", "quantity": "q"}
+"""Columns exported as fixed-width arrays, with their `array` typecode."""
+
+DICTIONARY_COLUMNS = ("gateway", "currency", "status")
+"""Low-cardinality columns exported dictionary-encoded."""
+
+COLUMNS = STRING_COLUMNS + tuple(FIXED_COLUMNS) + DICTIONARY_COLUMNS
+"""Every exported column, in order."""
+
+OrderRow = project(Order, COLUMNS, name="OrderRow")
+"""The projection of `Order` the exporter decodes pages into."""
+
+
+def _require_pyarrow() -> t.Any:
+    try:
+        import pyarrow
+        import pyarrow.compute  # noqa: F401
+    except ImportError as error:
+        raise ImportError(
+            "Arrow and Parquet export require pyarrow, install it with `pip install pyarrow`"
+        ) from error
+    return pyarrow
+
+
+class FixedColumn:
+    """
+    A column of fixed-width numbers backed by an `array`.
+
+    Args:
+        typecode: The `array` typecode, `"d"` for floats or `"q"` for 64 bit integers.
+    """
+
+    __slots__ = ("values", "nulls")
+
+    def __init__(self, typecode: str) -> None:
+        self.values: "array.array[t.Any]" = array.array(typecode)
+        """The values, with `0` standing in for nulls."""
+
+        self.nulls = bytearray()
+        """`1` for every null value, `0` otherwise."""
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: t.Optional[t.Union[int, float]]) -> None:
+        if value is None:
+            self.values.append(0)
+            self.nulls.append(1)
+        else:
+            self.values.append(value)
+            self.nulls.append(0)
+
+    def get(self, index: int) -> t.Optional[t.Union[int, float]]:
+        return None if self.nulls[index] else self.values[index]
+
+
+class DictionaryColumn:
+    """
+    A dictionary-encoded string column.
+
+    Every distinct value is stored once in `dictionary` and rows hold its index. The dictionary
+    is shared with the following batches of an export and only ever grows, so a code keeps its
+    meaning for the whole export.
+
+    Args:
+        dictionary: The values seen so far by the export.
+        index: Maps every value of `dictionary` to its code.
+    """
+
+    __slots__ = ("dictionary", "index", "codes")
+
+    def __init__(self, dictionary: t.List[str], index: t.Dict[str, int]) -> None:
+        self.dictionary = dictionary
+        self.index = index
+        self.codes = array.array("i")
+        """The code of every row, `-1` for nulls."""
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: t.Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.dictionary)
+            self.dictionary.append(value)
+        self.codes.append(code)
+
+    def get(self, index: int) -> t.Optional[str]:
+        code = self.codes[index]
+        return None if code < 0 else self.dictionary[code]
+
+
+class OrderBatch:
+    """
+    A columnar batch of orders.
+
+    Args:
+        dictionaries: The dictionary and index of every dictionary-encoded column, shared with
+            the other batches of the export.
+    """
+
+    __slots__ = ("strings", "fixed", "dictionaries")
+
+    def __init__(
+        self, dictionaries: t.Dict[str, t.Tuple[t.List[str], t.Dict[str, int]]]
+    ) -> None:
+        self.strings: t.Dict[str, t.List[t.Optional[str]]] = {
+            name: [] for name in STRING_COLUMNS
+        }
+        self.fixed = {name: FixedColumn(code) for name, code in FIXED_COLUMNS.items()}
+        self.dictionaries = {
+            name: DictionaryColumn(*dictionaries[name]) for name in DICTIONARY_COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return len(self.strings[STRING_COLUMNS[0]])
+
+    def append(self, order: t.Any) -> None:
+        """
+        Adds an order to the batch.
+
+        Args:
+            order: An `Order`, or any projection of it holding the exported columns.
+        """
+        for name, column in self.strings.items():
+            column.append(getattr(order, name))
+        for name, fixed in self.fixed.items():
+            fixed.append(getattr(order, name))
+        for name, encoded in self.dictionaries.items():
+            encoded.append(getattr(order, name))
+
+    def rows(self) -> t.Iterator[t.Tuple[t.Any, ...]]:
+        """
+        Iterates over the rows of the batch.
+
+        Yields:
+            Tuple[Any, ...]: The values of every row, in the order of `COLUMNS`.
+        """
+        columns: t.List[t.Any] = [
+            *self.strings.values(),
+            *self.fixed.values(),
+            *self.dictionaries.values(),
+        ]
+        for index in range(len(self)):
+            yield tuple(
+                column[index] if isinstance(column, list) else column.get(index)
+                for column in columns
+            )
+
+    def to_arrow(self) -> "pyarrow.RecordBatch":
+        """
+        Converts the batch into an Arrow record batch.
+
+        Fixed-width columns and dictionary codes are handed to Arrow as buffers, without
+        converting every value to a Python object. Requires `pyarrow`.
+
+        Returns:
+            pyarrow.RecordBatch: The batch.
+        """
+        pa = _require_pyarrow()
+        arrays = [pa.array(values, pa.string()) for values in self.strings.values()]
+        for name, fixed in self.fixed.items():
+            kind = pa.float64() if FIXED_COLUMNS[name] == "d" else pa.int64()
+            nulls = pa.Array.from_buffers(
+                pa.uint8(), len(fixed), [None, pa.py_buffer(fixed.nulls)]
+            )
+            arrays.append(_from_buffer(pa, kind, fixed.values, nulls, 1))
+        for encoded in self.dictionaries.values():
+            codes = pa.Array.from_buffers(
+                pa.int32(), len(encoded), [None, pa.py_buffer(encoded.codes)]
+            )
+            arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    _from_buffer(pa, pa.int32(), encoded.codes, codes, -1),
+                    pa.array(encoded.dictionary, pa.string()),
+                )
+            )
+        return pa.RecordBatch.from_arrays(arrays, names=list(COLUMNS))
+
+
+def _from_buffer(
+    pa: t.Any, kind: t.Any, values: array.array, marker: t.Any, null: int
+) -> t.Any:
+    """Wraps `values` into an Arrow array, null where `marker` equals `null`."""
+    validity = None
+    if marker.null_count == 0 and pa.compute.any(pa.compute.equal(marker, null)).as_py():
+        validity = pa.compute.not_equal(marker, null).buffers()[1]
+    return pa.Array.from_buffers(kind, len(values), [validity, pa.py_buffer(values)])
+
+
+class BatchSink:
+    """
+    Base class for the destinations of `export_orders`.
+
+    Batches are written as they are produced, so a sink must not need to see the whole export
+    at once.
+    """
+
+    def write(self, batch: OrderBatch) -> None:
+        """
+        Writes a batch.
+
+        Args:
+            batch: The batch to write.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flushes and closes the destination."""
+        raise NotImplementedError
+
+    def __enter__(self) -> "BatchSink":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+class CSVSink(BatchSink):
+    """
+    Writes batches to a CSV file, with no dependencies beyond the standard library.
+
+    Args:
+        path: The file to write.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def write(self, batch: OrderBatch) -> None:
+        self._writer.writerows(batch.rows())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ArrowStreamSink(BatchSink):
+    """
+    Writes batches to an Arrow IPC stream. Requires `pyarrow`.
+
+    Dictionaries grow during an export, so only the values new to each batch are written
+    (dictionary deltas), which the stream format supports and the file format does not.
+
+    Args:
+        path: The file to write.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._pa = _require_pyarrow()
+        self._path = path
+        self._writer: t.Optional[t.Any] = None
+
+    def write(self, batch: OrderBatch) -> None:
+        record_batch = batch.to_arrow()
+        if self._writer is None:
+            import pyarrow.ipc
+
+            self._writer = pyarrow.ipc.new_stream(
+                self._path,
+                record_batch.schema,
+                options=pyarrow.ipc.IpcWriteOptions(emit_dictionary_deltas=True),
+            )
+        self._writer.write_batch(record_batch)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ParquetSink(BatchSink):
+    """
+    Writes batches to a Parquet file, one row group per batch. Requires `pyarrow`.
+
+    Args:
+        path: The file to write.
+        compression: The Parquet compression codec.
+    """
+
+    def __init__(self, path: str, compression: str = "zstd") -> None:
+        self._pa = _require_pyarrow()
+        self._path = path
+        self._compression = compression
+        self._writer: t.Optional[t.Any] = None
+
+    def write(self, batch: OrderBatch) -> None:
+        record_batch = batch.to_arrow()
+        if self._writer is None:
+            import pyarrow.parquet
+
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self._path, record_batch.schema, compression=self._compression
+            )
+        self._writer.write_batch(record_batch)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+async def export_orders(
+    orders: t.AsyncIterable[t.Any], sink: BatchSink, batch_size: int = 10_000
+) -> int:
+    """
+    Writes a stream of orders to `sink`, `batch_size` orders at a time.
+
+    Only the batch being filled is held in memory, so an export of any length runs in constant
+    memory. Decoding the stream into `OrderRow` rather than `Order` keeps it cheap too.
+
+    Args:
+        orders: The orders, e.g. `client.iter_orders(projection=OrderRow)`.
+        sink: Where to write the batches. It is not closed.
+        batch_size: Amount of orders per batch.
+
+    Returns:
+        int: Amount of orders written.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+
+    dictionaries: t.Dict[str, t.Tuple[t.List[str], t.Dict[str, int]]] = {
+        name: ([], {}) for name in DICTIONARY_COLUMNS
+    }
+    batch = OrderBatch(dictionaries)
+    written = 0
+    async for order in orders:
+        batch.append(order)
+        if len(batch) >= batch_size:
+            sink.write(batch)
+            written += len(batch)
+            batch = OrderBatch(dictionaries)
+
+    if len(batch):
+        sink.write(batch)
+        written += len(batch)
+    return written
@@ -0,0 +1,145 @@
+from ..enums.genric import APIEndpoints
+
+import array
+import typing as t
+
+
+class LatencyTracker:
+    """
+    Keeps the latencies of the last `window` requests to estimate a percentile.
+
+    Latencies go into a fixed ring buffer; the percentile is recomputed from a sorted copy at
+    most once every `refresh` new samples, so recording stays O(1).
+
+    Args:
+        window: Amount of recent latencies kept.
+        refresh: New samples after which the percentile is recomputed.
+    """
+
+    __slots__ = ("window", "refresh", "_samples", "_count", "_stale", "_sorted")
+
+    def __init__(self, window: int = 200, refresh: int = 16) -> None:
+        if window <= 0:
+            raise ValueError("window must be a positive integer")
+
+        self.window = window
+        self.refresh = refresh
+        self._samples = array.array("d", bytes(8 * window))
+        self._count = 0
+        self._stale = 0
+        self._sorted: t.List[float] = []
+
+    def __len__(self) -> int:
+        return min(self._count, self.window)
+
+    def add(self, latency: float) -> None:
+        """
+        Records a latency.
+
+        Args:
+            latency: Seconds the request took.
+        """
+        self._samples[self._count % self.window] = latency
+        self._count += 1
+        self._stale += 1
+
+    def percentile(self, q: float) -> t.Optional[float]:
+        """
+        Estimates a percentile of the recorded latencies.
+
+        Args:
+            q: The percentile, between `0` and `1`, e.g. `0.95`.
+
+        Returns:
+            Optional[float]: The latency, in seconds, `None` if nothing was recorded.
+        """
+        size = len(self)
+        if not size:
+            return None
+        if self._stale >= self.refresh or len(self._sorted) != size:
+            self._sorted = sorted(self._samples[:size])
+            self._stale = 0
+        return self._sorted[min(size - 1, int(q * size))]
+
+
+class HedgePolicy:
+    """
+    Decides when a `GET` request is hedged, i.e. sent a second time while the first is slow.
+
+    A request still unanswered after the `percentile` latency of its endpoint is sent again
+    and the first answer wins, the other request being cancelled. Only the slowest requests
+    are hedged, so the extra load stays around `1 - percentile`, and a hedge is only sent when
+    the rate limiter has a slot free right away.
+
+    Args:
+        percentile: Latency percentile after which a request is hedged.
+        min_delay: Shortest wait before hedging, in seconds.
+        min_samples: Latencies an endpoint needs before its requests are hedged.
+        window: Latencies kept per endpoint.
+        endpoints: Endpoints to hedge, every `GET` endpoint if `None`.
+    """
+
+    __slots__ = (
+        "percentile",
+        "min_delay",
+        "min_samples",
+        "window",
+        "endpoints",
+        "_trackers",
+        "hedged",
+        "wins",
+    )
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        endpoints: t.Optional[t.Iterable[APIEndpoints]] = None,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.endpoints = None if endpoints is None else frozenset(endpoints)
+        self._trackers: t.Dict[APIEndpoints, LatencyTracker] = {}
+
+        self.hedged = 0
+        """Amount of hedge requests sent."""
+
+        self.wins = 0
+        """Amount of hedge requests answered before the request they hedged."""
+
+    def record(self, api_method: APIEndpoints, latency: float) -> None:
+        """
+        Records the latency of a completed request.
+
+        Args:
+            api_method: The endpoint.
+            latency: Seconds the request took.
+        """
+        tracker = self._trackers.get(api_method)
+        if tracker is None:
+            tracker = self._trackers[api_method] = LatencyTracker(self.window)
+        tracker.add(latency)
+
+    def delay(self, api_method: APIEndpoints) -> t.Optional[float]:
+        """
+        Returns how long to wait before hedging a request.
+
+        Args:
+            api_method: The endpoint.
+
+        Returns:
+            Optional[float]: Seconds to wait, `None` if requests to the endpoint are not hedged.
+        """
+        if self.endpoints is not None and api_method not in self.endpoints:
+            return None
+        tracker = self._trackers.get(api_method)
+        if tracker is None or len(tracker) < self.min_samples:
+            return None
+        return max(self.min_delay, tracker.percentile(self.percentile))  # type: ignore
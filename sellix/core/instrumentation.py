@@ -0,0 +1,158 @@
+from ..enums.genric import APIEndpoints
+
+import typing as t
+
+
+class Instrumentation:
+    """
+    Base class for the hooks `SellixClientX` calls along the request path.
+
+    Every hook does nothing; subclasses override the ones they need, e.g. `Metrics` or
+    `Tracer`. A client without instrumentation skips the hooks, and the timing they need,
+    entirely.
+    """
+
+    def start_request(self, api_method: APIEndpoints, method: str) -> t.Any:
+        """
+        Called when a request starts, before the cache, retries and rate limiter.
+
+        Args:
+            api_method: The endpoint.
+            method: The HTTP method, as given to the client.
+
+        Returns:
+            Any: A value handed back to `end_request`.
+        """
+        return None
+
+    def end_request(self, state: t.Any, error: t.Optional[BaseException]) -> None:
+        """
+        Called when a request started by `start_request` ends.
+
+        Args:
+            state: What `start_request` returned.
+            error: The exception the request raised, `None` if it succeeded.
+        """
+
+    def on_attempt(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        status: t.Optional[int],
+        latency: float,
+        sent: int,
+        received: int,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        """
+        Called after every HTTP exchange, including retries and hedges.
+
+        Args:
+            api_method: The endpoint.
+            method: The HTTP method, as given to the client.
+            status: The status of the response, `None` if none was received.
+            latency: Seconds from sending the request to reading the whole response.
+            sent: Bytes of the request head (request line and headers).
+            received: Bytes of the response body.
+            error: The exception raised before a response was received, if any.
+        """
+
+    def on_rate_limit(self, api_method: APIEndpoints, waited: float) -> None:
+        """
+        Called once the rate limiter let a request through.
+
+        Args:
+            api_method: The endpoint.
+            waited: Seconds the request waited for a slot.
+        """
+
+    def on_retry(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        error: BaseException,
+        delay: float,
+    ) -> None:
+        """
+        Called before a failed attempt is retried.
+
+        Args:
+            api_method: The endpoint.
+            method: The HTTP method, as given to the client.
+            error: The exception the attempt raised.
+            delay: Seconds waited before the retry.
+        """
+
+    def on_cache(self, api_method: APIEndpoints, result: str) -> None:
+        """
+        Called once per `GET` looked up in the response cache or validators.
+
+        Args:
+            api_method: The endpoint.
+            result: `"hit"`, `"miss"`, or `"revalidated"` for a `304 Not Modified`.
+        """
+
+    def on_decode(self, api_method: APIEndpoints, seconds: float, size: int) -> None:
+        """
+        Called after a response body is decoded.
+
+        Args:
+            api_method: The endpoint.
+            seconds: Time spent decoding.
+            size: Bytes decoded.
+        """
+
+
+class InstrumentationGroup(Instrumentation):
+    """
+    Calls the hooks of several instrumentations, e.g. `Metrics` and a `Tracer` together.
+
+    Args:
+        *instruments: The instrumentations, called in order.
+    """
+
+    def __init__(self, *instruments: Instrumentation) -> None:
+        self.instruments = instruments
+
+    def start_request(self, api_method: APIEndpoints, method: str) -> t.Any:
+        return [instrument.start_request(api_method, method) for instrument in self.instruments]
+
+    def end_request(self, state: t.Any, error: t.Optional[BaseException]) -> None:
+        # Ended in reverse, so context set by the last one started is reset first.
+        for instrument, instrument_state in reversed(list(zip(self.instruments, state))):
+            instrument.end_request(instrument_state, error)
+
+    def on_attempt(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        status: t.Optional[int],
+        latency: float,
+        sent: int,
+        received: int,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        for instrument in self.instruments:
+            instrument.on_attempt(api_method, method, status, latency, sent, received, error)
+
+    def on_rate_limit(self, api_method: APIEndpoints, waited: float) -> None:
+        for instrument in self.instruments:
+            instrument.on_rate_limit(api_method, waited)
+
+    def on_retry(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        error: BaseException,
+        delay: float,
+    ) -> None:
+        for instrument in self.instruments:
+            instrument.on_retry(api_method, method, error, delay)
+
+    def on_cache(self, api_method: APIEndpoints, result: str) -> None:
+        for instrument in self.instruments:
+            instrument.on_cache(api_method, result)
+
+    def on_decode(self, api_method: APIEndpoints, seconds: float, size: int) -> None:
+        for instrument in self.instruments:
+            instrument.on_decode(api_method, seconds, size)
@@ -0,0 +1,274 @@
+from ..enums.genric import APIEndpoints
+from .exceptions import HTTPException
+from .instrumentation import Instrumentation
+
+import bisect
+import typing as t
+
+LATENCY_BUCKETS: t.Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+"""Upper bounds, in seconds, of the request latency and rate-limit wait histograms."""
+
+DECODE_BUCKETS: t.Tuple[float, ...] = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1
+)
+"""Upper bounds, in seconds, of the decode time histogram."""
+
+_Labels = t.Tuple[str, ...]
+
+
+class Histogram:
+    """
+    A cumulative histogram with fixed buckets, as exposed by Prometheus.
+
+    Args:
+        buckets: The upper bounds of the buckets, in increasing order; `+Inf` is implied.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: t.Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Records a value.
+
+        Args:
+            value: The value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> t.Iterator[t.Tuple[str, int]]:
+        """
+        Yields the `le` label and cumulative count of every bucket, `+Inf` last.
+
+        Yields:
+            Tuple[str, int]: The bound and the amount of values less than or equal to it.
+        """
+        total = 0
+        for bound, count in zip((*map(repr, self.buckets), "+Inf"), self.counts):
+            total += count
+            yield bound, total
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: t.Sequence[str], values: _Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metrics(Instrumentation):
+    """
+    Aggregates the client hooks into metrics, exported in the Prometheus text format.
+
+    Every metric is labelled with the endpoint (its `APIEndpoints` name):
+
+    - `sellix_request_duration_seconds`: histogram of HTTP exchanges, by method and status
+      (`error` when no response was received).
+    - `sellix_request_bytes_total` and `sellix_response_bytes_total`: bytes sent and received.
+    - `sellix_decode_duration_seconds`: histogram of decode times.
+    - `sellix_rate_limit_wait_seconds`: histogram of rate-limiter waits.
+    - `sellix_retries_total`: retries, by the status or exception that caused them.
+    - `sellix_cache_requests_total`: cache lookups, by result (`hit`, `miss`, `revalidated`).
+
+    Args:
+        latency_buckets: Buckets of the latency and rate-limit wait histograms.
+        decode_buckets: Buckets of the decode time histogram.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: t.Sequence[float] = LATENCY_BUCKETS,
+        decode_buckets: t.Sequence[float] = DECODE_BUCKETS,
+    ) -> None:
+        self.latency_buckets = tuple(latency_buckets)
+        self.decode_buckets = tuple(decode_buckets)
+        self.requests: t.Dict[_Labels, Histogram] = {}
+        self.bytes_sent: t.Dict[_Labels, int] = {}
+        self.bytes_received: t.Dict[_Labels, int] = {}
+        self.decode: t.Dict[_Labels, Histogram] = {}
+        self.rate_limit_waits: t.Dict[_Labels, Histogram] = {}
+        self.retries: t.Dict[_Labels, int] = {}
+        self.cache: t.Dict[_Labels, int] = {}
+
+    def on_attempt(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        status: t.Optional[int],
+        latency: float,
+        sent: int,
+        received: int,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        labels = (api_method.name, method, "error" if status is None else str(status))
+        histogram = self.requests.get(labels)
+        if histogram is None:
+            histogram = self.requests[labels] = Histogram(self.latency_buckets)
+        histogram.observe(latency)
+
+        endpoint = (api_method.name,)
+        self.bytes_sent[endpoint] = self.bytes_sent.get(endpoint, 0) + sent
+        self.bytes_received[endpoint] = self.bytes_received.get(endpoint, 0) + received
+
+    def on_rate_limit(self, api_method: APIEndpoints, waited: float) -> None:
+        labels = (api_method.name,)
+        histogram = self.rate_limit_waits.get(labels)
+        if histogram is None:
+            histogram = self.rate_limit_waits[labels] = Histogram(self.latency_buckets)
+        histogram.observe(waited)
+
+    def on_retry(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        error: BaseException,
+        delay: float,
+    ) -> None:
+        reason = str(error.status) if isinstance(error, HTTPException) else type(error).__name__
+        labels = (api_method.name, reason)
+        self.retries[labels] = self.retries.get(labels, 0) + 1
+
+    def on_cache(self, api_method: APIEndpoints, result: str) -> None:
+        labels = (api_method.name, result)
+        self.cache[labels] = self.cache.get(labels, 0) + 1
+
+    def on_decode(self, api_method: APIEndpoints, seconds: float, size: int) -> None:
+        labels = (api_method.name,)
+        histogram = self.decode.get(labels)
+        if histogram is None:
+            histogram = self.decode[labels] = Histogram(self.decode_buckets)
+        histogram.observe(seconds)
+
+    def cache_hit_ratio(self, api_method: t.Optional[APIEndpoints] = None) -> t.Optional[float]:
+        """
+        Returns the share of cache lookups answered without a full response.
+
+        Args:
+            api_method: Only count this endpoint.
+
+        Returns:
+            Optional[float]: Hits and revalidations over lookups, `None` without lookups.
+        """
+        hits = lookups = 0
+        for (endpoint, result), count in self.cache.items():
+            if api_method is not None and endpoint != api_method.name:
+                continue
+            lookups += count
+            if result != "miss":
+                hits += count
+        return hits / lookups if lookups else None
+
+    def reset(self) -> None:
+        """Forgets every recorded value."""
+        for values in (
+            self.requests,
+            self.bytes_sent,
+            self.bytes_received,
+            self.decode,
+            self.rate_limit_waits,
+            self.retries,
+            self.cache,
+        ):
+            values.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition, e.g. to serve on a `/metrics` endpoint.
+        """
+        lines: t.List[str] = []
+        self._histograms(
+            lines,
+            "sellix_request_duration_seconds",
+            "Duration of the HTTP exchanges with the Sellix API.",
+            ("endpoint", "method", "status"),
+            self.requests,
+        )
+        self._counters(
+            lines,
+            "sellix_request_bytes_total",
+            "Bytes of the request heads sent to the Sellix API.",
+            ("endpoint",),
+            self.bytes_sent,
+        )
+        self._counters(
+            lines,
+            "sellix_response_bytes_total",
+            "Bytes of the response bodies received from the Sellix API.",
+            ("endpoint",),
+            self.bytes_received,
+        )
+        self._histograms(
+            lines,
+            "sellix_decode_duration_seconds",
+            "Time spent decoding response bodies.",
+            ("endpoint",),
+            self.decode,
+        )
+        self._histograms(
+            lines,
+            "sellix_rate_limit_wait_seconds",
+            "Time requests waited for the client side rate limiter.",
+            ("endpoint",),
+            self.rate_limit_waits,
+        )
+        self._counters(
+            lines,
+            "sellix_retries_total",
+            "Requests sent again after a transient failure.",
+            ("endpoint", "reason"),
+            self.retries,
+        )
+        self._counters(
+            lines,
+            "sellix_cache_requests_total",
+            "Lookups of the response cache and validators.",
+            ("endpoint", "result"),
+            self.cache,
+        )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _counters(
+        lines: t.List[str],
+        name: str,
+        help: str,
+        names: t.Sequence[str],
+        values: t.Mapping[_Labels, int],
+    ) -> None:
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(values.items()):
+            lines.append(f"{name}{_labels(names, labels)} {value}")
+
+    @staticmethod
+    def _histograms(
+        lines: t.List[str],
+        name: str,
+        help: str,
+        names: t.Sequence[str],
+        values: t.Mapping[_Labels, Histogram],
+    ) -> None:
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in sorted(values.items()):
+            for bound, count in histogram.cumulative():
+                le = f'le="{bound}"'
+                lines.append(f"{name}_bucket{_labels(names, labels, le)} {count}")
+            lines.append(f"{name}_sum{_labels(names, labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_labels(names, labels)} {histogram.count}")
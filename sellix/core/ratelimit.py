@@ -0,0 +1,383 @@
+from ..enums.genric import MerchantTier
+
+import asyncio
+import bisect
+import collections
+import email.utils
+import msgspec
+import time
+import typing as t
+
+
+class RateLimitInfo(msgspec.Struct):
+    """Rate-limit state reported by the API alongside a response."""
+
+    limit: t.Optional[int] = None
+    """Amount of requests granted per window."""
+
+    remaining: t.Optional[int] = None
+    """Amount of requests left in the current window."""
+
+    reset_after: t.Optional[float] = None
+    """Seconds until the current window resets or, for a 429, until requests may resume."""
+
+    @classmethod
+    def from_headers(cls, headers: t.Mapping[str, str]) -> "RateLimitInfo":
+        """
+        Reads the `X-RateLimit-*` and `Retry-After` headers of a response.
+
+        Args:
+            headers: The response headers.
+
+        Returns:
+            RateLimitInfo: The parsed state, with `None` for every missing header.
+        """
+        reset_after = _parse_seconds(headers.get("Retry-After"))
+        if reset_after is None:
+            reset_after = _parse_seconds(headers.get("X-RateLimit-Reset"))
+
+        return cls(
+            limit=_parse_int(headers.get("X-RateLimit-Limit")),
+            remaining=_parse_int(headers.get("X-RateLimit-Remaining")),
+            reset_after=reset_after,
+        )
+
+
+def _parse_int(value: t.Optional[str]) -> t.Optional[int]:
+    try:
+        return int(value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_seconds(value: t.Optional[str]) -> t.Optional[float]:
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        # `Retry-After` may also be an HTTP date.
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at - time.time())
+
+    # Large values are unix timestamps rather than a delay.
+    if seconds > 1_000_000_000:
+        seconds -= time.time()
+    return max(0.0, seconds)
+
+
+class RateLimiter:
+    """
+    Base class for the client side rate limiters.
+
+    A limiter hands out *reservations*: `reserve` books a slot immediately and returns how
+    long the caller has to wait before using it. Waiting is done with a single `asyncio.sleep`
+    of exactly that length, so no background task polls the limiter.
+    """
+
+    __slots__ = ("limit", "period", "_clock", "_blocked_until")
+
+    def __init__(
+        self,
+        limit: int,
+        period: float = 10.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer")
+        if period <= 0:
+            raise ValueError("period must be greater than 0")
+
+        self.limit = int(limit)
+        """Amount of requests allowed within `period`."""
+
+        self.period = float(period)
+        """Length of the rate-limit window, in seconds."""
+
+        self._clock = clock
+        self._blocked_until = 0.0
+
+    @classmethod
+    def from_tier(
+        cls,
+        tier: MerchantTier,
+        period: float = 10.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        """
+        Builds a limiter matching the budget of a `MerchantTier`.
+
+        Args:
+            tier: The merchant tier to read the request budget from.
+            period: The window the budget applies to, in seconds.
+            clock: Monotonic clock used to compute waits.
+
+        Returns:
+            RateLimiter: A limiter allowing `tier.value` requests per `period`.
+        """
+        return cls(tier.value, period, clock)
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Books `tokens` request slots.
+
+        Args:
+            tokens: Amount of slots to book.
+
+        Returns:
+            float: Seconds to wait before the booked slots may be used.
+        """
+        raise NotImplementedError
+
+    def refund(self, tokens: int = 1) -> None:
+        """
+        Returns booked slots which ended up unused.
+
+        Args:
+            tokens: Amount of slots to give back.
+        """
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Books `tokens` request slots only if they may be used right away.
+
+        Args:
+            tokens: Amount of slots to book.
+
+        Returns:
+            bool: Whether the slots were booked.
+        """
+        if self.reserve(tokens) > 0:
+            self.refund(tokens)
+            return False
+        return True
+
+    def resize(self, limit: int) -> None:
+        """
+        Changes the amount of requests allowed per window.
+
+        Args:
+            limit: The new budget.
+        """
+        self.limit = max(1, int(limit))
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds every reservation back for at least `seconds`.
+
+        Args:
+            seconds: How long no request may start.
+        """
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def update(self, info: RateLimitInfo, exceeded: bool = False) -> None:
+        """
+        Adapts the limiter to the state reported by the API.
+
+        Args:
+            info: The rate-limit state read from a response.
+            exceeded: Whether the response was a `429`. The limiter is then paused for
+                `info.reset_after`, or a whole `period` when the API gave no hint.
+        """
+        if info.limit is not None and info.limit > 0 and info.limit != self.limit:
+            self.resize(info.limit)
+
+        if exceeded:
+            self.pause(self.period if info.reset_after is None else info.reset_after)
+        elif info.remaining is not None:
+            if info.remaining <= 0 and info.reset_after is not None:
+                self.pause(info.reset_after)
+            else:
+                self._sync_remaining(info.remaining)
+
+    def _sync_remaining(self, remaining: int) -> None:
+        pass
+
+    async def acquire(self, tokens: int = 1, timeout: t.Optional[float] = None) -> float:
+        """
+        Waits until `tokens` request slots are available.
+
+        Args:
+            tokens: Amount of slots to acquire.
+            timeout: Longest wait accepted, in seconds.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        Raises:
+            asyncio.TimeoutError: The slots are not available within `timeout`, in which case
+                nothing is waited and the slots are refunded.
+        """
+        delay, booking = self._reserve(tokens)
+        if delay <= 0:
+            return 0.0
+        if timeout is not None and delay > timeout:
+            self._cancel(booking)
+            raise asyncio.TimeoutError(f"rate limited for {delay:.3f}s")
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._cancel(booking)
+            raise
+        return delay
+
+    def _reserve(self, tokens: int) -> t.Tuple[float, t.Any]:
+        """Books slots like `reserve`, also returning what `_cancel` needs to free them."""
+        return self.reserve(tokens), tokens
+
+    def _cancel(self, booking: t.Any) -> None:
+        """Frees the slots of a booking made by `_reserve`."""
+        self.refund(booking)
+
+
+class TokenBucket(RateLimiter):
+    """
+    A token bucket holding up to `limit` tokens, refilled continuously at `limit / period`
+    tokens per second.
+
+    Tokens may go negative: a caller finding the bucket empty takes its token anyway and
+    sleeps for exactly the time the refill needs to pay that debt back.
+    """
+
+    __slots__ = ("_tokens", "_updated_at")
+
+    def __init__(
+        self,
+        limit: int,
+        period: float = 10.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(limit, period, clock)
+        self._tokens = float(self.limit)
+        self._updated_at = self._clock()
+
+    @property
+    def fill_rate(self) -> float:
+        """Tokens added to the bucket per second."""
+        return self.limit / self.period
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket, negative when callers are waiting."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.limit, self._tokens + (now - self._updated_at) * self.fill_rate
+        )
+        self._updated_at = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        self._refill()
+        self._tokens -= tokens
+        blocked = self._blocked_until - self._updated_at
+        if self._tokens >= 0:
+            return max(0.0, blocked)
+        return max(-self._tokens / self.fill_rate, blocked)
+
+    def refund(self, tokens: int = 1) -> None:
+        self._refill()
+        self._tokens = min(self.limit, self._tokens + tokens)
+
+    def resize(self, limit: int) -> None:
+        self._refill()
+        super().resize(limit)
+        self._tokens = min(self._tokens, self.limit)
+
+    def _sync_remaining(self, remaining: int) -> None:
+        self._refill()
+        self._tokens = min(self._tokens, remaining)
+
+
+class SlidingWindowLimiter(RateLimiter):
+    """
+    A sliding-window log limiter guaranteeing that no window of `period` seconds contains more
+    than `limit` requests.
+
+    The log keeps the start time of every request of the last `period` seconds, including
+    reservations made for the future, so the next free slot is always `log[-limit] + period`.
+    This matches how Sellix counts requests and lets a tier burst its whole budget at once.
+    Refunded reservations are removed from the log, so they free their slot for others.
+    """
+
+    __slots__ = ("_log",)
+
+    def __init__(
+        self,
+        limit: int,
+        period: float = 10.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(limit, period, clock)
+        self._log: t.Deque[float] = collections.deque()
+
+    @property
+    def remaining(self) -> int:
+        """Amount of requests which can be made right now without waiting."""
+        self._prune(self._clock())
+        return max(0, self.limit - len(self._log))
+
+    def _prune(self, now: float) -> None:
+        # Requests started a whole period ago no longer limit anything.
+        threshold = now - self.period
+        log = self._log
+        while log and log[0] <= threshold:
+            log.popleft()
+
+    def _reserve(self, tokens: int) -> t.Tuple[float, t.Any]:
+        now = self._clock()
+        self._prune(now)
+        start = max(now, self._blocked_until)
+        starts = []
+        for _ in range(tokens):
+            if len(self._log) >= self.limit:
+                start = max(start, self._log[-self.limit] + self.period)
+            self._log.append(start)
+            starts.append(start)
+        return start - now, starts
+
+    def _cancel(self, booking: t.Any) -> None:
+        for start in booking:
+            try:
+                self._log.remove(start)
+            except ValueError:
+                pass  # Pruned already.
+
+    def reserve(self, tokens: int = 1) -> float:
+        return self._reserve(tokens)[0]
+
+    def refund(self, tokens: int = 1) -> None:
+        """
+        Returns the latest booked slots which have not started yet.
+
+        Args:
+            tokens: Amount of slots to give back.
+        """
+        now = self._clock()
+        for _ in range(tokens):
+            if not self._log or self._log[-1] <= now:
+                return
+            self._log.pop()
+
+    def _sync_remaining(self, remaining: int) -> None:
+        # Requests the API counted but this limiter did not, e.g. of another process using the
+        # same key, take the free slots as if they had just started.
+        now = self._clock()
+        self._prune(now)
+        for _ in range(self.limit - len(self._log) - remaining):
+            bisect.insort(self._log, now)
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        now = self._clock()
+        self._prune(now)
+        if self._blocked_until > now or len(self._log) + tokens > self.limit:
+            return False
+        self.reserve(tokens)
+        return True
@@ -0,0 +1,243 @@
+from .errors import SellixError
+from .exceptions import DeadlineExceeded, HTTPException
+from .timeouts import current_deadline
+
+import aiohttp
+import asyncio
+import random
+import time
+import typing as t
+
+T = t.TypeVar("T")
+
+RETRYABLE: t.Dict[SellixError, bool] = {
+    SellixError.BAD_REQUEST: False,
+    SellixError.UNAUTHORIZED: False,
+    SellixError.FORBIDDEN: False,
+    SellixError.NOT_FOUND: False,
+    SellixError.NOT_ACCEPTABLE: False,
+    SellixError.TOO_MANY_REQUESTS: True,
+    SellixError.INTERNAL_SERVER_ERROR: True,
+    SellixError.SERVICE_UNAVAILABLE: True,
+    SellixError.RATE_LIMIT_EXCEEDED: True,
+}
+"""Whether a request failing with each `SellixError` may succeed if sent again."""
+
+REJECTED: t.FrozenSet[SellixError] = frozenset(
+    {
+        SellixError.TOO_MANY_REQUESTS,
+        SellixError.RATE_LIMIT_EXCEEDED,
+        SellixError.SERVICE_UNAVAILABLE,
+    }
+)
+"""Errors meaning the request was not processed at all, so even a `POST` can be retried."""
+
+IDEMPOTENT_METHODS: t.FrozenSet[str] = frozenset({"GET", "PUT", "DEL"})
+"""Methods safe to send again after any transient failure."""
+
+TRANSIENT_EXCEPTIONS: t.Tuple[t.Type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+"""Exceptions raised before a response was received, retried for idempotent methods."""
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the requests, so an outage does not multiply the load.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one. Tokens also
+    trickle in at `min_per_second`, so a quiet client can still retry, and never exceed
+    `max_tokens`. Share one budget between every client talking to the same API.
+
+    Args:
+        ratio: Retries allowed per request, e.g. `0.1` for one retry every ten requests.
+        min_per_second: Retries allowed per second whatever the amount of requests.
+        max_tokens: Maximum amount of retries saved up.
+        clock: Monotonic clock used for the trickle.
+    """
+
+    __slots__ = ("ratio", "min_per_second", "max_tokens", "_tokens", "_updated", "_clock")
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 50.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._updated = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Amount of retries currently allowed."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed, self._updated = now - self._updated, now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+
+    def deposit(self) -> None:
+        """Records a first attempt."""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Asks for a retry.
+
+        Returns:
+            bool: Whether the retry is allowed, in which case a token was taken.
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    A response error is retried if `retryable` says so for its `SellixError` (undocumented
+    `5xx` codes count as retryable). `POST` requests are only retried on errors in `REJECTED`,
+    which guarantee nothing happened; other methods are also retried on `TRANSIENT_EXCEPTIONS`.
+
+    Delays follow decorrelated jitter: each is drawn between `base` and three times the
+    previous one, capped at `cap`, which spreads out clients that failed together. A
+    `Retry-After` sent by the API is waited instead when it is longer. Under a `deadline`, a
+    retry which could not start before it expires is not attempted.
+
+    Args:
+        max_attempts: Attempts in total, including the first.
+        base: Smallest delay, in seconds.
+        cap: Largest delay, in seconds.
+        max_retry_after: Longest `Retry-After` honoured; longer ones fail straight away.
+        retryable: Whether each `SellixError` is retryable, defaults to `RETRYABLE`.
+        budget: Budget the retries are taken from, unlimited if `None`.
+    """
+
+    __slots__ = ("max_attempts", "base", "cap", "max_retry_after", "retryable", "budget")
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base: float = 0.25,
+        cap: float = 20.0,
+        max_retry_after: float = 60.0,
+        retryable: t.Optional[t.Mapping[SellixError, bool]] = None,
+        budget: t.Optional[RetryBudget] = None,
+    ) -> None:
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be a positive integer")
+
+        self.max_attempts = max_attempts
+        self.base = base
+        self.cap = cap
+        self.max_retry_after = max_retry_after
+        self.retryable = dict(RETRYABLE if retryable is None else retryable)
+        self.budget = budget
+
+    def replace(self, **overrides: t.Any) -> "RetryPolicy":
+        """
+        Copies the policy with some settings changed, e.g. for a single call.
+
+        Args:
+            **overrides: The settings to change, named as in the constructor.
+
+        Returns:
+            RetryPolicy: The copy.
+        """
+        settings = {name: getattr(self, name) for name in self.__slots__}
+        settings.update(overrides)
+        return RetryPolicy(**settings)
+
+    def should_retry(self, method: str, error: BaseException) -> bool:
+        """
+        Tells whether a failure may be retried, ignoring the attempts and budget left.
+
+        Args:
+            method: The HTTP method, as given to the client.
+            error: The exception the attempt raised.
+
+        Returns:
+            bool: Whether the failure is transient and safe to retry.
+        """
+        if isinstance(error, HTTPException):
+            if error.error is None:
+                retryable = error.status >= 500
+            else:
+                retryable = self.retryable.get(error.error, False)
+            return retryable and (method in IDEMPOTENT_METHODS or error.error in REJECTED)
+        return isinstance(error, TRANSIENT_EXCEPTIONS) and method in IDEMPOTENT_METHODS
+
+    def backoff(self, previous: float) -> float:
+        """
+        Draws the next delay.
+
+        Args:
+            previous: The previous delay, `0` before the first retry.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return min(self.cap, random.uniform(self.base, max(self.base, previous * 3)))
+
+    async def call(
+        self,
+        method: str,
+        attempt: t.Callable[[], t.Awaitable[T]],
+        sleep: t.Callable[[float], t.Awaitable[t.Any]] = asyncio.sleep,
+        on_retry: t.Optional[t.Callable[[BaseException, float], None]] = None,
+    ) -> T:
+        """
+        Runs `attempt`, retrying it according to the policy.
+
+        Args:
+            method: The HTTP method the attempt sends.
+            attempt: Coroutine function sending the request once.
+            sleep: Coroutine function waiting between attempts.
+            on_retry: Called with the error and the delay before every retry.
+
+        Returns:
+            T: The result of the first successful attempt.
+
+        Raises:
+            DeadlineExceeded: The current deadline expires before the next attempt could start.
+            Exception: The error of the last attempt, when it is not retryable or nothing is
+                left of the attempts or budget.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+
+        delay = 0.0
+        for attempt_number in range(1, self.max_attempts + 1):
+            try:
+                return await attempt()
+            except Exception as error:
+                if attempt_number == self.max_attempts or not self.should_retry(method, error):
+                    raise
+
+                retry_after = getattr(error, "retry_after", None)
+                if retry_after is not None and retry_after > self.max_retry_after:
+                    raise
+
+                delay = self.backoff(delay)
+                wait = max(delay, retry_after or 0.0)
+                deadline = current_deadline()
+                if deadline is not None and deadline.remaining <= wait:
+                    raise DeadlineExceeded(deadline.remaining) from error
+                if self.budget is not None and not self.budget.withdraw():
+                    raise
+                if on_retry is not None:
+                    on_retry(error, wait)
+                await sleep(wait)
+        raise AssertionError("unreachable")
@@ -0,0 +1,115 @@
+import asyncio
+import collections
+import typing as t
+
+
+class FairScheduler:
+    """
+    Shares a fixed amount of request slots between keys (merchants) with weighted round-robin.
+
+    While slots are free `acquire` returns immediately. Once they are all taken, waiters queue up
+    per key and freed slots are handed to the keys in turn, each key receiving up to `weight`
+    slots per round. A key with a long backlog therefore only delays the others by its weight,
+    never by its backlog.
+
+    Args:
+        concurrency: Amount of requests allowed in flight across every key.
+    """
+
+    __slots__ = ("concurrency", "_active", "_weights", "_queues", "_ring", "_credits")
+
+    def __init__(self, concurrency: int) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+
+        self.concurrency = concurrency
+        """Amount of requests allowed in flight across every key."""
+
+        self._active = 0
+        self._weights: t.Dict[t.Hashable, int] = {}
+        self._queues: t.Dict[t.Hashable, t.Deque[asyncio.Future]] = {}
+        self._ring: t.Deque[t.Hashable] = collections.deque()
+        self._credits: t.Dict[t.Hashable, int] = {}
+
+    @property
+    def active(self) -> int:
+        """Amount of slots currently taken."""
+        return self._active
+
+    def register(self, key: t.Hashable, weight: int = 1) -> None:
+        """
+        Sets the share of a key.
+
+        Args:
+            key: The key, usually a merchant ID.
+            weight: Slots the key may take per round while others are waiting.
+        """
+        if weight <= 0:
+            raise ValueError("weight must be a positive integer")
+        self._weights[key] = weight
+        self._queues.setdefault(key, collections.deque())
+
+    def unregister(self, key: t.Hashable) -> None:
+        """
+        Forgets a key, cancelling its waiters.
+
+        Args:
+            key: The key to remove.
+        """
+        self._weights.pop(key, None)
+        self._credits.pop(key, None)
+        for waiter in self._queues.pop(key, ()):
+            waiter.cancel()
+        if key in self._ring:
+            self._ring.remove(key)
+
+    async def acquire(self, key: t.Hashable) -> None:
+        """
+        Waits for a slot on behalf of `key`.
+
+        Args:
+            key: The key asking for a slot.
+        """
+        if self._active < self.concurrency and not self._ring:
+            self._active += 1
+            return
+
+        queue = self._queues.setdefault(key, collections.deque())
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        if key not in self._credits:
+            self._credits[key] = self._weights.get(key, 1)
+            self._ring.append(key)
+        self._dispatch()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before the cancellation.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Frees a slot and hands it to the next waiting key."""
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._active < self.concurrency and self._ring:
+            key = self._ring[0]
+            queue = self._queues.get(key)
+            while queue and queue[0].done():
+                queue.popleft()
+
+            if queue:
+                queue.popleft().set_result(None)
+                self._active += 1
+                self._credits[key] -= 1
+
+            if not queue:
+                self._ring.popleft()
+                del self._credits[key]
+            elif self._credits[key] <= 0:
+                self._ring.rotate(-1)
+                self._credits[key] = self._weights.get(key, 1)
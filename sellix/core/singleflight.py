@@ -0,0 +1,70 @@
+import asyncio
+import typing as t
+
+T = t.TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key into a single execution.
+
+    The first caller for a key starts the call as a task; every caller arriving while it runs
+    awaits that same task and receives the same result (or exception). The task is shielded, so
+    a caller being cancelled or timing out does not cancel it for the others; it is only
+    cancelled once every caller has left.
+    """
+
+    __slots__ = ("_calls", "_waiters")
+
+    def __init__(self) -> None:
+        self._calls: t.Dict[t.Hashable, asyncio.Future] = {}
+        self._waiters: t.Dict[asyncio.Future, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: t.Hashable,
+        call: t.Callable[[], t.Awaitable[T]],
+        timeout: t.Optional[float] = None,
+    ) -> T:
+        """
+        Runs `call`, unless a call for `key` is already in flight.
+
+        Args:
+            key: Identifies calls which may share a result.
+            call: Starts the call.
+            timeout: Longest this caller waits for the result, in seconds.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            asyncio.TimeoutError: The result was not ready within `timeout`.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._forget(key, future))  # type: ignore
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            if timeout is None:
+                return await asyncio.shield(future)
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+                if not future.done():
+                    # Nobody is interested in the result anymore.
+                    future.cancel()
+
+    def _forget(self, key: t.Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            future.exception()
@@ -0,0 +1,315 @@
+import asyncio
+import msgspec
+import os
+import struct
+import tempfile
+import typing as t
+import zlib
+
+_HEADER = struct.Struct("<IIH")
+"""Length of the record after the header, CRC32 of that part, length of the event name."""
+
+_SUFFIX = ".spool"
+_CHECKPOINT = "checkpoint"
+
+
+class SpoolRecord(msgspec.Struct, frozen=True):
+    """A record read back from a `Spool`."""
+
+    offset: int
+    """Where the record starts."""
+
+    next: int
+    """Where the following record starts, the offset to commit once this one is handled."""
+
+    event: str
+    """The name of the event, e.g. `order:paid`."""
+
+    body: bytes
+    """The raw body, exactly as received."""
+
+
+class Spool:
+    """
+    A durable, append-only log of raw webhook bodies, split into segment files.
+
+    Records are addressed by byte offsets that keep growing across segments; a segment is named
+    after the offset of its first record and a new one is started once it exceeds
+    `segment_size`. `append` returns once the record is on disk, but concurrent appends share
+    one `fsync`: the first one waits `fsync_interval` for others to join it.
+
+    Consumers `read` from an offset and `commit` the offset they have handled, which survives
+    restarts; `truncate` then deletes the segments entirely before it. A record torn by a crash
+    is detected by its checksum and cut off when the spool is opened.
+
+    Args:
+        directory: Where the segments live, created if needed.
+        segment_size: Bytes after which a new segment is started.
+        fsync_interval: Seconds the first append of a batch waits for others to join.
+    """
+
+    def __init__(
+        self,
+        directory: t.Union[str, os.PathLike],
+        segment_size: int = 64 * 1024 * 1024,
+        fsync_interval: float = 0.005,
+    ) -> None:
+        self.directory = os.fspath(directory)
+        self.segment_size = segment_size
+        self.fsync_interval = fsync_interval
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._segments = sorted(
+            int(name[: -len(_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(_SUFFIX)
+        ) or [0]
+        self._end = self._segments[-1] + self._recover(self._segments[-1])
+        self._file = open(self._path(self._segments[-1]), "ab")
+        self._unsynced: t.List[t.BinaryIO] = []
+        self._batch: t.Optional[asyncio.Future] = None
+        self._syncing: t.Optional[asyncio.Future] = None
+        self._appended = asyncio.Event()
+
+        self._committed = self._segments[0]
+        self._checkpoint_scheduled = False
+        try:
+            with open(os.path.join(self.directory, _CHECKPOINT), "rb") as file:
+                self._committed = max(self._committed, int(file.read() or 0))
+        except FileNotFoundError:
+            pass
+
+    @property
+    def end(self) -> int:
+        """The offset the next record will be written at."""
+        return self._end
+
+    @property
+    def committed(self) -> int:
+        """The offset consumers have handled every record before."""
+        return self._committed
+
+    def _path(self, base: int) -> str:
+        return os.path.join(self.directory, f"{base:020d}{_SUFFIX}")
+
+    def _recover(self, base: int) -> int:
+        """Cuts a torn record off the end of a segment, returning the segment's valid size."""
+        path = self._path(base)
+        if not os.path.exists(path):
+            return 0
+
+        valid = 0
+        with open(path, "rb") as file:
+            for record in self._scan(file, base):
+                valid = record.next - base
+            size = file.seek(0, os.SEEK_END)
+        if size != valid:
+            os.truncate(path, valid)
+        return valid
+
+    @staticmethod
+    def _scan(file: t.BinaryIO, base: int) -> t.Iterator[SpoolRecord]:
+        """Reads the records of a segment from the current position, up to the first bad one."""
+        while True:
+            position = file.tell()
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, checksum, event_length = _HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            yield SpoolRecord(
+                base + position,
+                base + position + _HEADER.size + length,
+                payload[:event_length].decode(),
+                payload[event_length:],
+            )
+
+    async def append(self, event: str, body: bytes) -> int:
+        """
+        Appends a record and waits until it is on disk.
+
+        Args:
+            event: The name of the event.
+            body: The raw body.
+
+        Returns:
+            int: The offset of the record.
+        """
+        name = event.encode()
+        payload = name + body
+        offset = self._end
+        self._file.write(_HEADER.pack(len(payload), zlib.crc32(payload), len(name)))
+        self._file.write(payload)
+        self._file.flush()
+        self._end += _HEADER.size + len(payload)
+        if self._end - self._segments[-1] >= self.segment_size:
+            self._roll()
+        self._appended.set()
+
+        loop = asyncio.get_running_loop()
+        if self._batch is None:
+            self._batch = loop.create_future()
+            loop.call_later(self.fsync_interval, self._sync)
+        await asyncio.shield(self._batch)
+        return offset
+
+    def _roll(self) -> None:
+        self._unsynced.append(self._file)
+        self._segments.append(self._end)
+        self._file = open(self._path(self._end), "ab")
+
+    def _sync(self) -> None:
+        batch, self._batch = self._batch, None
+        files, self._unsynced = [*self._unsynced, self._file], []
+        if self._checkpoint_scheduled:
+            self._write_checkpoint()
+        self._syncing = asyncio.ensure_future(
+            self._fsync(batch, files, self._file, self._syncing)
+        )
+
+    async def _fsync(
+        self,
+        batch: t.Optional[asyncio.Future],
+        files: t.List[t.BinaryIO],
+        current: t.BinaryIO,
+        previous: t.Optional[asyncio.Future],
+    ) -> None:
+        # One fsync at a time, so a rolled segment is never closed while still being synced.
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, _fsync_files, files, current
+            )
+        except Exception as error:
+            if batch is not None and not batch.done():
+                batch.set_exception(error)
+        else:
+            if batch is not None and not batch.done():
+                batch.set_result(None)
+
+    async def wait(self, offset: int) -> None:
+        """
+        Waits until a record is appended at or after `offset`.
+
+        Args:
+            offset: The offset a reader has reached.
+        """
+        while self._end <= offset:
+            self._appended.clear()
+            await self._appended.wait()
+
+    def read(self, offset: t.Optional[int] = None) -> t.Iterator[SpoolRecord]:
+        """
+        Reads the records from an offset up to the current end of the spool.
+
+        Args:
+            offset: Where to start, which must be the start of a record. Defaults to
+                `committed`; offsets before the oldest segment start at the oldest record.
+
+        Yields:
+            SpoolRecord: Every record, in order.
+        """
+        if offset is None:
+            offset = self._committed
+        offset = max(offset, self._segments[0])
+        for index, base in enumerate(list(self._segments)):
+            following = self._segments[index + 1] if index + 1 < len(self._segments) else None
+            if following is not None and following <= offset:
+                continue
+            try:
+                file = open(self._path(base), "rb")
+            except FileNotFoundError:
+                continue
+            with file:
+                file.seek(max(offset - base, 0))
+                for record in self._scan(file, base):
+                    offset = record.next
+                    yield record
+
+    def read_batch(self, offset: int, max_bytes: int = 1024 * 1024) -> t.List[SpoolRecord]:
+        """
+        Reads the records from an offset, stopping once `max_bytes` of them were read.
+
+        Only touches the segment files, so it may run in a thread, e.g. with
+        `asyncio.to_thread`, while the event loop keeps appending.
+
+        Args:
+            offset: Where to start, see `read`.
+            max_bytes: Bytes of records after which the batch ends; at least one record is
+                read if any is available.
+
+        Returns:
+            List[SpoolRecord]: The records, in order, empty at the end of the spool.
+        """
+        records = []
+        size = 0
+        for record in self.read(offset):
+            records.append(record)
+            size += record.next - record.offset
+            if size >= max_bytes:
+                break
+        return records
+
+    def commit(self, offset: int) -> None:
+        """
+        Records that every record before `offset` has been handled.
+
+        The checkpoint is written with the next `fsync` batch, or `fsync_interval` from now;
+        after a crash consumers may see a few handled records again.
+
+        Args:
+            offset: The `next` offset of the last handled record.
+        """
+        if offset <= self._committed:
+            return
+        self._committed = offset
+        if not self._checkpoint_scheduled:
+            self._checkpoint_scheduled = True
+            asyncio.get_running_loop().call_later(self.fsync_interval, self._flush_checkpoint)
+
+    def _flush_checkpoint(self) -> None:
+        if self._checkpoint_scheduled:
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        self._checkpoint_scheduled = False
+        descriptor, path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(str(self._committed).encode())
+        os.replace(path, os.path.join(self.directory, _CHECKPOINT))
+
+    def truncate(self) -> int:
+        """
+        Deletes the segments holding only committed records.
+
+        Returns:
+            int: Amount of segments deleted.
+        """
+        deleted = 0
+        while len(self._segments) > 1 and self._segments[1] <= self._committed:
+            os.remove(self._path(self._segments.pop(0)))
+            deleted += 1
+        return deleted
+
+    async def close(self) -> None:
+        """Waits for pending appends, writes the checkpoint and closes the spool."""
+        if self._batch is not None:
+            await asyncio.shield(self._batch)
+        if self._syncing is not None:
+            await asyncio.wait([self._syncing])
+        if self._checkpoint_scheduled:
+            self._write_checkpoint()
+        for file in self._unsynced:
+            file.close()
+        self._unsynced = []
+        self._file.close()
+
+
+def _fsync_files(files: t.List[t.BinaryIO], current: t.BinaryIO) -> None:
+    for file in files:
+        os.fsync(file.fileno())
+        if file is not current:
+            file.close()
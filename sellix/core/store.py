@@ -0,0 +1,249 @@
+from ..abc.modals import Order
+from ..abc.projection import compact, to_compact
+
+import enum
+import msgspec
+import os
+import sqlite3
+import tempfile
+import typing as t
+
+INDEXED_FIELDS = ("customer_email", "crypto_address", "paypal_order_id", "ip", "coupon_id")
+"""The `Order` fields `SQLiteOrderStore` indexes by default."""
+
+
+class OrderStore:
+    """
+    Base class for the local mirrors `OrderSync` keeps orders in.
+
+    Besides the orders, a store keeps the sync watermark, so the two are always saved together
+    by `commit`.
+    """
+
+    watermark: t.Optional[int] = None
+    """The latest `updated_at` synced so far, `None` before the first sync."""
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def get(self, uniqid: str) -> t.Optional[Order]:
+        """
+        Looks an order up.
+
+        Args:
+            uniqid: The `uniqid` of the order.
+
+        Returns:
+            Optional[Order]: The order, `None` if not mirrored.
+        """
+        raise NotImplementedError
+
+    def upsert(self, orders: t.Iterable[Order]) -> int:
+        """
+        Inserts orders, replacing the stored version of those already present.
+
+        Args:
+            orders: The orders.
+
+        Returns:
+            int: Amount of orders written.
+        """
+        raise NotImplementedError
+
+    def commit(self) -> None:
+        """Makes the orders and watermark written so far durable."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Releases the store."""
+
+
+class MemoryOrderStore(OrderStore):
+    """An in-memory mirror, for tests and short-lived processes."""
+
+    def __init__(self) -> None:
+        self.orders: t.Dict[str, Order] = {}
+        self.watermark = None
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def get(self, uniqid: str) -> t.Optional[Order]:
+        return self.orders.get(uniqid)
+
+    def upsert(self, orders: t.Iterable[Order]) -> int:
+        written = 0
+        for order in orders:
+            if order.uniqid is not None:
+                self.orders[order.uniqid] = order
+                written += 1
+        return written
+
+    def commit(self) -> None:
+        pass
+
+
+class _Snapshot(msgspec.Struct, array_like=True):
+    watermark: t.Optional[int]
+    orders: t.List[compact(Order)]  # type: ignore
+
+
+class FileOrderStore(MemoryOrderStore):
+    """
+    A mirror held in memory and saved to a single file on `commit`.
+
+    Orders are saved as array-encoded `CompactOrder`s in MessagePack, along with the watermark,
+    and the file is replaced atomically, so a crash leaves the previous commit intact.
+
+    Args:
+        path: The file, loaded if it exists.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike]) -> None:
+        super().__init__()
+        self.path = os.fspath(path)
+        try:
+            with open(self.path, "rb") as file:
+                snapshot = msgspec.msgpack.decode(file.read(), type=_Snapshot)
+        except FileNotFoundError:
+            return
+
+        self.watermark = snapshot.watermark
+        for stored in snapshot.orders:
+            order = msgspec.convert(stored, Order, from_attributes=True)
+            self.orders[order.uniqid] = order  # type: ignore
+
+    def commit(self) -> None:
+        snapshot = _Snapshot(self.watermark, [to_compact(order) for order in self.orders.values()])
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(msgspec.msgpack.encode(snapshot))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def _column(value: t.Any) -> t.Any:
+    """Turns an indexed value into one SQLite can store, enums becoming their value."""
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+class SQLiteOrderStore(OrderStore):
+    """
+    A mirror kept in an SQLite database, with secondary indexes for lookups the API lacks.
+
+    Every order is stored as one MessagePack row next to copies of the indexed fields, so
+    `find(field, value)` is an index lookup plus a single decode. Upserts write through
+    `executemany` inside the current transaction, which `commit` closes together with the
+    watermark; an older version of an order never replaces a newer one.
+
+    Args:
+        path: The database file, `":memory:"` for a private in-memory database.
+        indexes: The `Order` fields to index.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, os.PathLike],
+        indexes: t.Sequence[str] = INDEXED_FIELDS,
+    ) -> None:
+        fields = set(Order.__struct_fields__)
+        unknown = [name for name in indexes if name not in fields]
+        if unknown:
+            raise ValueError(f"Order has no field(s) {', '.join(unknown)}")
+
+        self.indexes = tuple(indexes)
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(Order)
+        self._db = sqlite3.connect(os.fspath(path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS orders ("
+            "uniqid TEXT PRIMARY KEY, updated_at INTEGER, body BLOB NOT NULL)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(orders)")}
+        for name in self.indexes:
+            if name not in columns:
+                self._db.execute(f"ALTER TABLE orders ADD COLUMN {name}")
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS orders_{name} ON orders ({name})")
+        self._db.commit()
+
+        names = ("uniqid", "updated_at", "body", *self.indexes)
+        self._upsert = (
+            f"INSERT INTO orders ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))}) "
+            "ON CONFLICT (uniqid) DO UPDATE SET "
+            + ", ".join(f"{name} = excluded.{name}" for name in names[1:])
+            + " WHERE orders.updated_at IS NULL OR excluded.updated_at IS NULL"
+            " OR excluded.updated_at >= orders.updated_at"
+        )
+
+    @property  # type: ignore[override]
+    def watermark(self) -> t.Optional[int]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'watermark'").fetchone()
+        return row[0] if row else None
+
+    @watermark.setter
+    def watermark(self, value: t.Optional[int]) -> None:
+        self._db.execute(
+            "INSERT INTO meta (key, value) VALUES ('watermark', ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (value,),
+        )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+
+    def get(self, uniqid: str) -> t.Optional[Order]:
+        row = self._db.execute("SELECT body FROM orders WHERE uniqid = ?", (uniqid,)).fetchone()
+        return self._decoder.decode(row[0]) if row else None
+
+    def find(self, field: str, value: t.Any) -> t.List[Order]:
+        """
+        Looks orders up by an indexed field.
+
+        Args:
+            field: One of `indexes`, e.g. `"customer_email"`.
+            value: The value to match exactly.
+
+        Returns:
+            List[Order]: The matching orders, most recently updated first.
+        """
+        if field not in self.indexes:
+            raise ValueError(f"{field!r} is not indexed, indexed fields are {self.indexes}")
+        rows = self._db.execute(
+            f"SELECT body FROM orders WHERE {field} = ? ORDER BY updated_at DESC",
+            (_column(value),),
+        )
+        return [self._decoder.decode(body) for body, in rows]
+
+    def upsert(self, orders: t.Iterable[Order]) -> int:
+        encode = self._encoder.encode
+        rows = [
+            (
+                order.uniqid,
+                order.updated_at,
+                encode(order),
+                *(_column(getattr(order, name)) for name in self.indexes),
+            )
+            for order in orders
+            if order.uniqid is not None
+        ]
+        if not rows:
+            return 0
+        return self._db.executemany(self._upsert, rows).rowcount
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
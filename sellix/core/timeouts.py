@@ -0,0 +1,147 @@
+from ..enums.genric import APIEndpoints
+from .exceptions import DeadlineExceeded
+
+import aiohttp
+import contextlib
+import contextvars
+import time
+import typing as t
+
+T = t.TypeVar("T")
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30.0, connect=5.0, sock_read=15.0)
+"""Timeout of the endpoints missing from the timeouts of a client."""
+
+DEFAULT_TIMEOUTS: t.Dict[APIEndpoints, aiohttp.ClientTimeout] = {
+    api_method: aiohttp.ClientTimeout(total=60.0, connect=5.0, sock_read=30.0)
+    for api_method in APIEndpoints
+    if api_method.name.endswith("_LIST")
+}
+"""Default timeouts per endpoint, longer for the list endpoints, which return whole pages."""
+
+
+class Deadline:
+    """
+    A point in time by which a group of requests must be done.
+
+    Args:
+        expires_at: When the deadline expires, on the `clock`.
+        clock: Monotonic clock the deadline is measured on.
+    """
+
+    __slots__ = ("expires_at", "_clock")
+
+    def __init__(
+        self,
+        expires_at: float,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.expires_at = expires_at
+        self._clock = clock
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, `0` once expired."""
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self._clock() >= self.expires_at
+
+    def check(self, wait: float = 0.0) -> None:
+        """
+        Makes sure there is time left for a wait.
+
+        Args:
+            wait: Seconds about to be waited.
+
+        Raises:
+            DeadlineExceeded: The deadline passes before the wait is over.
+        """
+        if self._clock() + wait >= self.expires_at:
+            raise DeadlineExceeded(self.remaining)
+
+
+_current: "contextvars.ContextVar[t.Optional[Deadline]]" = contextvars.ContextVar(
+    "sellix_deadline", default=None
+)
+
+
+def current_deadline() -> t.Optional[Deadline]:
+    """
+    Returns the deadline requests sent from the current context must meet.
+
+    Returns:
+        Optional[Deadline]: The innermost `deadline`, `None` outside of any.
+    """
+    return _current.get()
+
+
+@contextlib.asynccontextmanager
+async def deadline(seconds: float) -> t.AsyncIterator[Deadline]:
+    """
+    Gives every request sent within the block `seconds` to complete, all together.
+
+    The deadline is kept in a context variable, so it also applies to the tasks started
+    within the block, e.g. by `fan_out` or pagination. Nested deadlines never extend the outer
+    one.
+
+    Args:
+        seconds: Time the block has, from now.
+
+    Yields:
+        Deadline: The deadline of the block.
+    """
+    scope = Deadline(time.monotonic() + seconds)
+    outer = _current.get()
+    if outer is not None and outer.expires_at <= scope.expires_at:
+        scope = outer
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+
+
+async def without_deadline(call: t.Callable[[], t.Awaitable[T]]) -> T:
+    """
+    Runs `call` free of the current deadline.
+
+    The deadline is cleared in the current context, so only await this in a task of its own,
+    e.g. one shared by callers with different deadlines.
+
+    Args:
+        call: Starts the call.
+
+    Returns:
+        T: The result of the call.
+    """
+    _current.set(None)
+    return await call()
+
+
+def bound(timeout: aiohttp.ClientTimeout, limit: t.Optional[Deadline]) -> aiohttp.ClientTimeout:
+    """
+    Shortens a timeout so the request cannot outlive a deadline.
+
+    Args:
+        timeout: The timeout of the endpoint.
+        limit: The deadline, if any.
+
+    Returns:
+        aiohttp.ClientTimeout: A timeout whose `total` ends by the deadline.
+    """
+    if limit is None:
+        return timeout
+    remaining = limit.remaining
+    if timeout.total is not None and timeout.total <= remaining:
+        return timeout
+    return aiohttp.ClientTimeout(
+        total=remaining,
+        connect=timeout.connect,
+        sock_read=timeout.sock_read,
+        sock_connect=timeout.sock_connect,
+        # Otherwise aiohttp rounds timeouts of 5 seconds and more up to whole seconds.
+        ceil_threshold=max(timeout.ceil_threshold, remaining + 1),
+    )
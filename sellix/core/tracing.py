@@ -0,0 +1,216 @@
+from ..enums.genric import APIEndpoints
+from .exceptions import HTTPException
+from .instrumentation import Instrumentation
+
+import collections
+import contextvars
+import msgspec
+import random
+import time
+import typing as t
+
+
+class SpanEvent(msgspec.Struct, rename="camel"):
+    """Something that happened during a span, e.g. a retry."""
+
+    name: str
+    time_unix_nano: int
+    attributes: t.Dict[str, t.Any] = {}
+
+
+class Span(msgspec.Struct, kw_only=True, rename="camel"):
+    """
+    A finished span, shaped after the OpenTelemetry data model.
+
+    Encoded with `msgspec.json`, fields use the camelCase names of OTLP/JSON.
+    """
+
+    trace_id: str
+    """32 hex digits shared by every span of a trace."""
+
+    span_id: str
+    """16 hex digits identifying the span."""
+
+    parent_span_id: t.Optional[str] = None
+    """The span this one is part of, `None` for a root span."""
+
+    name: str
+    """What the span covers, e.g. `GET GET_ORDER`."""
+
+    kind: str = "CLIENT"
+    """The OpenTelemetry span kind."""
+
+    start_time_unix_nano: int
+    end_time_unix_nano: int = 0
+
+    attributes: t.Dict[str, t.Any] = {}
+    """Attributes, named after the OpenTelemetry semantic conventions where one exists."""
+
+    events: t.List[SpanEvent] = []
+
+    status: str = "OK"
+    """`OK` or `ERROR`."""
+
+
+_current: "contextvars.ContextVar[t.Optional[Span]]" = contextvars.ContextVar(
+    "sellix_span", default=None
+)
+_ended: "contextvars.ContextVar[t.Optional[Span]]" = contextvars.ContextVar(
+    "sellix_ended_span", default=None
+)
+"""The last request span ended in the context, the parent of the decoding that follows."""
+
+
+def _error_attributes(error: BaseException) -> t.Dict[str, t.Any]:
+    attributes: t.Dict[str, t.Any] = {"error.type": type(error).__name__}
+    if isinstance(error, HTTPException):
+        attributes["http.response.status_code"] = error.status
+    return attributes
+
+
+class Tracer(Instrumentation):
+    """
+    Records client requests as spans.
+
+    Every request is a span, with one child span per HTTP exchange (retries and hedges
+    included) and an event per retry; decoding the response is a child span of its own. Spans
+    started while another is current, even a request of another client, join its trace.
+
+    Finished spans are handed to `exporter`, or kept in `spans` (the latest `maxlen`) to be
+    collected with `drain`.
+
+    Args:
+        exporter: Called with every finished span.
+        maxlen: Finished spans kept without an exporter.
+    """
+
+    def __init__(
+        self,
+        exporter: t.Optional[t.Callable[[Span], None]] = None,
+        maxlen: int = 10_000,
+    ) -> None:
+        self.exporter = exporter
+        self.spans: t.Deque[Span] = collections.deque(maxlen=maxlen)
+
+    def drain(self) -> t.List[Span]:
+        """
+        Takes the finished spans kept so far.
+
+        Returns:
+            List[Span]: The spans, oldest first.
+        """
+        spans = list(self.spans)
+        self.spans.clear()
+        return spans
+
+    def _export(self, span: Span) -> None:
+        if self.exporter is None:
+            self.spans.append(span)
+        else:
+            self.exporter(span)
+
+    @staticmethod
+    def _span(
+        name: str,
+        start: int,
+        attributes: t.Dict[str, t.Any],
+        parent: t.Optional[Span] = None,
+    ) -> Span:
+        if parent is None:
+            parent = _current.get()
+        return Span(
+            trace_id=f"{random.getrandbits(128):032x}" if parent is None else parent.trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_span_id=None if parent is None else parent.span_id,
+            name=name,
+            start_time_unix_nano=start,
+            attributes=attributes,
+        )
+
+    def start_request(self, api_method: APIEndpoints, method: str) -> t.Any:
+        span = self._span(
+            f"{method} {api_method.name}",
+            time.time_ns(),
+            {"http.request.method": method, "sellix.endpoint": api_method.name},
+        )
+        return span, _current.set(span)
+
+    def end_request(self, state: t.Any, error: t.Optional[BaseException]) -> None:
+        span, token = state
+        _current.reset(token)
+        _ended.set(span)
+        span.end_time_unix_nano = time.time_ns()
+        if error is not None:
+            span.status = "ERROR"
+            span.attributes.update(_error_attributes(error))
+        self._export(span)
+
+    def on_attempt(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        status: t.Optional[int],
+        latency: float,
+        sent: int,
+        received: int,
+        error: t.Optional[BaseException] = None,
+    ) -> None:
+        end = time.time_ns()
+        attributes: t.Dict[str, t.Any] = {
+            "http.request.method": method,
+            "sellix.endpoint": api_method.name,
+            "http.request.header.size": sent,
+            "http.response.body.size": received,
+        }
+        if status is not None:
+            attributes["http.response.status_code"] = status
+        span = self._span(
+            f"{method} {api_method.name} attempt", end - int(latency * 1e9), attributes
+        )
+        span.end_time_unix_nano = end
+        if error is not None or (status is not None and status >= 400):
+            span.status = "ERROR"
+            if error is not None:
+                span.attributes.update(_error_attributes(error))
+        self._export(span)
+
+    def on_rate_limit(self, api_method: APIEndpoints, waited: float) -> None:
+        span = _current.get()
+        if span is not None:
+            span.attributes["sellix.rate_limit.wait"] = (
+                span.attributes.get("sellix.rate_limit.wait", 0.0) + waited
+            )
+
+    def on_retry(
+        self,
+        api_method: APIEndpoints,
+        method: str,
+        error: BaseException,
+        delay: float,
+    ) -> None:
+        span = _current.get()
+        if span is not None:
+            attributes = _error_attributes(error)
+            attributes["sellix.retry.delay"] = delay
+            span.events.append(SpanEvent("retry", time.time_ns(), attributes))
+
+    def on_cache(self, api_method: APIEndpoints, result: str) -> None:
+        span = _current.get()
+        if span is not None:
+            span.attributes["sellix.cache"] = result
+
+    def on_decode(self, api_method: APIEndpoints, seconds: float, size: int) -> None:
+        end = time.time_ns()
+        request = _ended.get()
+        span = self._span(
+            f"decode {api_method.name}",
+            end - int(seconds * 1e9),
+            {"sellix.endpoint": api_method.name, "sellix.decode.size": size},
+            request
+            if request is not None
+            and request.attributes.get("sellix.endpoint") == api_method.name
+            else None,
+        )
+        span.kind = "INTERNAL"
+        span.end_time_unix_nano = end
+        self._export(span)
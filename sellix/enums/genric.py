@@ -19,14 +19,13 @@ class MerchantTier(Enum):
     - `STANDARD`: Represents the standard tier with a value of 5.
     """
 
-    TIER_1 = (75,)
+    TIER_1 = 75
     """
     Represents Tier 1 with a rate-limit of 75 requests per 10s.
     - `TIER_1`: Represents Tier 1 with a rate-limit of 75.
     """
 
-    TIER_2 = (100,)
-
+    TIER_2 = 100
     """
     Represents Tier 2 with a rate-limit of 100 requests per 10s.
     - `TIER_2`: Represents Tier 2 with a rate-limit of 100.
@@ -342,3 +341,16 @@ class APIEndpoints(Enum):
     """
     `GET` List of queries.
     """
+
+
+class CircuitState(Enum):
+    """
+    A class representing the states of a `CircuitBreaker`.
+    """
+
+    CLOSED = "closed"
+    """Requests go through, their outcomes are tracked."""
+    OPEN = "open"
+    """Requests fail straight away, without reaching the API."""
+    HALF_OPEN = "half_open"
+    """A few probe requests go through to test whether the API recovered."""
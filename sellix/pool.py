@@ -0,0 +1,135 @@
+from .client import SellixClientX
+from .core.breaker import CircuitBreakers
+from .core.connector import ConnectorPool
+from .core.hedging import HedgePolicy
+from .core.instrumentation import Instrumentation
+from .core.retry import RetryBudget, RetryPolicy
+from .core.scheduler import FairScheduler
+from .enums.genric import MerchantTier
+
+import typing as t
+
+
+class SellixClientPool:
+    """
+    Manages one `SellixClientX` per merchant behind a single object.
+
+    Every merchant keeps its own rate limiter, sized from its `MerchantTier`, while all of them
+    share one connector pool and one `FairScheduler`. When the pool is saturated, freed request
+    slots go to the merchants in weighted round-robin, so a merchant running a large backfill
+    cannot starve the others.
+
+    Args:
+        auth_key: Default API key, used for merchants added without their own.
+        concurrency: Amount of requests allowed in flight across every merchant.
+        connector_pool: Connector pool to share, one is created (and owned) if not given.
+        custom_rate_limit_time: Window of the per-merchant rate limiters, in seconds.
+        retry_policy: Retry policy shared by every merchant, so its budget caps retries across
+            the whole pool. Defaults to a `RetryPolicy` with a `RetryBudget`.
+        circuit_breakers: Circuit breakers shared by every merchant, so an endpoint failing for
+            one merchant stops being called for all of them.
+        hedging: Hedging policy shared by every merchant, which then share latency estimates.
+        instrumentation: Hooks called by every merchant's client, e.g. one `Metrics` for the
+            whole pool.
+    """
+
+    def __init__(
+        self,
+        auth_key: t.Optional[str] = None,
+        concurrency: int = 50,
+        connector_pool: t.Optional[ConnectorPool] = None,
+        custom_rate_limit_time: t.Optional[int] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        circuit_breakers: t.Optional[CircuitBreakers] = None,
+        hedging: t.Optional[HedgePolicy] = None,
+        instrumentation: t.Optional[Instrumentation] = None,
+    ) -> None:
+        self.auth_key = auth_key
+        self.custom_rate_limit_time = custom_rate_limit_time
+        self.retry_policy = retry_policy or RetryPolicy(budget=RetryBudget())
+        self.circuit_breakers = circuit_breakers
+        self.hedging = hedging
+        self.instrumentation = instrumentation
+        self.scheduler = FairScheduler(concurrency)
+        self._owns_connector_pool = connector_pool is None
+        self.connector_pool = connector_pool or ConnectorPool(limit=concurrency)
+        self._clients: t.Dict[str, SellixClientX] = {}
+
+    def add_merchant(
+        self,
+        merchant_id: str,
+        merchant_tier: MerchantTier = MerchantTier.STANDARD,
+        weight: int = 1,
+        auth_key: t.Optional[str] = None,
+    ) -> SellixClientX:
+        """
+        Adds a merchant to the pool.
+
+        Args:
+            merchant_id: The merchant, sent as `X-Sellix-Merchant`.
+            merchant_tier: The tier the merchant's rate limiter is sized from.
+            weight: Request slots the merchant receives per round when the pool is saturated.
+            auth_key: API key of the merchant, defaults to the key of the pool.
+
+        Returns:
+            SellixClientX: The client of the merchant.
+        """
+        if merchant_id in self._clients:
+            raise ValueError(f"merchant {merchant_id!r} is already in the pool")
+
+        auth_key = auth_key or self.auth_key
+        if auth_key is None:
+            raise ValueError("auth_key cannot be None")
+
+        self.scheduler.register(merchant_id, weight)
+        client = SellixClientX(
+            auth_key=auth_key,
+            merchant_id=merchant_id,
+            merchant_tier=merchant_tier,
+            enable_auto_rate_limit_handler=True,
+            custom_rate_limit_time=self.custom_rate_limit_time,
+            connector_pool=self.connector_pool,
+            scheduler=self.scheduler,
+            retry_policy=self.retry_policy,
+            circuit_breakers=self.circuit_breakers,
+            hedging=self.hedging,
+            instrumentation=self.instrumentation,
+        )
+        self._clients[merchant_id] = client
+        return client
+
+    async def remove_merchant(self, merchant_id: str) -> None:
+        """
+        Removes a merchant from the pool and closes its client.
+
+        Args:
+            merchant_id: The merchant to remove.
+        """
+        client = self._clients.pop(merchant_id)
+        self.scheduler.unregister(merchant_id)
+        await client.close()
+
+    def __getitem__(self, merchant_id: str) -> SellixClientX:
+        return self._clients[merchant_id]
+
+    def __contains__(self, merchant_id: object) -> bool:
+        return merchant_id in self._clients
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def close(self) -> None:
+        """Closes every client, and the connector pool if the pool created it."""
+        for client in self._clients.values():
+            await client.close()
+        if self._owns_connector_pool:
+            await self.connector_pool.close()
+
+    async def __aenter__(self) -> "SellixClientPool":
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
@@ -0,0 +1,125 @@
+from .abc.modals import Order
+from .client import SellixClientX
+from .core.store import OrderStore
+from .enums.genric import APIEndpoints
+
+import msgspec
+import time
+import typing as t
+
+
+class SyncResult(msgspec.Struct):
+    """The outcome of one `OrderSync.run`."""
+
+    scanned: int
+    """Amount of orders read from the API."""
+
+    written: int
+    """Amount of new or changed orders written to the store."""
+
+    watermark: t.Optional[int]
+    """The watermark after the sync."""
+
+    full: bool
+    """Whether every order was scanned."""
+
+    elapsed: float
+    """Seconds the sync took."""
+
+
+def _changed_at(order: Order) -> t.Optional[int]:
+    return order.updated_at if order.updated_at is not None else order.created_at
+
+
+class OrderSync:
+    """
+    Keeps a local mirror of the orders of a shop up to date.
+
+    The first run writes every order. Later runs only write the orders changed since the
+    watermark, the latest `updated_at` seen, minus `lookback`; the others are skipped. The
+    watermark is committed together with the orders, and only once a run completes, so an
+    interrupted run simply starts again from the previous watermark.
+
+    With `updated_first`, the order list is read latest change first, and the scan stops after
+    `stop_after` consecutive unchanged orders. This is only safe when the list returns
+    recently changed orders first, which it does not by default: it is sorted by creation, so
+    a change to an older order sits below the orders the scan would stop at. Without
+    `updated_first`, or on a `full` run, every order is scanned.
+
+    Args:
+        client: The client of the shop.
+        store: The mirror.
+        params: Extra query string parameters of `GET /v1/orders`.
+        updated_first: Whether `params` sort the list by `updated_at`, latest first, which
+            lets runs stop early.
+        lookback: Seconds before the watermark still re-read, covering clock skew and orders
+            updated while the previous run was going.
+        stop_after: Consecutive unchanged orders after which the scan stops, with
+            `updated_first`.
+        batch_size: Orders written to the store at once.
+    """
+
+    def __init__(
+        self,
+        client: SellixClientX,
+        store: OrderStore,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        updated_first: bool = False,
+        lookback: int = 300,
+        stop_after: int = 100,
+        batch_size: int = 500,
+    ) -> None:
+        self.client = client
+        self.store = store
+        self.params = params
+        self.updated_first = updated_first
+        self.lookback = lookback
+        self.stop_after = stop_after
+        self.batch_size = batch_size
+
+    async def run(self, full: bool = False) -> SyncResult:
+        """
+        Pulls the orders changed since the last run into the store.
+
+        Args:
+            full: Scan every order, even with `updated_first`. Only changed orders are
+                written either way.
+
+        Returns:
+            SyncResult: What the run did.
+        """
+        start = time.monotonic()
+        watermark = self.store.watermark
+        full = full or watermark is None or not self.updated_first
+        threshold = None if watermark is None else watermark - self.lookback
+        latest = watermark
+
+        scanned = written = unchanged = 0
+        batch: t.List[Order] = []
+        # A cached first page would hide every change made since it was cached.
+        self.client.invalidate_cache(APIEndpoints.GET_ORDER_LIST)
+        orders = self.client.iter_orders(self.params)
+        try:
+            async for order in orders:
+                scanned += 1
+                changed_at = _changed_at(order)
+                if threshold is not None and changed_at is not None and changed_at <= threshold:
+                    unchanged += 1
+                    if not full and unchanged >= self.stop_after:
+                        break
+                    continue
+
+                unchanged = 0
+                if changed_at is not None and (latest is None or changed_at > latest):
+                    latest = changed_at
+                batch.append(order)
+                if len(batch) >= self.batch_size:
+                    written += self.store.upsert(batch)
+                    batch = []
+        finally:
+            await orders.aclose()  # type: ignore
+
+        written += self.store.upsert(batch)
+        self.store.watermark = latest
+        self.store.commit()
+        return SyncResult(scanned, written, latest, full, time.monotonic() - start)
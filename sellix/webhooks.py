@@ -0,0 +1,470 @@
+from .abc.interaction import WebhookPayload
+from .abc.modals import Order
+from .abc.subtype import Product
+from .core.decoders import get_decoder
+from .core.dedup import DedupIndex
+from .core.spool import Spool, SpoolRecord
+from .enums.genric import WebHookEvents
+
+import aiohttp.web
+import asyncio
+import collections
+import hashlib
+import hmac
+import logging
+import msgspec
+import typing as t
+
+log = logging.getLogger(__name__)
+
+Handler = t.Callable[[WebHookEvents, WebhookPayload], t.Awaitable[None]]
+"""A coroutine function handling a webhook, given its event and decoded payload."""
+
+EVENTS: t.Dict[str, WebHookEvents] = {event.value[0]: event for event in WebHookEvents}
+"""Every webhook event, by name."""
+
+DATA_TYPES: t.Dict[str, t.Any] = {"order": Order, "product": Product}
+"""The type `data` is decoded into, by resource (`order` for `order:paid`)."""
+
+SIGNATURE_HEADER = "X-Sellix-Signature"
+"""The header holding the HMAC-SHA512 signature of the body."""
+
+EVENT_HEADER = "X-Sellix-Event"
+"""The header holding the name of the event."""
+
+
+class _EventName(msgspec.Struct):
+    event: str
+
+
+def sign(secret: t.Union[str, bytes], body: bytes) -> str:
+    """
+    Computes the signature Sellix sends with a webhook.
+
+    Args:
+        secret: The webhook secret of the shop.
+        body: The raw body of the webhook.
+
+    Returns:
+        str: The hexadecimal HMAC-SHA512 of `body`.
+    """
+    if isinstance(secret, str):
+        secret = secret.encode()
+    return hmac.new(secret, body, hashlib.sha512).hexdigest()
+
+
+def verify_signature(
+    secret: t.Union[str, bytes], body: bytes, signature: t.Optional[str]
+) -> bool:
+    """
+    Checks the signature of a webhook, in constant time.
+
+    Args:
+        secret: The webhook secret of the shop.
+        body: The raw body of the webhook.
+        signature: The value of the `X-Sellix-Signature` header.
+
+    Returns:
+        bool: Whether the webhook was signed with `secret`.
+    """
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body), signature.strip().lower())
+
+
+def payload_type(event: WebHookEvents) -> t.Any:
+    """
+    Returns the type the payload of an event is decoded into.
+
+    Args:
+        event: The event.
+
+    Returns:
+        The `WebhookPayload` of the event's resource, with a plain `dict` as `data` for resources
+            that have no model.
+    """
+    resource = event.value[0].split(":", 1)[0]
+    return WebhookPayload[DATA_TYPES.get(resource, t.Dict[str, t.Any])]  # type: ignore
+
+
+def dedup_key(
+    event: WebHookEvents, payload: WebhookPayload, merge_variants: bool = False
+) -> t.Optional[t.Tuple[str, t.Any, t.Any]]:
+    """
+    Identifies a delivery, so redeliveries of it can be recognised.
+
+    Args:
+        event: The event of the webhook.
+        payload: Its decoded payload.
+        merge_variants: Key `order:paid:product` like `order:paid`, so only the first of the
+            two deliveries Sellix makes for an order passes.
+
+    Returns:
+        Optional[Tuple[str, Any, Any]]: `(event, uniqid, updated_at)`, `None` when the payload
+            has no `uniqid` to tell deliveries apart.
+    """
+    data = payload.data
+    if isinstance(data, dict):
+        uniqid, updated_at = data.get("uniqid"), data.get("updated_at")
+    else:
+        uniqid = getattr(data, "uniqid", None)
+        updated_at = getattr(data, "updated_at", None)
+    if uniqid is None:
+        return None
+
+    name = event.value[0]
+    if merge_variants and name.endswith(":product"):
+        name = name[: -len(":product")]
+    return name, uniqid, updated_at
+
+
+class WebhookReceiver:
+    """
+    Receives Sellix webhooks over HTTP and dispatches them to handlers.
+
+    A webhook is verified and decoded in the request, queued, and acknowledged straight away;
+    a fixed amount of workers then run the handlers. When the queue is full the request waits
+    for room, up to `enqueue_timeout`, then is answered `503` so Sellix delivers it again
+    later. A burst therefore slows senders down instead of growing memory or spawning unbounded
+    tasks.
+
+    With a `spool`, a verified webhook is instead acknowledged as soon as its raw body is on
+    disk, however busy the handlers are. A reader feeds the queue from the spool and commits
+    every record once handled, so webhooks left unhandled by a crash are handled on the next
+    start, and `replay` runs the handlers again over any past range.
+
+    Args:
+        secret: The webhook secret of the shop, used to verify signatures.
+        concurrency: Amount of handlers running at once.
+        queue_size: Amount of verified webhooks waiting for a worker.
+        enqueue_timeout: Seconds a request waits for room in the queue, unused with a spool.
+        path: The path webhooks are posted to.
+        spool: Durable log to acknowledge webhooks from. It is not closed by the receiver.
+        dedup: Index of recent deliveries; a webhook whose `dedup_key` it has seen is dropped
+            before reaching the queue. `replay` bypasses it.
+        merge_variants: Treat `order:*:product` events as duplicates of `order:*`, see
+            `dedup_key`. Only use it if handlers are registered for one of the two.
+    """
+
+    def __init__(
+        self,
+        secret: t.Union[str, bytes],
+        concurrency: int = 64,
+        queue_size: int = 1024,
+        enqueue_timeout: float = 5.0,
+        path: str = "/webhook",
+        spool: t.Optional[Spool] = None,
+        dedup: t.Optional[DedupIndex] = None,
+        merge_variants: bool = False,
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+
+        self.secret = secret.encode() if isinstance(secret, str) else secret
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.path = path
+        self.spool = spool
+        self.dedup = dedup
+        self.merge_variants = merge_variants
+        self._handlers: t.Dict[t.Optional[WebHookEvents], t.List[Handler]] = {}
+        self._queue: t.Optional[asyncio.Queue] = None
+        self._workers: t.List[asyncio.Task] = []
+        self._reader: t.Optional[asyncio.Task] = None
+        self._reading: t.Deque[SpoolRecord] = collections.deque()
+        self._handled: t.Set[int] = set()
+
+    def on(self, *events: WebHookEvents) -> t.Callable[[Handler], Handler]:
+        """
+        Registers a handler, as a decorator.
+
+        Args:
+            *events (WebHookEvents): The events to handle, every event if none is given.
+
+        Returns:
+            Callable: The decorator, returning the handler unchanged.
+        """
+
+        def register(handler: Handler) -> Handler:
+            for event in events or (None,):
+                self._handlers.setdefault(event, []).append(handler)
+            return handler
+
+        return register
+
+    def add_handler(self, handler: Handler, *events: WebHookEvents) -> None:
+        """
+        Registers a handler.
+
+        Args:
+            handler (Handler): The coroutine function to call.
+            *events (WebHookEvents): The events to handle, every event if none is given.
+        """
+        self.on(*events)(handler)
+
+    @property
+    def pending(self) -> int:
+        """Amount of webhooks waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Starts the workers, and the reader of the spool."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._workers = [
+            asyncio.ensure_future(self._work(self._queue)) for _ in range(self.concurrency)
+        ]
+        if self.spool is not None:
+            self._reader = asyncio.ensure_future(self._read(self.spool, self._queue))
+
+    async def close(self) -> None:
+        """
+        Waits for the queued webhooks to be handled, then stops the workers.
+
+        Spooled webhooks not read yet stay in the spool for the next start.
+        """
+        if self._queue is None:
+            return
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queue = None
+        self._workers = []
+        self._reading.clear()
+        self._handled.clear()
+
+    def app(self) -> aiohttp.web.Application:
+        """
+        Builds an application serving the receiver at `path`.
+
+        Returns:
+            aiohttp.web.Application: The application, starting and closing the receiver with it.
+        """
+        app = aiohttp.web.Application()
+        app.router.add_post(self.path, self.handle)
+        app.on_startup.append(lambda _: self.start())
+        app.on_shutdown.append(lambda _: self.close())
+        return app
+
+    def verify(self, body: bytes, headers: t.Mapping[str, str]) -> WebHookEvents:
+        """
+        Verifies a webhook and identifies its event.
+
+        Args:
+            body: The raw body.
+            headers: The request headers.
+
+        Returns:
+            WebHookEvents: The event.
+
+        Raises:
+            PermissionError: The signature is missing or wrong.
+            ValueError: The event is unknown or the body is malformed.
+        """
+        if not verify_signature(self.secret, body, headers.get(SIGNATURE_HEADER)):
+            raise PermissionError("invalid webhook signature")
+
+        name = headers.get(EVENT_HEADER)
+        if name is None:
+            try:
+                name = get_decoder(_EventName).decode(body).event
+            except msgspec.DecodeError as error:
+                raise ValueError(f"malformed webhook: {error}") from error
+        event = EVENTS.get(name)
+        if event is None:
+            raise ValueError(f"unknown webhook event {name!r}")
+        return event
+
+    @staticmethod
+    def decode(event: WebHookEvents, body: bytes) -> WebhookPayload:
+        """
+        Decodes the payload of a webhook.
+
+        Args:
+            event: The event of the webhook.
+            body: The raw body.
+
+        Returns:
+            WebhookPayload: The payload, typed after `payload_type(event)`.
+
+        Raises:
+            ValueError: The body is malformed.
+        """
+        try:
+            return get_decoder(payload_type(event)).decode(body)
+        except msgspec.DecodeError as error:
+            raise ValueError(f"malformed {event.value[0]} webhook: {error}") from error
+
+    def parse(
+        self, body: bytes, headers: t.Mapping[str, str]
+    ) -> t.Tuple[WebHookEvents, WebhookPayload]:
+        """
+        Verifies and decodes a webhook.
+
+        Args:
+            body: The raw body.
+            headers: The request headers.
+
+        Returns:
+            Tuple[WebHookEvents, WebhookPayload]: The event and its decoded payload.
+
+        Raises:
+            PermissionError: The signature is missing or wrong.
+            ValueError: The event is unknown or the body is malformed.
+        """
+        event = self.verify(body, headers)
+        return event, self.decode(event, body)
+
+    async def handle(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        """
+        The request handler of the receiver, usable in any aiohttp application.
+
+        Args:
+            request: The webhook request.
+
+        Returns:
+            aiohttp.web.Response: `200` once queued (or spooled), `401` for a bad signature,
+                `400` for a malformed webhook and `503` when the queue stays full.
+        """
+        body = await request.read()
+        try:
+            if self.spool is not None:
+                event = self.verify(body, request.headers)
+            else:
+                event, payload = self.parse(body, request.headers)
+        except PermissionError as error:
+            return aiohttp.web.Response(status=401, text=str(error))
+        except ValueError as error:
+            return aiohttp.web.Response(status=400, text=str(error))
+
+        if self._queue is None:
+            await self.start()
+        if self.spool is not None:
+            await self.spool.append(event.value[0], body)
+            return aiohttp.web.Response(status=200)
+        key = None
+        if self.dedup is not None:
+            key = dedup_key(event, payload, self.merge_variants)
+            if key is not None and not self.dedup.add(key):
+                return aiohttp.web.Response(status=200)
+
+        queued = False
+        try:
+            await asyncio.wait_for(
+                self._queue.put((event, payload, None)), self.enqueue_timeout  # type: ignore
+            )
+            queued = True
+        except asyncio.TimeoutError:
+            return aiohttp.web.Response(
+                status=503, headers={"Retry-After": str(max(1, round(self.enqueue_timeout)))}
+            )
+        finally:
+            # A delivery which was not queued will be sent again, and must not be a duplicate.
+            if not queued and key is not None:
+                self.dedup.discard(key)  # type: ignore
+        return aiohttp.web.Response(status=200)
+
+    async def dispatch(self, event: WebHookEvents, payload: WebhookPayload) -> None:
+        """
+        Runs every handler of an event, logging the exceptions they raise.
+
+        Args:
+            event: The event.
+            payload: Its decoded payload.
+        """
+        for handler in (*self._handlers.get(event, ()), *self._handlers.get(None, ())):
+            try:
+                await handler(event, payload)
+            except Exception:
+                log.exception("webhook handler %r failed on %s", handler, event.value[0])
+
+    async def replay(self, offset: int = 0, end: t.Optional[int] = None) -> int:
+        """
+        Runs the handlers again over spooled webhooks, one at a time and in order.
+
+        Args:
+            offset: The offset to start from, `0` for the oldest record kept.
+            end: The offset to stop before, defaults to the end of the spool.
+
+        Returns:
+            int: Amount of webhooks replayed.
+        """
+        if self.spool is None:
+            raise ValueError("replay needs a spool")
+
+        replayed = 0
+        while True:
+            records = await asyncio.to_thread(self.spool.read_batch, offset)
+            if not records:
+                return replayed
+            for record in records:
+                if end is not None and record.offset >= end:
+                    return replayed
+                offset = record.next
+                decoded = self._decode_record(record)
+                if decoded is not None:
+                    await self.dispatch(*decoded)
+                    replayed += 1
+
+    def _decode_record(
+        self, record: SpoolRecord
+    ) -> t.Optional[t.Tuple[WebHookEvents, WebhookPayload]]:
+        event = EVENTS.get(record.event)
+        try:
+            if event is None:
+                raise ValueError(f"unknown webhook event {record.event!r}")
+            return event, self.decode(event, record.body)
+        except ValueError:
+            log.exception("skipping spooled webhook at offset %d", record.offset)
+            return None
+
+    async def _read(self, spool: Spool, queue: asyncio.Queue) -> None:
+        offset = spool.committed
+        while True:
+            # Segments are read in a thread, a batch at a time, so draining a large backlog
+            # does not hold up the loop serving the webhook endpoint.
+            records = await asyncio.to_thread(spool.read_batch, offset)
+            if not records:
+                await spool.wait(offset)
+                continue
+            for record in records:
+                offset = record.next
+                self._reading.append(record)
+                decoded = self._decode_record(record)
+                if decoded is None or self._duplicate(*decoded):
+                    self._done(record)
+                else:
+                    await queue.put((*decoded, record))
+
+    def _duplicate(self, event: WebHookEvents, payload: WebhookPayload) -> bool:
+        if self.dedup is None:
+            return False
+        key = dedup_key(event, payload, self.merge_variants)
+        return key is not None and not self.dedup.add(key)
+
+    def _done(self, record: SpoolRecord) -> None:
+        """Commits every record up to the oldest one still being handled."""
+        self._handled.add(record.offset)
+        committed = None
+        while self._reading and self._reading[0].offset in self._handled:
+            committed = self._reading.popleft()
+            self._handled.discard(committed.offset)
+        if committed is not None:
+            self.spool.commit(committed.next)  # type: ignore
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            event, payload, record = await queue.get()
+            try:
+                await self.dispatch(event, payload)
+                if record is not None:
+                    self._done(record)
+            finally:
+                queue.task_done()
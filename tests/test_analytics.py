@@ -0,0 +1,59 @@
+import datetime
+import random
+import typing as t
+
+import msgspec
+import pytest
+
+from sellix.core import analytics
+from sellix.core.analytics import GROUPS, AnalyticsRow, RevenueAnalytics
+
+
+def _orders(count: int) -> t.List[t.Any]:
+    generator = random.Random(7)
+    orders = []
+    for index in range(count):
+        currency = generator.choice(["USD", "EUR", "GBP", None])
+        orders.append(
+            msgspec.convert(
+                {
+                    "uniqid": str(index),
+                    "total": generator.choice([None, round(generator.uniform(1, 100), 2)]),
+                    "currency": currency,
+                    "exchange_rate": generator.choice([None, 1.1]) if currency == "EUR" else None,
+                    "rates_snapshot": {"GBP": "0.8"},
+                    "fee_breakdown": {"service_fee": {"amount": generator.choice([0, 0.5])}},
+                    "gateway": generator.choice(["PAYPAL", "STRIPE", None]),
+                    "product_id": generator.choice(["p1", "p2", "p3", None]),
+                    "created_at": generator.choice([None, 1_700_000_000 + index * 40_000]),
+                },
+                AnalyticsRow,
+            )
+        )
+    return orders
+
+
+def _summary(revenue: t.List[t.Any], exact: bool = True) -> t.List[t.Tuple[t.Any, ...]]:
+    return [
+        (
+            row.key,
+            row.orders,
+            row.gross if exact else pytest.approx(row.gross),
+            row.fees if exact else pytest.approx(row.fees),
+        )
+        for row in revenue
+    ]
+
+
+def test_numpy_and_pure_python_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    revenue = RevenueAnalytics(_orders(500))
+    with_numpy = [revenue.total(), *(row for group in GROUPS for row in revenue.by(group))]
+
+    monkeypatch.setattr(analytics, "_numpy", lambda: None)
+    without_numpy = [revenue.total(), *(row for group in GROUPS for row in revenue.by(group))]
+
+    assert _summary(with_numpy) == _summary(without_numpy, exact=False)
+    days = [row.key for row in revenue.by("day")]
+    assert days[0] is None and days[1:] == sorted(days[1:])
+    assert all(isinstance(day, datetime.date) for day in days[1:])
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from sellix.client import SellixClientX
+from sellix.core.breaker import CircuitBreaker, CircuitBreakers
+from sellix.core.exceptions import CircuitOpenException, DeadlineExceeded
+from sellix.core.ratelimit import SlidingWindowLimiter
+from sellix.enums.genric import APIEndpoints, CircuitState
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_probes_and_closes() -> None:
+    clock = Clock()
+    breaker = CircuitBreaker("X", window=4, min_calls=4, open_for=5, clock=clock)
+    for failed in (False, True, False, True):
+        breaker.allow()
+        breaker.record(failed, 0.1)
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.allow()
+
+    clock.now = 5
+    breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.allow()  # One probe at a time.
+    breaker.record(False, 0.1)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_deadline_before_sending_is_not_a_successful_probe() -> None:
+    async def main() -> None:
+        breakers = CircuitBreakers(window=1, min_calls=1, open_for=0)
+        breaker = breakers.get(APIEndpoints.GET_ORDER)
+        breaker.allow()
+        breaker.record(True, 0.1)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        limiter = SlidingWindowLimiter(1, 60)
+        limiter.reserve()
+        client = SellixClientX("key", rate_limiter=limiter, circuit_breakers=breakers)
+        client.base_url = "http://127.0.0.1:9/v1"
+        async with client.deadline(0.5):
+            with pytest.raises(DeadlineExceeded):
+                await client.get_order("a")
+        assert breaker.state is CircuitState.HALF_OPEN
+        await client.close()
+
+    asyncio.run(main())
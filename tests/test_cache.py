@@ -0,0 +1,156 @@
+import asyncio
+import pathlib
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sellix.client import SellixClientX
+from sellix.core.cache import DiskCache, ResponseCache, ValidatorCache
+from sellix.core.metrics import Metrics
+from sellix.enums.genric import APIEndpoints
+
+
+def test_cache_hit_keeps_validators() -> None:
+    seen = []
+
+    async def order(request: web.Request) -> web.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response(
+            {"status": 200, "data": {"order": {"uniqid": "a"}}}, headers={"ETag": '"v1"'}
+        )
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders/{uniqid}", order)
+        async with TestServer(app) as server:
+            validators = ValidatorCache()
+            client = SellixClientX(
+                "key",
+                cache=ResponseCache(ttls={APIEndpoints.GET_ORDER: 0.1}),
+                validators=validators,
+            )
+            client.base_url = str(server.make_url("/v1"))
+
+            assert (await client.get_order("a")).uniqid == "a"
+            assert (await client.get_order("a")).uniqid == "a"  # Served by the cache.
+            assert len(validators) == 1
+
+            await asyncio.sleep(0.15)
+            assert (await client.get_order("a")).uniqid == "a"
+            assert seen == [None, '"v1"']
+            await client.close()
+
+    asyncio.run(main())
+
+
+def test_one_cache_outcome_per_lookup() -> None:
+    async def order(request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response(
+            {"status": 200, "data": {"order": {"uniqid": "a"}}}, headers={"ETag": '"v1"'}
+        )
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders/{uniqid}", order)
+        async with TestServer(app) as server:
+            metrics = Metrics()
+            client = SellixClientX(
+                "key",
+                cache=ResponseCache(ttls={APIEndpoints.GET_ORDER: 0.1}),
+                validators=ValidatorCache(),
+                instrumentation=metrics,
+            )
+            client.base_url = str(server.make_url("/v1"))
+            await client.get_order("a")
+            await client.get_order("a")
+            await asyncio.sleep(0.15)
+            await client.get_order("a")
+            assert metrics.cache == {
+                ("GET_ORDER", "miss"): 1,
+                ("GET_ORDER", "hit"): 1,
+                ("GET_ORDER", "revalidated"): 1,
+            }
+            await client.close()
+
+            # Without a response cache, the first lookup of the validators is a miss.
+            metrics = Metrics()
+            client = SellixClientX("key", validators=ValidatorCache(), instrumentation=metrics)
+            client.base_url = str(server.make_url("/v1"))
+            await client.get_order("a")
+            await client.get_order("a")
+            assert metrics.cache == {("GET_ORDER", "miss"): 1, ("GET_ORDER", "revalidated"): 1}
+            assert metrics.cache_hit_ratio() == 0.5
+            await client.close()
+
+    asyncio.run(main())
+
+
+def test_revalidated_response_is_cached_again() -> None:
+    seen = []
+
+    async def order(request: web.Request) -> web.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response(
+            {"status": 200, "data": {"order": {"uniqid": "a"}}}, headers={"ETag": '"v1"'}
+        )
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders/{uniqid}", order)
+        async with TestServer(app) as server:
+            client = SellixClientX(
+                "key",
+                cache=ResponseCache(ttls={APIEndpoints.GET_ORDER: 0.1}),
+                validators=ValidatorCache(),
+            )
+            client.base_url = str(server.make_url("/v1"))
+
+            await client.get_order("a")
+            await asyncio.sleep(0.15)
+            assert (await client.get_order("a")).uniqid == "a"  # Revalidated.
+            assert (await client.get_order("a")).uniqid == "a"  # Served by the cache.
+            assert seen == [None, '"v1"']
+            await client.close()
+
+    asyncio.run(main())
+
+
+def test_clients_of_other_accounts_do_not_share_responses() -> None:
+    async def order(request: web.Request) -> web.Response:
+        uniqid = request.headers["Authorization"].split()[-1]
+        return web.json_response({"status": 200, "data": {"order": {"uniqid": uniqid}}})
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders/{uniqid}", order)
+        async with TestServer(app) as server:
+            cache = ResponseCache(ttls={APIEndpoints.GET_ORDER: 60})
+            validators = ValidatorCache()
+            clients = [SellixClientX(key, cache=cache, validators=validators) for key in "ab"]
+            for client in clients:
+                client.base_url = str(server.make_url("/v1"))
+            assert [(await client.get_order("x")).uniqid for client in clients] == ["a", "b"]
+            for client in clients:
+                await client.close()
+
+    asyncio.run(main())
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path: pathlib.Path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.set("key", b"body", 60)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(path.read_bytes()[:6])
+    assert cache.get("key") is None
+    assert not path.exists()
+
+    cache.set("key", b"body", 60)
+    path.write_bytes(path.read_bytes()[:14])  # The header, but only part of the key.
+    assert cache.get("key") is None
+    assert not path.exists()
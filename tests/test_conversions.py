@@ -0,0 +1,47 @@
+import asyncio
+import typing as t
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sellix.client import SellixClientX
+from sellix.core.conversions import ConversionTable
+from sellix.enums.caller import Currency
+
+PRODUCTS: t.List[t.Dict[str, t.Any]] = [
+    {
+        "uniqid": "a",
+        "price": 10.0,
+        "price_conversions": {"EUR": 9.0, "crypto": {"BTC": "0.0002"}},
+        "product_variants": [
+            {"title": "Large", "price": 20.0, "price_conversions": {"EUR": 18.0}}
+        ],
+    },
+    {"uniqid": "b", "price": 5.0, "price_conversions": {"EUR": 4.5, "USD": 5.0}},
+    {"uniqid": "c", "price": 1.0, "price_conversions": None},
+]
+
+
+def test_table_from_a_paginated_product_listing() -> None:
+    async def product_list(request: web.Request) -> web.Response:
+        page = int(request.query["page"])
+        products = PRODUCTS[(page - 1) * 2 : page * 2]
+        return web.json_response({"status": 200, "data": {"products": products}})
+
+    async def main() -> t.List[t.Dict[str, t.Any]]:
+        app = web.Application()
+        app.router.add_get("/v1/products", product_list)
+        async with TestServer(app) as server:
+            client = SellixClientX("key")
+            client.base_url = str(server.make_url("/v1"))
+            products = [product async for product in client.iter_products()]
+            await client.close()
+        return products
+
+    table = ConversionTable.from_products(asyncio.run(main()))
+    assert table.keys == ["a", ("a", "Large"), "b", "c"]
+    assert table.get("a", Currency.EURO) == 9.0
+    assert table.get(("a", "Large"), "EUR") == 18.0
+    assert table.get("a", "BTC") == 0.0002
+    assert table.get("c", "EUR") is None
+    assert table.rate(Currency.EURO) == 0.9
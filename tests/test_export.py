@@ -0,0 +1,48 @@
+import asyncio
+import csv
+import pathlib
+import typing as t
+
+import msgspec
+import pytest
+
+from sellix.core.export import COLUMNS, CSVSink, OrderRow, ParquetSink, export_orders
+
+ROWS = [
+    ("a", 9.5, 1, 2, "PAYPAL", "USD", "COMPLETED"),
+    ("b", None, 2, None, None, "EUR", "PENDING"),
+    ("c", 3.0, None, 1, "PAYPAL", None, None),
+]
+ORDERS = [dict(zip(COLUMNS, row)) for row in ROWS]
+
+
+async def _orders() -> t.AsyncIterator[t.Any]:
+    for order in ORDERS:
+        yield msgspec.convert(order, OrderRow)
+
+
+def _export(sink: t.Any) -> int:
+    with sink:
+        return asyncio.run(export_orders(_orders(), sink, batch_size=2))
+
+
+def test_csv_export_keeps_nulls_empty(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "orders.csv"
+    assert _export(CSVSink(str(path))) == 3
+    with open(path, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == list(COLUMNS)
+    assert rows[1:] == [
+        ["a", "9.5", "1", "2", "PAYPAL", "USD", "COMPLETED"],
+        ["b", "", "2", "", "", "EUR", "PENDING"],
+        ["c", "3.0", "", "1", "PAYPAL", "", ""],
+    ]
+
+
+def test_parquet_export_keeps_nulls(tmp_path: pathlib.Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "orders.parquet"
+    assert _export(ParquetSink(str(path))) == 3
+    table = parquet.read_table(path)
+    assert table.num_rows == 3
+    assert table.to_pylist() == ORDERS
@@ -0,0 +1,40 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sellix.client import SellixClientX
+from sellix.core.hedging import HedgePolicy
+from sellix.enums.genric import APIEndpoints
+
+
+def test_cancelled_loser_latency_is_recorded() -> None:
+    calls = 0
+
+    async def order(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return web.json_response({"status": 200, "data": {"order": {"uniqid": "a"}}})
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders/{uniqid}", order)
+        async with TestServer(app) as server:
+            hedging = HedgePolicy(min_delay=0.1, min_samples=1)
+            hedging.record(APIEndpoints.GET_ORDER, 0.1)
+            client = SellixClientX("key", hedging=hedging)
+            client.base_url = str(server.make_url("/v1"))
+
+            assert (await client.get_order("a")).uniqid == "a"
+            await asyncio.sleep(0)
+            assert (hedging.hedged, hedging.wins) == (1, 1)
+            # The slow request, not the fast hedge, was recorded.
+            tracker = hedging._trackers[APIEndpoints.GET_ORDER]
+            assert len(tracker) == 2
+            assert tracker.percentile(0) >= 0.1
+            assert hedging.delay(APIEndpoints.GET_ORDER) >= 0.1
+            await client.close()
+
+    asyncio.run(main())
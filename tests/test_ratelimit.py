@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from sellix.client import SellixClientX
+from sellix.core.ratelimit import RateLimitInfo, SlidingWindowLimiter, TokenBucket
+from sellix.pool import SellixClientPool
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sliding_window_books_slots_per_period() -> None:
+    clock = Clock()
+    limiter = SlidingWindowLimiter(2, 10, clock)
+    assert [limiter.reserve() for _ in range(5)] == [0, 0, 10, 10, 20]
+    clock.now = 25
+    assert limiter.remaining == 1
+
+
+def test_timed_out_acquires_free_their_slots() -> None:
+    clock = Clock()
+    limiter = SlidingWindowLimiter(5, 10, clock)
+
+    async def main() -> None:
+        for _ in range(5):
+            assert await limiter.acquire() == 0
+        for _ in range(20):
+            with pytest.raises(asyncio.TimeoutError):
+                await limiter.acquire(timeout=1)
+
+    asyncio.run(main())
+    clock.now = 10
+    assert limiter.remaining == 5
+    assert limiter.reserve() == 0
+
+
+def test_cancelled_acquire_frees_its_slot() -> None:
+    limiter = SlidingWindowLimiter(1, 0.2)
+
+    async def main() -> None:
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        # The next caller takes the slot of the cancelled waiter instead of the one after it.
+        assert limiter.reserve() == pytest.approx(0.15, abs=0.03)
+
+    asyncio.run(main())
+
+
+def test_refund_returns_latest_future_slots() -> None:
+    clock = Clock()
+    limiter = SlidingWindowLimiter(1, 10, clock)
+    limiter.reserve()
+    assert limiter.reserve() == 10
+    limiter.refund()
+    limiter.refund()  # The first slot already started and is not given back.
+    assert limiter.reserve() == 10
+
+
+def test_try_acquire_never_waits() -> None:
+    clock = Clock()
+    limiter = SlidingWindowLimiter(2, 10, clock)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    clock.now = 10
+    assert limiter.try_acquire(2)
+
+    bucket = TokenBucket(2, 10, clock)
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.tokens == 0
+
+
+def test_remaining_reported_by_the_api_caps_free_slots() -> None:
+    clock = Clock()
+    limiter = SlidingWindowLimiter(5, 10, clock)
+    limiter.reserve()
+    limiter.update(RateLimitInfo(limit=5, remaining=1))
+    assert limiter.remaining == 1
+    assert [limiter.reserve() for _ in range(2)] == [0, 10]
+    limiter.update(RateLimitInfo(limit=5, remaining=3))  # Never frees slots.
+    assert limiter.remaining == 0
+    clock.now = 10
+    assert limiter.remaining == 4  # The slot booked at 10 is still taken.
+
+    bucket = TokenBucket(5, 10, clock)
+    bucket.update(RateLimitInfo(limit=5, remaining=1))
+    assert bucket.tokens == 1
+
+
+def test_client_rate_limiting_is_opt_in() -> None:
+    assert SellixClientX("key").rate_limiter is None
+    assert SellixClientX("key", enable_auto_rate_limit_handler=True).rate_limiter is not None
+    assert SellixClientPool("key").add_merchant("a").rate_limiter is not None
+
+    with pytest.warns(DeprecationWarning):
+        SellixClientX("key", ratelimits_by_tasks=True)
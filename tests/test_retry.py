@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from sellix.client import SellixClientX
+from sellix.core.errors import SellixError
+from sellix.core.exceptions import HTTPException
+from sellix.core.retry import RetryBudget, RetryPolicy
+from sellix.pool import SellixClientPool
+
+
+def test_default_policies_have_a_budget() -> None:
+    assert SellixClientX("key").retry_policy.budget is not None
+
+    pool = SellixClientPool("key")
+    first, second = pool.add_merchant("a"), pool.add_merchant("b")
+    assert pool.retry_policy.budget is not None
+    assert first.retry_policy is second.retry_policy is pool.retry_policy
+
+
+def test_budget_caps_retries() -> None:
+    async def main() -> int:
+        attempts = 0
+
+        async def attempt() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise HTTPException(SellixError.SERVICE_UNAVAILABLE, 503)
+
+        async def sleep(delay: float) -> None:
+            pass
+
+        budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=2)
+        policy = RetryPolicy(max_attempts=4, budget=budget)
+        for _ in range(3):
+            with pytest.raises(HTTPException):
+                await policy.call("GET", attempt, sleep)
+        return attempts
+
+    # Two retries in the budget: 3 first attempts plus 2 retries.
+    assert asyncio.run(main()) == 5
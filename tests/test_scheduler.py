@@ -0,0 +1,30 @@
+import asyncio
+import typing as t
+
+from sellix.core.scheduler import FairScheduler
+
+
+def test_slots_are_shared_by_weight() -> None:
+    async def main() -> t.List[str]:
+        scheduler = FairScheduler(1)
+        scheduler.register("a", weight=2)
+        scheduler.register("b", weight=1)
+        order: t.List[str] = []
+
+        async def request(key: str) -> None:
+            await scheduler.acquire(key)
+            order.append(key)
+            await asyncio.sleep(0)
+            scheduler.release()
+
+        await scheduler.acquire("a")  # Saturates the scheduler, so the others queue up.
+        tasks = [asyncio.ensure_future(request("a")) for _ in range(6)]
+        tasks += [asyncio.ensure_future(request("b")) for _ in range(3)]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        assert scheduler.active == 0
+        return order
+
+    # "a" has the larger backlog, yet only takes two slots for every one of "b".
+    assert asyncio.run(main()) == list("aabaabaab")
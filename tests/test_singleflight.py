@@ -0,0 +1,74 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import pytest
+
+from sellix.client import SellixClientX
+from sellix.core.exceptions import DeadlineExceeded
+from sellix.core.singleflight import SingleFlight
+
+
+def test_callers_share_one_call() -> None:
+    async def main() -> None:
+        calls = []
+
+        async def call() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        flight = SingleFlight()
+        assert await asyncio.gather(*(flight.do("k", call) for _ in range(3))) == [42] * 3
+        assert len(calls) == 1 and len(flight) == 0
+
+    asyncio.run(main())
+
+
+def test_call_is_cancelled_once_every_caller_left() -> None:
+    async def main() -> None:
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def call() -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(asyncio.TimeoutError):
+            await flight.do("k", call, timeout=0.01)
+        await asyncio.sleep(0)
+        assert started.is_set() and cancelled.is_set()
+
+    asyncio.run(main())
+
+
+def test_deadline_of_one_caller_does_not_apply_to_the_others() -> None:
+    async def order(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.3)
+        return web.json_response({"status": 200, "data": {"order": {"uniqid": "a"}}})
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders/{uniqid}", order)
+        async with TestServer(app) as server:
+            client = SellixClientX("key")
+            client.base_url = str(server.make_url("/v1"))
+
+            async def hurried() -> None:
+                async with client.deadline(0.1):
+                    await client.get_order("a")
+
+            results = await asyncio.gather(
+                hurried(), client.get_order("a"), return_exceptions=True
+            )
+            assert isinstance(results[0], DeadlineExceeded)
+            assert results[1].uniqid == "a"
+            await client.close()
+
+    asyncio.run(main())
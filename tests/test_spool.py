@@ -0,0 +1,30 @@
+import asyncio
+import os
+import pathlib
+
+from sellix.core.spool import Spool
+
+
+def test_torn_tail_is_cut_off_on_open(tmp_path: pathlib.Path) -> None:
+    async def write() -> int:
+        spool = Spool(tmp_path, fsync_interval=0)
+        await spool.append("order:paid", b'{"a":1}')
+        end = spool.end
+        await spool.append("order:paid", b'{"b":2}')
+        await spool.close()
+        return end
+
+    async def reopen() -> None:
+        spool = Spool(tmp_path, fsync_interval=0)
+        assert spool.end == end
+        assert [record.body for record in spool.read(0)] == [b'{"a":1}']
+        # The next append lands where the torn record started.
+        assert await spool.append("order:paid", b'{"c":3}') == end
+        assert [record.body for record in spool.read(0)] == [b'{"a":1}', b'{"c":3}']
+        await spool.close()
+
+    end = asyncio.run(write())
+    (segment,) = tmp_path.glob("*.spool")
+    os.truncate(segment, segment.stat().st_size - 3)  # A crash in the middle of a write.
+    asyncio.run(reopen())
+    assert segment.stat().st_size == 2 * end
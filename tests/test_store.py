@@ -0,0 +1,34 @@
+import pathlib
+
+import pytest
+
+from sellix.abc.modals import Order
+from sellix.core.store import SQLiteOrderStore
+
+
+def test_sqlite_upsert_and_find(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "orders.db"
+    store = SQLiteOrderStore(path)
+    assert store.upsert(
+        [
+            Order(uniqid="a", customer_email="x@example.com", status="PENDING", updated_at=1),
+            Order(uniqid="b", customer_email="x@example.com", status="PENDING", updated_at=2),
+            Order(uniqid="c", customer_email="y@example.com", updated_at=3),
+        ]
+    ) == 3
+    # An older version of an order never replaces a newer one.
+    store.upsert([Order(uniqid="b", customer_email="x@example.com", updated_at=1)])
+    store.upsert([Order(uniqid="a", customer_email="x@example.com", status="PAID", updated_at=4)])
+    store.watermark = 4
+    store.commit()
+    store.close()
+
+    store = SQLiteOrderStore(path)
+    assert len(store) == 3 and store.watermark == 4
+    found = store.find("customer_email", "x@example.com")
+    assert [(order.uniqid, order.status) for order in found] == [("a", "PAID"), ("b", "PENDING")]
+    assert store.get("c").customer_email == "y@example.com"  # type: ignore
+    assert store.find("customer_email", "z@example.com") == []
+    with pytest.raises(ValueError):
+        store.find("status", "PAID")
+    store.close()
@@ -0,0 +1,80 @@
+import asyncio
+import typing as t
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sellix.client import SellixClientX
+from sellix.core.store import MemoryOrderStore
+from sellix.sync import OrderSync
+
+
+def test_change_to_an_older_order_is_synced() -> None:
+    orders: t.List[t.Dict[str, t.Any]] = [
+        {"uniqid": str(n), "status": "PENDING", "created_at": n * 1000, "updated_at": n * 1000}
+        for n in range(1, 6)
+    ]
+
+    async def order_list(request: web.Request) -> web.Response:
+        field = "updated_at" if request.query.get("sort") == "updated_at" else "created_at"
+        page = sorted(orders, key=lambda order: order[field], reverse=True)
+        if request.query["page"] != "1":
+            page = []
+        return web.json_response({"status": 200, "data": {"orders": page}})
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders", order_list)
+        async with TestServer(app) as server:
+            client = SellixClientX("key", enable_auto_rate_limit_handler=False)
+            client.base_url = str(server.make_url("/v1"))
+
+            # Sorted by creation, the changed order is below the ones an early stop reads.
+            store = MemoryOrderStore()
+            sync = OrderSync(client, store, lookback=0, stop_after=2)
+            await sync.run()
+            orders[0].update(status="COMPLETED", updated_at=9000)
+            result = await sync.run()
+            assert result.full and (result.scanned, result.written) == (5, 1)
+            assert store.get("1").status == "COMPLETED"  # type: ignore
+
+            # Sorted by update, an incremental run finds it first and stops early.
+            store = MemoryOrderStore()
+            sync = OrderSync(
+                client, store, {"sort": "updated_at"}, updated_first=True, lookback=0, stop_after=2
+            )
+            await sync.run()
+            orders[1].update(status="COMPLETED", updated_at=9500)
+            result = await sync.run()
+            assert not result.full and result.scanned == 3
+            assert store.get("2").status == "COMPLETED"  # type: ignore
+            await client.close()
+
+    asyncio.run(main())
+
+
+def test_unchanged_orders_are_not_written_again() -> None:
+    orders = [
+        {"uniqid": str(n), "status": "PENDING", "created_at": n * 1000, "updated_at": n * 1000}
+        for n in range(1, 6)
+    ]
+
+    async def order_list(request: web.Request) -> web.Response:
+        page = orders if request.query["page"] == "1" else []
+        return web.json_response({"status": 200, "data": {"orders": page}})
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/orders", order_list)
+        async with TestServer(app) as server:
+            client = SellixClientX("key", enable_auto_rate_limit_handler=False)
+            client.base_url = str(server.make_url("/v1"))
+
+            store = MemoryOrderStore()
+            sync = OrderSync(client, store, lookback=0)
+            assert (await sync.run()).written == 5
+            result = await sync.run(full=True)
+            assert result.full and (result.scanned, result.written) == (5, 0)
+            await client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import asyncio
+import pathlib
+
+import msgspec
+from aiohttp.test_utils import TestClient, TestServer
+
+from sellix.core.dedup import DedupIndex
+from sellix.core.spool import Spool
+from sellix.webhooks import EVENT_HEADER, SIGNATURE_HEADER, WebhookReceiver, sign
+
+SECRET = "secret"
+
+
+def _body(uniqid: str) -> bytes:
+    return msgspec.json.encode(
+        {"event": "order:paid", "data": {"uniqid": uniqid, "updated_at": 1}}
+    )
+
+
+async def _post(client: TestClient, uniqid: str) -> int:
+    body = _body(uniqid)
+    response = await client.post(
+        "/webhook",
+        data=body,
+        headers={SIGNATURE_HEADER: sign(SECRET, body), EVENT_HEADER: "order:paid"},
+    )
+    return response.status
+
+
+def test_redelivery_of_rejected_webhook_is_handled() -> None:
+    async def main() -> None:
+        release = asyncio.Event()
+        handled = []
+        receiver = WebhookReceiver(
+            SECRET, concurrency=1, queue_size=1, enqueue_timeout=0.05, dedup=DedupIndex()
+        )
+
+        @receiver.on()
+        async def handler(event, payload) -> None:
+            await release.wait()
+            handled.append(payload.data.uniqid)
+
+        async with TestClient(TestServer(receiver.app())) as client:
+            assert await _post(client, "a") == 200
+            await asyncio.sleep(0.01)  # The worker takes "a" and blocks.
+            assert await _post(client, "b") == 200
+            assert await _post(client, "c") == 503
+
+            release.set()
+            await asyncio.sleep(0.01)
+            assert await _post(client, "c") == 200
+            assert await _post(client, "c") == 200  # An actual duplicate is still dropped.
+            await receiver.close()
+
+        assert handled == ["a", "b", "c"]
+
+    asyncio.run(main())
+
+
+def test_spooled_backlog_is_read_in_batches(tmp_path: pathlib.Path) -> None:
+    async def main() -> None:
+        spool = Spool(tmp_path, fsync_interval=0)
+        for uniqid in "abcde":
+            await spool.append("order:paid", _body(uniqid))
+        assert [len(spool.read_batch(0, 1)) for _ in range(2)] == [1, 1]
+        assert len(spool.read_batch(0)) == 5
+
+        handled = []
+        receiver = WebhookReceiver(SECRET, concurrency=1, spool=spool)
+
+        @receiver.on()
+        async def handler(event, payload) -> None:
+            handled.append(payload.data.uniqid)
+
+        async with TestClient(TestServer(receiver.app())) as client:
+            assert await _post(client, "f") == 200
+            for _ in range(100):
+                if len(handled) == 6:
+                    break
+                await asyncio.sleep(0.01)
+            await receiver.close()
+        assert handled == list("abcdef")
+        assert await receiver.replay(end=spool.read_batch(0)[2].offset) == 2
+        assert handled[6:] == ["a", "b"]
+        await spool.close()
+
+    asyncio.run(main())